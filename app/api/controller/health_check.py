@@ -1,20 +1,66 @@
 # app/api/controller/health_check.py
-from fastapi import APIRouter, Request
-from platform_common.logging.logging import get_logger, set_request_context
+from typing import Any
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
+
+from app.api.controller.profiling import require_debug_token
+from app.db.session import pool_stats
+from app.pubsub.project_workspace_job_subscriber import (
+    conversation_context_cache,
+    llm_rate_limiter,
+    llm_response_cache,
+    provider_router,
+)
+from app.pubsub.project_workspace_stream_subscriber import conversation_stream_hub
+from app.services.health_service import readiness_probe
+from app.services.permission_service import permission_cache_stats
+from app.services.project_cache import project_cache
 
 router = APIRouter()
-logger = get_logger("health")
+# Internal stats are readable with the same token as /admin/profiles.
+diagnostics = [Depends(require_debug_token)]
 
 
 @router.get("/")
-async def health_check(request: Request):
-    # Optional: bind request-specific info
-    set_request_context(
-        request_id=str(request.headers.get("x-request-id", "unknown")),
-        user_id="test-user",
-        session_id="abc123",
-    )
+@router.get("/live")
+async def liveness() -> dict[str, str]:
+    # The process is serving requests; dependencies are /ready's concern.
+    return {"status": "ok"}
 
-    logger.info("Health check successful!", path=request.url.path)
 
-    return {"status": "ok"}
+@router.get("/ready")
+async def readiness(request: Request) -> JSONResponse:
+    result = await readiness_probe.check(request.app)
+    status_code = 200 if result["status"] == "ready" else 503
+    return JSONResponse(result, status_code=status_code)
+
+
+@router.get("/caches", dependencies=diagnostics)
+async def cache_stats() -> dict[str, Any]:
+    return {
+        "permission_cache": permission_cache_stats(),
+        "project_cache": project_cache.stats(),
+        "llm_context_cache": conversation_context_cache.stats(),
+        "llm_response_cache": (
+            llm_response_cache.stats() if llm_response_cache else None
+        ),
+    }
+
+
+@router.get("/jobs", dependencies=diagnostics)
+async def job_stats(request: Request) -> dict[str, Any]:
+    pool = getattr(request.app.state, "project_workspace_job_pool", None)
+    relay = getattr(request.app.state, "outbox_relay", None)
+    return {
+        "project_workspace_jobs": pool.stats() if pool else None,
+        "llm_providers": provider_router.stats(),
+        "llm_rate_limits": llm_rate_limiter.stats(),
+        "outbox_relay": relay.stats() if relay else None,
+        "sse_streams": conversation_stream_hub.stats(),
+    }
+
+
+@router.get("/db", dependencies=diagnostics)
+async def db_stats() -> dict[str, Any]:
+    return {"db_pool": pool_stats()}
@@ -0,0 +1,35 @@
+# app/api/controller/profiling.py
+from typing import Any
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from platform_common.errors.base import AuthError, NotFoundError
+
+from app.core.profiling import DEBUG_HEADER, is_debug_token, profile_store
+
+router = APIRouter()
+
+
+def require_debug_token(request: Request) -> None:
+    if not is_debug_token(request.headers.get(DEBUG_HEADER)):
+        raise AuthError("A valid X-Debug-Token header is required")
+
+
+@router.get("")
+async def list_profiles(request: Request) -> dict[str, Any]:
+    require_debug_token(request)
+    return {"profiles": [profile.summary() for profile in profile_store.list()]}
+
+
+# The folded format is plain text, so no response model is derived.
+@router.get("/{profile_id}", response_model=None)
+async def get_profile(
+    request: Request, profile_id: str, format: str = "json"
+) -> dict[str, Any] | PlainTextResponse:
+    require_debug_token(request)
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise NotFoundError(message="Profile not found", code="PROFILE_NOT_FOUND")
+    if format == "folded":
+        return PlainTextResponse(profile.folded())
+    return profile.to_dict()
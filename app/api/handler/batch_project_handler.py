@@ -0,0 +1,379 @@
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Depends
+from pydantic import ValidationError
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+from app.api.interface.abstract_handler import AbstractHandler
+from platform_common.logging.logging import get_logger
+from platform_common.models.project import Project
+from platform_common.db.dependencies.get_dal import get_dal
+from platform_common.errors.base import BadRequestError, AuthError
+from platform_common.auth.permissions import (
+    ORG_CREATE_PROJECT,
+    PROJECT_EDIT,
+    RESOURCE_TYPE_PROJECT,
+)
+from platform_common.auth.guards import require_org_perm_by_id
+
+from app.core.config import settings
+from app.core.metrics import timed_dal
+from app.core.responses import ServiceJSONResponse, service_response
+from app.db.dal.project_query_dal import (
+    OWNERSHIP_PROJECT_FIELDS,
+    ProjectQueryDAL,
+    next_updated_at,
+    updatable_fields,
+)
+from app.services.permission_service import can_many, invalidate_resource
+from app.services.project_cache import project_cache
+
+logger = get_logger("batch_project_handler")
+
+
+def _ok(index: int, project_id: str, data: Any = None) -> dict[str, Any]:
+    return {"index": index, "project_id": project_id, "success": True, "data": data}
+
+
+def _failed(
+    index: int, project_id: str | None, code: str, message: str
+) -> dict[str, Any]:
+    return {
+        "index": index,
+        "project_id": project_id,
+        "success": False,
+        "error": {"code": code, "message": message},
+    }
+
+
+class BatchProjectHandler(AbstractHandler):
+    """
+    Handler for creating, updating and deleting many projects in one request.
+
+    Every item is validated and reported individually; the valid ones are
+    written in a single transaction. An item the database rejects (a unique or
+    check constraint) is reported as WRITE_FAILED without failing the others.
+    """
+
+    def __init__(
+        self, project_dal: ProjectQueryDAL = Depends(get_dal(ProjectQueryDAL))
+    ):
+        super().__init__()
+        self.project_dal = timed_dal(project_dal)
+
+    async def do_process(self, request: Request) -> ServiceJSONResponse:
+        user_id = getattr(request.state, "user_id", None)
+        if not user_id:
+            raise AuthError("Not authenticated")
+
+        payload = await request.json()
+        if not isinstance(payload, dict):
+            raise BadRequestError(
+                message="Invalid batch payload", code="INVALID_PAYLOAD"
+            )
+
+        creates = payload.get("create") or []
+        updates = payload.get("update") or []
+        deletes = payload.get("delete") or []
+        if not all(isinstance(items, list) for items in (creates, updates, deletes)):
+            raise BadRequestError(
+                message="create, update and delete must be lists",
+                code="INVALID_PAYLOAD",
+            )
+
+        total = len(creates) + len(updates) + len(deletes)
+        if total == 0:
+            raise BadRequestError(message="Batch is empty", code="EMPTY_BATCH")
+        if total > settings.PROJECT_BATCH_MAX_ITEMS:
+            raise BadRequestError(
+                message=f"Batch exceeds {settings.PROJECT_BATCH_MAX_ITEMS} items",
+                code="BATCH_TOO_LARGE",
+            )
+
+        create_results, new_projects = await self._prepare_creates(user_id, creates)
+        update_results, delete_results, update_rows, delete_ids = (
+            await self._prepare_changes(request, user_id, updates, deletes)
+        )
+
+        try:
+            failed_creates = await self._write(
+                new_projects, self.project_dal.insert_many
+            )
+            failed_updates = await self._write(
+                update_rows, self.project_dal.update_many
+            )
+            failed_deletes = await self._write(delete_ids, self.project_dal.delete_many)
+            await self.project_dal.session.commit()
+        except SQLAlchemyError:
+            await self.project_dal.session.rollback()
+            raise
+
+        for results, failed in (
+            (create_results, failed_creates),
+            (update_results, failed_updates),
+            (delete_results, failed_deletes),
+        ):
+            for index in failed:
+                results[index] = _failed(
+                    index,
+                    results[index]["project_id"],
+                    "WRITE_FAILED",
+                    "Project could not be saved",
+                )
+
+        changed_ids = [
+            row["id"] for index, row in update_rows if index not in failed_updates
+        ] + [
+            project_id
+            for index, project_id in delete_ids
+            if index not in failed_deletes
+        ]
+        for project_id in changed_ids:
+            invalidate_resource(project_id)
+            await project_cache.invalidate(project_id)
+
+        logger.info(
+            f"Project batch applied: "
+            f"created={len(new_projects) - len(failed_creates)} "
+            f"updated={len(update_rows) - len(failed_updates)} "
+            f"deleted={len(delete_ids) - len(failed_deletes)}"
+        )
+        return service_response(
+            message="Project batch processed",
+            status_code=200,
+            data={
+                "create": create_results,
+                "update": update_results,
+                "delete": delete_results,
+            },
+        )
+
+    async def _write(
+        self,
+        entries: list[tuple[int, Any]],
+        write_many: Callable[[list[Any]], Awaitable[Any]],
+    ) -> set[int]:
+        """
+        Write the entries with one statement inside a savepoint. If the database
+        rejects it, retry them one savepoint per item so that only the offending
+        items fail. Returns the batch indexes of the items that were not written.
+        """
+        if not entries:
+            return set()
+        session = self.project_dal.session
+        try:
+            async with session.begin_nested():
+                await write_many([item for _, item in entries])
+            return set()
+        except (IntegrityError, DataError) as e:
+            logger.warning(f"Batch write rejected, retrying item by item: {e}")
+
+        failed: set[int] = set()
+        for index, item in entries:
+            try:
+                async with session.begin_nested():
+                    await write_many([item])
+            except (IntegrityError, DataError) as e:
+                logger.error(f"Error writing batch item {index}: {e}")
+                failed.add(index)
+        return failed
+
+    async def _prepare_creates(
+        self, user_id: str, items: list[Any]
+    ) -> tuple[list[dict[str, Any]], list[tuple[int, Project]]]:
+        results: list[dict[str, Any]] = []
+        candidates: list[tuple[int, Project]] = []
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(
+                    _failed(index, None, "INVALID_PAYLOAD", "Invalid project data")
+                )
+                continue
+            owner_type = str(item.get("owner_type", "user")).lower()
+            if owner_type == "organization":
+                owner_type = "org"
+            if owner_type not in {"user", "org"}:
+                results.append(
+                    _failed(
+                        index,
+                        None,
+                        "INVALID_OWNER_TYPE",
+                        "owner_type must be either 'user' or 'org'",
+                    )
+                )
+                continue
+            if owner_type == "org" and not item.get("organization_id"):
+                results.append(
+                    _failed(
+                        index,
+                        None,
+                        "ORGANIZATION_ID_REQUIRED",
+                        "organization_id is required when owner_type is 'org'",
+                    )
+                )
+                continue
+
+            data = {**item, "owner_id": user_id, "owner_type": owner_type}
+            if owner_type == "user":
+                data["organization_id"] = None
+            try:
+                candidates.append((index, Project(**data)))
+            except (TypeError, ValidationError) as e:
+                logger.error(f"Error validating batch project {index}: {e}")
+                results.append(
+                    _failed(index, None, "INVALID_PAYLOAD", "Invalid project data")
+                )
+
+        # One org permission check per distinct organization, not per project.
+        denied: dict[str, dict[str, str]] = {}
+        for organization_id in {
+            p.organization_id for _, p in candidates if p.organization_id
+        }:
+            try:
+                await require_org_perm_by_id(
+                    session=self.project_dal.session,
+                    user_id=user_id,
+                    organization_id=organization_id,
+                    perm_bit=ORG_CREATE_PROJECT,
+                )
+            except SQLAlchemyError:
+                raise
+            except Exception as e:
+                denied[organization_id] = {
+                    "code": getattr(e, "code", None) or "FORBIDDEN",
+                    "message": getattr(e, "message", None) or str(e),
+                }
+
+        projects: list[tuple[int, Project]] = []
+        for index, project in candidates:
+            error = denied.get(project.organization_id or "")
+            if error:
+                results.append(_failed(index, None, error["code"], error["message"]))
+                continue
+            projects.append((index, project))
+            results.append(_ok(index, project.id, project.model_dump(mode="json")))
+
+        results.sort(key=lambda result: result["index"])
+        return results, projects
+
+    async def _prepare_changes(
+        self,
+        request: Request,
+        user_id: str,
+        updates: list[Any],
+        deletes: list[Any],
+    ) -> tuple[
+        list[dict[str, Any]],
+        list[dict[str, Any]],
+        list[tuple[int, dict[str, Any]]],
+        list[tuple[int, str]],
+    ]:
+        update_ids = [str(item.get("id")) for item in updates if isinstance(item, dict)]
+        delete_ids = [str(project_id) for project_id in deletes]
+
+        # One SELECT and one bulk permission pass for every referenced project.
+        projects = {
+            str(project.id): project
+            for project in await self.project_dal.get_many(
+                list(dict.fromkeys(update_ids + delete_ids))
+            )
+        }
+        allowed = await can_many(
+            session=self.project_dal.session,
+            user_id=user_id,
+            perm_bit=PROJECT_EDIT,
+            resource_type=RESOURCE_TYPE_PROJECT,
+            resource_objs=projects.values(),
+            request=request,
+        )
+
+        def check(index: int, project_id: str, seen: set[str]) -> dict[str, Any] | None:
+            if project_id in seen:
+                return _failed(
+                    index, project_id, "DUPLICATE_ITEM", "Project repeated in batch"
+                )
+            seen.add(project_id)
+            if project_id not in projects:
+                return _failed(
+                    index, project_id, "PROJECT_NOT_FOUND", "Project not found"
+                )
+            if not allowed.get(project_id):
+                return _failed(
+                    index, project_id, "FORBIDDEN", "Not allowed to edit project"
+                )
+            return None
+
+        delete_results: list[dict[str, Any]] = []
+        accepted_deletes: list[tuple[int, str]] = []
+        seen: set[str] = set()
+        for index, project_id in enumerate(delete_ids):
+            error = check(index, project_id, seen)
+            if error:
+                delete_results.append(error)
+                continue
+            accepted_deletes.append((index, project_id))
+            delete_results.append(_ok(index, project_id))
+
+        update_results: list[dict[str, Any]] = []
+        rows: list[tuple[int, dict[str, Any]]] = []
+        deleted_ids = {project_id for _, project_id in accepted_deletes}
+        seen = set()
+        for index, item in enumerate(updates):
+            if not isinstance(item, dict) or not item.get("id"):
+                update_results.append(
+                    _failed(index, None, "PROJECT_ID_REQUIRED", "id is required")
+                )
+                continue
+            project_id = str(item["id"])
+            error = check(index, project_id, seen)
+            if error:
+                update_results.append(error)
+                continue
+            if project_id in deleted_ids:
+                update_results.append(
+                    _failed(
+                        index,
+                        project_id,
+                        "CONFLICTING_OPERATION",
+                        "Project is also being deleted in this batch",
+                    )
+                )
+                continue
+            if OWNERSHIP_PROJECT_FIELDS.intersection(item):
+                # Ownership moves need the org checks of the single update.
+                update_results.append(
+                    _failed(
+                        index,
+                        project_id,
+                        "OWNERSHIP_CHANGE_NOT_ALLOWED",
+                        "owner_id, owner_type and organization_id cannot be "
+                        "changed in a batch",
+                    )
+                )
+                continue
+            changes = updatable_fields(item)
+            if not changes:
+                update_results.append(
+                    _failed(index, project_id, "NO_UPDATE_DATA", "Missing update data")
+                )
+                continue
+
+            project = projects[project_id]
+            try:
+                updated = Project.model_validate({**project.model_dump(), **changes})
+            except ValidationError as e:
+                logger.error(f"Error validating batch update {index}: {e}")
+                update_results.append(
+                    _failed(
+                        index, project_id, "INVALID_PAYLOAD", "Invalid project data"
+                    )
+                )
+                continue
+            updated.updated_at = next_updated_at(project)
+            row = {key: getattr(updated, key) for key in [*changes, "updated_at"]}
+            rows.append((index, {"id": project_id, **row}))
+            update_results.append(
+                _ok(index, project_id, updated.model_dump(mode="json"))
+            )
+
+        return update_results, delete_results, rows, accepted_deletes
@@ -2,7 +2,8 @@ from fastapi import Request, Depends
 from pydantic import ValidationError
 from platform_common.db.dal.project_dal import ProjectDAL
 from app.api.interface.abstract_handler import AbstractHandler
-from platform_common.utils.service_response import ServiceResponse
+from app.core.metrics import timed_dal
+from app.core.responses import ServiceJSONResponse, service_response
 from platform_common.logging.logging import get_logger
 from platform_common.models.project import Project
 from platform_common.db.dependencies.get_dal import get_dal
@@ -23,9 +24,9 @@ class CreateProjectHandler(AbstractHandler):
         project_dal: ProjectDAL = Depends(get_dal(ProjectDAL)),
     ):
         super().__init__()
-        self.project_dal = project_dal
+        self.project_dal = timed_dal(project_dal)
 
-    async def do_process(self, request: Request) -> ServiceResponse:
+    async def do_process(self, request: Request) -> ServiceJSONResponse:
         """
         Handle the request to create a project.
         """
@@ -74,9 +75,9 @@ class CreateProjectHandler(AbstractHandler):
 
         created_project = await self.project_dal.create(project)
         logger.info(f"Project created: {created_project.id}")
-        return ServiceResponse(
+        return service_response(
             success=True,
             message="Project created successfully",
             status_code=201,
-            data=created_project.dict(),
+            data=created_project.model_dump(mode="json"),
         )
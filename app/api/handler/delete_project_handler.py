@@ -1,13 +1,18 @@
 from fastapi import Depends, Request
 from platform_common.logging.logging import get_logger
-from platform_common.utils.service_response import ServiceResponse
 from platform_common.errors.base import NotFoundError, AuthError
 from platform_common.db.dependencies.get_dal import get_dal
 from platform_common.db.dal.project_dal import ProjectDAL
 from platform_common.auth.permissions import PROJECT_EDIT
-from platform_common.auth.guards import require_project_perm_by_id
 
 from app.api.interface.abstract_handler import AbstractHandler
+from app.core.metrics import timed_dal
+from app.core.responses import ServiceJSONResponse, service_response
+from app.services.permission_service import (
+    invalidate_resource,
+    require_project_perm_by_id_cached,
+)
+from app.services.project_cache import project_cache
 
 logger = get_logger("delete_project_handler")
 
@@ -19,14 +24,17 @@ class DeleteProjectHandler(AbstractHandler):
 
     def __init__(self, project_dal: ProjectDAL = Depends(get_dal(ProjectDAL))):
         super().__init__()
-        self.project_dal = project_dal
+        self.project_dal = timed_dal(project_dal)
 
-    async def do_process(self, request: Request, project_id: str) -> ServiceResponse:
+    async def do_process(
+        self, request: Request, project_id: str
+    ) -> ServiceJSONResponse:
         user_id = getattr(request.state, "user_id", None)
         if not user_id:
             raise AuthError("Not authenticated")
 
-        await require_project_perm_by_id(
+        await require_project_perm_by_id_cached(
+            request=request,
             session=self.project_dal.session,
             user_id=user_id,
             project_id=project_id,
@@ -34,6 +42,8 @@ class DeleteProjectHandler(AbstractHandler):
         )
 
         deleted = await self.project_dal.delete(project_id)
+        invalidate_resource(project_id)
+        await project_cache.invalidate(project_id)
 
         if not deleted:
             raise NotFoundError(
@@ -41,7 +51,7 @@ class DeleteProjectHandler(AbstractHandler):
                 code="PROJECT_NOT_FOUND",
             )
 
-        return ServiceResponse(
+        return service_response(
             message="Project deleted successfully",
             status_code=200,
             data={"project_id": project_id},
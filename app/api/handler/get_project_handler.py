@@ -1,15 +1,16 @@
-from fastapi import Request, Depends
+from fastapi import Request, Response, Depends
 from platform_common.db.dal.project_dal import ProjectDAL
 from app.api.interface.abstract_handler import AbstractHandler
-from platform_common.utils.service_response import ServiceResponse
 from platform_common.logging.logging import get_logger
 from platform_common.errors.base import NotFoundError, BadRequestError, AuthError
 from platform_common.db.dependencies.get_dal import get_dal
-from platform_common.auth.permissions import (
-    PROJECT_VIEW,
-    RESOURCE_TYPE_PROJECT,
-    require_perm,
-)
+from platform_common.models.project import Project
+from platform_common.auth.permissions import PROJECT_VIEW, RESOURCE_TYPE_PROJECT
+
+from app.core.metrics import timed_dal
+from app.core.responses import ServiceJSONResponse, service_response
+from app.services.permission_service import require_perm_cached
+from app.services.project_cache import etag_matches, project_cache, project_etag
 
 logger = get_logger("get_project_handler")
 
@@ -21,9 +22,9 @@ class GetProjectHandler(AbstractHandler):
 
     def __init__(self, project_dal: ProjectDAL = Depends(get_dal(ProjectDAL))):
         super().__init__()
-        self.project_dal = project_dal
+        self.project_dal = timed_dal(project_dal)
 
-    async def do_process(self, request: Request) -> ServiceResponse:
+    async def do_process(self, request: Request) -> ServiceJSONResponse | Response:
         user_id = getattr(request.state, "user_id", None)
         if not user_id:
             raise AuthError("Not authenticated")
@@ -36,13 +37,22 @@ class GetProjectHandler(AbstractHandler):
                 message="Either project_id or id must be provided",
                 code="PROJECT_ID_REQUIRED",
             )
+        project_id = project_id or id
 
-        project = await self.project_dal.get_by_id(project_id or id)
-
-        if not project:
-            raise NotFoundError(message="Project not found", code="PROJECT_NOT_FOUND")
+        data = await project_cache.get(project_id)
+        if data is None:
+            project = await self.project_dal.get_by_id(project_id)
+            if not project:
+                raise NotFoundError(
+                    message="Project not found", code="PROJECT_NOT_FOUND"
+                )
+            data = project.model_dump(mode="json")
+            await project_cache.set(project_id, data)
+        else:
+            project = Project(**data)
 
-        await require_perm(
+        await require_perm_cached(
+            request=request,
             session=self.project_dal.session,
             user_id=user_id,
             perm_bit=PROJECT_VIEW,
@@ -50,8 +60,14 @@ class GetProjectHandler(AbstractHandler):
             resource_obj=project,
         )
 
-        return ServiceResponse(
+        etag = project_etag(data)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        return service_response(
             message="Project retrieved successfully",
             status_code=200,
-            data=project.dict(),
+            data=data,
+            headers=headers,
         )
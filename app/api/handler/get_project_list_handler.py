@@ -1,25 +1,53 @@
+from typing import Any
+
 from fastapi import Request, Depends
-from platform_common.db.dal.project_dal import ProjectDAL
+from pydantic import TypeAdapter
 from app.api.interface.abstract_handler import AbstractHandler
-from platform_common.utils.service_response import ServiceResponse
 from platform_common.logging.logging import get_logger
 from platform_common.errors.base import AuthError, BadRequestError
 from platform_common.db.dependencies.get_dal import get_dal
-from platform_common.auth.permissions import PROJECT_VIEW, RESOURCE_TYPE_PROJECT, can
+from platform_common.models.project import Project
+from platform_common.auth.permissions import PROJECT_VIEW, RESOURCE_TYPE_PROJECT
+
+from app.core.config import settings
+from app.core.metrics import timed_dal
+from app.core.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_order,
+    parse_page_size,
+)
+from app.core.responses import ServiceJSONResponse, service_response
+from app.db.dal.project_query_dal import SORTABLE_PROJECT_FIELDS, ProjectQueryDAL
+from app.services.permission_service import filter_permitted
 
 logger = get_logger("get_project_list_handler")
 
+# Dumps a whole page in one call instead of one model_dump per project.
+PROJECT_LIST = TypeAdapter(list[Project])
+
+
+def _is_user_owned(project: Project) -> bool:
+    return str(getattr(project, "owner_type", "") or "").lower() == "user"
+
+
+def _position(project: Project, sort_key: str) -> tuple[Any, str]:
+    return getattr(project, sort_key), str(project.id)
+
 
 class GetProjectListHandler(AbstractHandler):
     """
-    Handler for retrieving a list of projects.
+    Handler for retrieving a list of projects, keyset-paginated when the
+    client passes `cursor` or `limit`.
     """
 
-    def __init__(self, project_dal: ProjectDAL = Depends(get_dal(ProjectDAL))):
+    def __init__(
+        self, project_dal: ProjectQueryDAL = Depends(get_dal(ProjectQueryDAL))
+    ):
         super().__init__()
-        self.project_dal = project_dal
+        self.project_dal = timed_dal(project_dal)
 
-    async def do_process(self, request: Request) -> ServiceResponse:
+    async def do_process(self, request: Request) -> ServiceJSONResponse:
         user_id = getattr(request.state, "user_id", None)
         if not user_id:
             raise AuthError("Not authenticated")
@@ -34,33 +62,152 @@ class GetProjectListHandler(AbstractHandler):
             )
 
         organization_id = request.query_params.get("organization_id")
+        if owner_type == "org" and not organization_id:
+            raise BadRequestError(
+                message="organization_id is required when owner_type is 'org'",
+                code="ORGANIZATION_ID_REQUIRED",
+            )
 
-        if owner_type == "org":
-            if not organization_id:
-                raise BadRequestError(
-                    message="organization_id is required when owner_type is 'org'",
-                    code="ORGANIZATION_ID_REQUIRED",
+        sort_key, descending = self._parse_sort(request.query_params.get("sort"))
+        fields = self._parse_fields(request.query_params.get("fields"))
+        include = {"__all__": fields} if fields else None
+
+        # Clients that pass neither cursor nor limit keep the original response:
+        # a bare array of every visible project.
+        params = request.query_params
+        if "cursor" not in params and "limit" not in params:
+            if owner_type == "org":
+                candidates = await self.project_dal.list_for_user(
+                    user_id=user_id, organization_id=organization_id
                 )
-            projects = await self.project_dal.list_for_user(
-                user_id=user_id, organization_id=organization_id
+            else:
+                candidates = await self._personal_projects(user_id)
+            projects = await self._visible(request, user_id, candidates)
+            if "sort" in params:
+                projects = keyset_order(projects, sort_key, descending)
+            return service_response(
+                message="Project list retrieved successfully",
+                status_code=200,
+                data=PROJECT_LIST.dump_python(projects, mode="json", include=include),
+            )
+
+        limit = parse_page_size(params.get("limit"))
+        cursor = params.get("cursor")
+        after = decode_cursor(cursor, sort_key) if cursor else None
+
+        if owner_type == "org":
+            page, next_after = await self._scan_page(
+                request,
+                user_id,
+                sort_key,
+                descending,
+                after,
+                limit,
+                organization_id=organization_id,
             )
         else:
-            projects = await self.project_dal.get_by_owner(user_id)
-
-        authorized_projects = []
-        for project in projects:
-            allowed = await can(
-                session=self.project_dal.session,
-                user_id=user_id,
-                perm_bit=PROJECT_VIEW,
-                resource_type=RESOURCE_TYPE_PROJECT,
-                resource_obj=project,
+            page, next_after = await self._scan_page(
+                request,
+                user_id,
+                sort_key,
+                descending,
+                after,
+                limit,
+                owner_id=user_id,
+                owner_type="user",
             )
-            if allowed:
-                authorized_projects.append(project)
 
-        return ServiceResponse(
+        next_cursor = (
+            encode_cursor(sort_key, next_after[0], next_after[1])
+            if next_after
+            else None
+        )
+        return service_response(
             message="Project list retrieved successfully",
             status_code=200,
-            data=[project.dict() for project in authorized_projects],
+            data={
+                "items": PROJECT_LIST.dump_python(page, mode="json", include=include),
+                "next_cursor": next_cursor,
+                "limit": limit,
+            },
+        )
+
+    async def _visible(
+        self, request: Request, user_id: str, projects: list[Project]
+    ) -> list[Project]:
+        return await filter_permitted(
+            session=self.project_dal.session,
+            user_id=user_id,
+            perm_bit=PROJECT_VIEW,
+            resource_type=RESOURCE_TYPE_PROJECT,
+            resource_objs=projects,
+            request=request,
         )
+
+    async def _personal_projects(self, user_id: str) -> list[Project]:
+        projects = await self.project_dal.get_by_owner(user_id)
+        # Org projects also record their creator as owner_id.
+        return [project for project in projects if _is_user_owned(project)]
+
+    async def _scan_page(
+        self,
+        request: Request,
+        user_id: str,
+        sort_key: str,
+        descending: bool,
+        after: tuple[Any, str] | None,
+        limit: int,
+        *,
+        owner_id: str | None = None,
+        owner_type: str | None = None,
+        organization_id: str | None = None,
+    ) -> tuple[list[Project], tuple[Any, str] | None]:
+        # Keyset batches of limit + 1 rows in the requested scope, filtered for
+        # visibility before cutting so a page is only short at the end. At most
+        # PROJECT_LIST_MAX_SCAN_BATCHES batches are scanned per request; a page
+        # cut short by the cap resumes from the last row scanned.
+        page: list[Project] = []
+        for _ in range(settings.PROJECT_LIST_MAX_SCAN_BATCHES):
+            batch = await self.project_dal.list_page(
+                owner_id=owner_id,
+                owner_type=owner_type,
+                organization_id=organization_id,
+                sort_key=sort_key,
+                descending=descending,
+                after=after,
+                limit=limit + 1,
+            )
+            if not batch:
+                return page, None
+            page.extend(await self._visible(request, user_id, batch))
+            if len(page) > limit:
+                return page[:limit], _position(page[limit - 1], sort_key)
+            if len(batch) <= limit:
+                return page, None
+            after = _position(batch[-1], sort_key)
+        return page, after
+
+    @staticmethod
+    def _parse_sort(raw: str | None) -> tuple[str, bool]:
+        raw = (raw or "-updated_at").strip()
+        descending = raw.startswith("-")
+        sort_key = raw.lstrip("-+")
+        if sort_key not in SORTABLE_PROJECT_FIELDS:
+            raise BadRequestError(
+                message=f"sort must be one of {', '.join(SORTABLE_PROJECT_FIELDS)}",
+                code="INVALID_SORT",
+            )
+        return sort_key, descending
+
+    @staticmethod
+    def _parse_fields(raw: str | None) -> set[str] | None:
+        if not raw:
+            return None
+        fields = {field.strip() for field in raw.split(",") if field.strip()}
+        unknown = fields - set(Project.model_fields)
+        if unknown:
+            raise BadRequestError(
+                message=f"Unknown fields: {', '.join(sorted(unknown))}",
+                code="INVALID_FIELDS",
+            )
+        return fields | {"id"}
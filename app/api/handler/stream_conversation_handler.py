@@ -0,0 +1,55 @@
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from platform_common.auth.permissions import PROJECT_VIEW
+from platform_common.db.dal.project_conversation_dal import ProjectConversationDAL
+from platform_common.errors.base import AuthError, NotFoundError
+from platform_common.logging.logging import get_logger
+
+from app.api.interface.abstract_handler import AbstractHandler
+from app.db.session import get_session
+from app.pubsub.project_workspace_stream_subscriber import conversation_stream_hub
+from app.services.permission_service import require_project_perm_by_id_cached
+
+logger = get_logger("stream_conversation_handler")
+
+
+class StreamConversationHandler(AbstractHandler):
+    """
+    Handler for streaming a conversation's assistant events as Server-Sent Events.
+    """
+
+    async def do_process(
+        self, request: Request, conversation_id: str
+    ) -> StreamingResponse:
+        user_id = getattr(request.state, "user_id", None)
+        if not user_id:
+            raise AuthError("Not authenticated")
+
+        # Use a short-lived session: a request-scoped one would pin a pooled
+        # connection for as long as the client stays connected.
+        async for session in get_session():
+            conversation = await ProjectConversationDAL(session).get_active(
+                conversation_id
+            )
+            if not conversation:
+                raise NotFoundError(
+                    message="Conversation not found", code="CONVERSATION_NOT_FOUND"
+                )
+            await require_project_perm_by_id_cached(
+                request=request,
+                session=session,
+                user_id=user_id,
+                project_id=conversation.project_id,
+                perm_bit=PROJECT_VIEW,
+            )
+            break
+
+        return StreamingResponse(
+            conversation_stream_hub.stream(
+                conversation_id,
+                last_event_id=request.headers.get("last-event-id"),
+                is_disconnected=request.is_disconnected,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
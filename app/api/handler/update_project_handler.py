@@ -1,15 +1,15 @@
 from fastapi import Request, Depends
 from app.api.interface.abstract_handler import AbstractHandler
-from platform_common.utils.service_response import ServiceResponse
 from platform_common.logging.logging import get_logger
 from platform_common.errors.base import BadRequestError, NotFoundError, AuthError
 from platform_common.db.dependencies.get_dal import get_dal
-from platform_common.db.dal.project_dal import ProjectDAL
-from platform_common.auth.permissions import (
-    PROJECT_EDIT,
-    RESOURCE_TYPE_PROJECT,
-    require_perm,
-)
+from platform_common.auth.permissions import PROJECT_EDIT, RESOURCE_TYPE_PROJECT
+
+from app.core.metrics import timed_dal
+from app.core.responses import ServiceJSONResponse, service_response
+from app.db.dal.project_query_dal import OWNERSHIP_PROJECT_FIELDS, ProjectQueryDAL
+from app.services.permission_service import invalidate_resource, require_perm_cached
+from app.services.project_cache import project_cache
 
 logger = get_logger("update_project_handler")
 
@@ -19,11 +19,15 @@ class UpdateProjectHandler(AbstractHandler):
     Handler for updating project information.
     """
 
-    def __init__(self, project_dal: ProjectDAL = Depends(get_dal(ProjectDAL))):
+    def __init__(
+        self, project_dal: ProjectQueryDAL = Depends(get_dal(ProjectQueryDAL))
+    ):
         super().__init__()
-        self.project_dal = project_dal
+        self.project_dal = timed_dal(project_dal)
 
-    async def do_process(self, request: Request, project_id: str) -> ServiceResponse:
+    async def do_process(
+        self, request: Request, project_id: str
+    ) -> ServiceJSONResponse:
         user_id = getattr(request.state, "user_id", None)
         if not user_id:
             raise AuthError("Not authenticated")
@@ -37,7 +41,8 @@ class UpdateProjectHandler(AbstractHandler):
         if not project:
             raise NotFoundError(message="Project not found", code="PROJECT_NOT_FOUND")
 
-        await require_perm(
+        await require_perm_cached(
+            request=request,
             session=self.project_dal.session,
             user_id=user_id,
             perm_bit=PROJECT_EDIT,
@@ -45,10 +50,13 @@ class UpdateProjectHandler(AbstractHandler):
             resource_obj=project,
         )
 
-        updated_project = await self.project_dal.update(project_id, update_data)
+        updated_project = await self.project_dal.update_loaded(project, update_data)
+        await project_cache.invalidate(project_id)
+        if OWNERSHIP_PROJECT_FIELDS.intersection(update_data):
+            invalidate_resource(project_id)
 
-        return ServiceResponse(
+        return service_response(
             message="Project updated successfully",
             status_code=200,
-            data=updated_project.dict(),
+            data=updated_project.model_dump(mode="json"),
         )
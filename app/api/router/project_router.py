@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from platform_common.logging.logging import get_logger
 from platform_common.utils.service_response import ServiceResponse
 from platform_common.middleware.auth_middleware import authenticate_request
@@ -8,45 +9,69 @@ from app.api.handler.get_project_handler import GetProjectHandler
 from app.api.handler.create_project_handler import CreateProjectHandler
 from app.api.handler.update_project_handler import UpdateProjectHandler
 from app.api.handler.delete_project_handler import DeleteProjectHandler
+from app.api.handler.batch_project_handler import BatchProjectHandler
+from app.api.handler.stream_conversation_handler import StreamConversationHandler
+from app.core.responses import ServiceJSONResponse
 
-router = APIRouter(dependencies=[Depends(authenticate_request)])
+# Handlers return ServiceJSONResponse themselves; response_model=ServiceResponse
+# keeps the envelope in the OpenAPI schema without re-validating it.
+router = APIRouter(
+    dependencies=[Depends(authenticate_request)],
+    default_response_class=ServiceJSONResponse,
+)
 logger = get_logger("project")
 
 
-@router.get("/read/list")
+@router.get("/read/list", response_model=ServiceResponse)
 async def get_project_list(
     request: Request, handler: GetProjectListHandler = Depends(GetProjectListHandler)
-) -> ServiceResponse:
+) -> ServiceJSONResponse:
     return await handler.do_process(request)
 
 
-@router.get("/read")
+@router.get("/read", response_model=ServiceResponse)
 async def get_project(
     request: Request, handler: GetProjectHandler = Depends(GetProjectHandler)
-) -> ServiceResponse:
+) -> ServiceJSONResponse | Response:
     return await handler.do_process(request)
 
 
-@router.post("/create")
+@router.post("/create", response_model=ServiceResponse)
 async def create_project(
     request: Request, handler: CreateProjectHandler = Depends(CreateProjectHandler)
-) -> ServiceResponse:
+) -> ServiceJSONResponse:
     return await handler.do_process(request)
 
 
-@router.put("/update/{project_id}")
+@router.put("/update/{project_id}", response_model=ServiceResponse)
 async def update_project(
     project_id: str,
     request: Request,
     handler: UpdateProjectHandler = Depends(UpdateProjectHandler),
-) -> ServiceResponse:
+) -> ServiceJSONResponse:
     return await handler.do_process(request, project_id)
 
 
-@router.delete("/delete/{project_id}")
+@router.delete("/delete/{project_id}", response_model=ServiceResponse)
 async def delete_project(
     project_id: str,
     request: Request,
     handler: DeleteProjectHandler = Depends(DeleteProjectHandler),
-) -> ServiceResponse:
+) -> ServiceJSONResponse:
     return await handler.do_process(request, project_id)
+
+
+@router.post("/batch", response_model=ServiceResponse)
+async def batch_projects(
+    request: Request, handler: BatchProjectHandler = Depends(BatchProjectHandler)
+) -> ServiceJSONResponse:
+    return await handler.do_process(request)
+
+
+@router.get("/conversation/{conversation_id}/stream")
+async def stream_conversation(
+    conversation_id: str,
+    request: Request,
+    handler: StreamConversationHandler = Depends(StreamConversationHandler),
+) -> StreamingResponse:
+    return await handler.do_process(request, conversation_id)
@@ -6,6 +6,135 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./test.db"
     REDIS_URL: str = "redis://localhost:6379"
 
+    # One engine per process, shared by request handlers, the job subscriber
+    # and the outbox relay. Pool sizing is per process: size it against the
+    # database's max_connections divided by the number of workers.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1_800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    # asyncpg only; 0 disables the server-side statement timeout.
+    DB_STATEMENT_TIMEOUT_MS: int = 30_000
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    # In-process Prometheus metrics served at /metrics; recording is a no-op
+    # when disabled.
+    METRICS_ENABLED: bool = True
+
+    # Request profiling: a sampled share of requests, plus any request sent
+    # with X-Debug-Token set to PROFILING_DEBUG_TOKEN, is profiled and kept
+    # in a bounded in-process store readable at /admin/profiles (same header).
+    # Background jobs are sampled at the same rate. The token also unlocks
+    # /health/caches, /health/jobs and /health/db; unset, they are closed.
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_DEBUG_TOKEN: str = ""
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5.0
+    PROFILING_MAX_PROFILES: int = 50
+
+    # /health/ready runs its dependency checks at most once per cache window.
+    HEALTH_READY_CACHE_SECONDS: float = 2.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 1.0
+
+    # Also the longest a membership or role change made elsewhere takes to
+    # apply here: this service has no membership events to invalidate on.
+    PERMISSION_CACHE_TTL_SECONDS: float = 30.0
+    PERMISSION_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Upper bound on how long a replica can serve a project changed on another
+    # replica when Redis pub/sub invalidation is off or disconnected.
+    PROJECT_CACHE_TTL_SECONDS: float = 5.0
+    PROJECT_CACHE_MAX_ENTRIES: int = 5_000
+    PROJECT_CACHE_REDIS_ENABLED: bool = False
+    PROJECT_CACHE_REDIS_TTL_SECONDS: int = 60
+
+    PROJECT_BATCH_MAX_ITEMS: int = 1_000
+    # Batches a paginated personal listing may scan while filtering out
+    # projects the user cannot see before returning a short page.
+    PROJECT_LIST_MAX_SCAN_BATCHES: int = 5
+
+    # Assistant stream deltas are coalesced until either limit is reached.
+    STREAM_COALESCE_MAX_BYTES: int = 512
+    STREAM_COALESCE_WINDOW_MS: int = 40
+
+    # SSE fan-out: frames kept per conversation for Last-Event-ID resume, and
+    # how far a slow client may fall behind before its deltas are merged.
+    SSE_REPLAY_BUFFER_SIZE: int = 256
+    SSE_REPLAY_MAX_CONVERSATIONS: int = 1_000
+    SSE_CLIENT_MAX_PENDING_FRAMES: int = 32
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+
+    # Partial replies are persisted every N bytes or seconds while streaming;
+    # STREAMING messages not touched for STREAMING_STALE_AFTER_SECONDS are
+    # treated as abandoned and finalized by the sweeper.
+    STREAM_CHECKPOINT_MIN_BYTES: int = 2_048
+    STREAM_CHECKPOINT_INTERVAL_SECONDS: float = 5.0
+    STREAMING_STALE_AFTER_SECONDS: int = 300
+    STREAMING_SWEEP_INTERVAL_SECONDS: float = 60.0
+    STREAMING_SWEEP_BATCH_SIZE: int = 100
+
+    # The relay claims pending EventOutbox rows with SKIP LOCKED, so it can run
+    # on every replica. It needs EventOutbox.published_at and disables itself
+    # when the column is missing.
+    OUTBOX_RELAY_ENABLED: bool = False
+    OUTBOX_RELAY_TOPIC: str = "project-management.events"
+    OUTBOX_RELAY_BATCH_SIZE: int = 200
+    OUTBOX_RELAY_POLL_INTERVAL_SECONDS: float = 1.0
+
+    PROJECT_WORKSPACE_JOB_CONCURRENCY: int = 8
+    PROJECT_WORKSPACE_JOB_MAX_PENDING: int = 64
+    PROJECT_WORKSPACE_JOB_DRAIN_TIMEOUT_SECONDS: float = 30.0
+
+    # "pubsub" keeps the fire-and-forget subscription; "streams" consumes a Redis
+    # Stream through a consumer group shared by every replica.
+    PROJECT_WORKSPACE_JOB_TRANSPORT: str = "pubsub"
+    PROJECT_WORKSPACE_JOB_STREAM: str | None = None
+    PROJECT_WORKSPACE_JOB_GROUP: str = "project-management"
+    PROJECT_WORKSPACE_JOB_CLAIM_IDLE_MS: int = 120_000
+    # A job still failing after this many deliveries goes to "<stream>:dead-letter".
+    PROJECT_WORKSPACE_JOB_MAX_DELIVERIES: int = 5
+
+    # Shared connection pool for LLM provider clients.
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    LLM_HTTP_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    LLM_HTTP_READ_TIMEOUT_SECONDS: float = 120.0
+    LLM_HTTP2_ENABLED: bool = True
+
+    # Prompt token budget; the model's own window applies when the cap is unset.
+    LLM_CONTEXT_MAX_TOKENS: int | None = 32_000
+    LLM_RESPONSE_RESERVE_TOKENS: int = 2_048
+
+    LLM_CONTEXT_CACHE_MAX_ENTRIES: int = 2_000
+    LLM_CONTEXT_CACHE_TTL_SECONDS: float = 300.0
+    LLM_CONTEXT_CACHE_REDIS_ENABLED: bool = False
+
+    # Opt-in exact-match cache of assistant replies, keyed on model,
+    # temperature and the normalized prompt window.
+    LLM_RESPONSE_CACHE_ENABLED: bool = False
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 1_000
+    LLM_RESPONSE_CACHE_TTL_SECONDS: float = 3_600.0
+    LLM_RESPONSE_CACHE_REDIS_ENABLED: bool = False
+
+    # Fallback routes as "provider:model,provider:model", tried after the
+    # request's own provider. A route with no first token within the timeout is
+    # hedged to the next one.
+    LLM_FALLBACK_ROUTES: str = ""
+    LLM_HEDGING_ENABLED: bool = True
+    LLM_FIRST_TOKEN_TIMEOUT_SECONDS: float = 8.0
+    LLM_BREAKER_ERROR_RATE: float = 0.5
+    LLM_BREAKER_MIN_REQUESTS: int = 5
+    LLM_BREAKER_WINDOW_SECONDS: float = 60.0
+    LLM_BREAKER_COOLDOWN_SECONDS: float = 30.0
+
+    # Client-side admission control: "provider[:model]=rpm/tpm,...".
+    LLM_RATE_LIMITS: str = ""
+    LLM_RATE_LIMIT_MAX_WAIT_SECONDS: float = 20.0
+    LLM_RATE_LIMIT_REDIS_ENABLED: bool = False
+
     class Config:
         env_file = ".env"
 
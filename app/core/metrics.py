@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import inspect
+import time
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from services.metrics import registry
+
+T = TypeVar("T")
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status"),
+)
+DAL_CALL_SECONDS = registry.histogram(
+    "dal_call_seconds", "Latency of DAL calls made by handlers.", ("dal", "method")
+)
+DB_STATEMENT_SECONDS = registry.histogram(
+    "db_statement_seconds", "SQL statement execution time.", ("operation",)
+)
+
+_sqlalchemy_instrumented = False
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing every HTTP request. Routes are labelled by their
+    template (e.g. /update/{project_id}) to keep the series count bounded.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Any) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            )
+
+
+class _TimedDAL:
+    def __init__(self, dal: Any) -> None:
+        self._dal = dal
+        self._name = type(dal).__name__
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._dal, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            with DAL_CALL_SECONDS.time(self._name, name):
+                return await attr(*args, **kwargs)
+
+        return timed
+
+
+def timed_dal(dal: T) -> T:
+    """
+    Wrap a DAL so each of its async methods records `dal_call_seconds`.
+    """
+    return _TimedDAL(dal)  # type: ignore[return-value]
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if not registry.enabled:
+        return
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    started = conn.info.get("metrics_started")
+    if not started:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    DB_STATEMENT_SECONDS.observe(time.perf_counter() - started.pop(), operation)
+
+
+def _handle_error(context: Any) -> None:
+    # Failed statements never reach after_cursor_execute.
+    conn = context.connection
+    started = conn.info.get("metrics_started") if conn is not None else None
+    if started:
+        started.pop()
+
+
+def instrument_sqlalchemy() -> None:
+    """
+    Time every statement on every engine in the process, including the ones
+    platform_common creates.
+    """
+    global _sqlalchemy_instrumented
+    if _sqlalchemy_instrumented:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _sqlalchemy_instrumented = True
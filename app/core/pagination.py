@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from platform_common.errors.base import BadRequestError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def parse_page_size(raw: str | None) -> int:
+    if raw is None or raw == "":
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise BadRequestError(message="limit must be an integer", code="INVALID_LIMIT")
+    if limit < 1:
+        raise BadRequestError(message="limit must be positive", code="INVALID_LIMIT")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort_key: str, sort_value: Any, row_id: str) -> str:
+    """
+    Build an opaque keyset cursor pointing just past (sort_value, row_id).
+    """
+    raw = json.dumps([sort_key, _encode_value(sort_value), row_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[Any, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise BadRequestError(message="Invalid cursor", code="INVALID_CURSOR")
+    if key != sort_key:
+        raise BadRequestError(
+            message="Cursor does not match the requested sort",
+            code="INVALID_CURSOR",
+        )
+    return _decode_value(value), str(row_id)
+
+
+def keyset_order(rows: list[Any], sort_key: str, descending: bool) -> list[Any]:
+    """
+    Order rows by (sort_key, id) with NULL sort keys last, the order
+    ProjectQueryDAL.list_page uses, for result sets sorted in memory.
+    """
+    present = [row for row in rows if getattr(row, sort_key) is not None]
+    missing = [row for row in rows if getattr(row, sort_key) is None]
+    present.sort(key=lambda row: (getattr(row, sort_key), str(row.id)))
+    missing.sort(key=lambda row: str(row.id))
+    if descending:
+        present.reverse()
+        missing.reverse()
+    return present + missing
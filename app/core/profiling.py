@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+# Sent to profile a request and to read /admin/profiles.
+DEBUG_HEADER = "x-debug-token"
+MAX_STACK_DEPTH = 128
+
+_current: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+_hooks_installed = False
+
+
+@dataclass
+class Span:
+    kind: str
+    name: str
+    offset_ms: float
+    duration_ms: float
+
+
+@dataclass(eq=False)
+class RequestProfile:
+    method: str
+    path: str
+    trigger: str
+    # Correlation id from the response; the store is keyed by profile_id,
+    # which the server generates.
+    request_id: str | None = None
+    profile_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    status: int | None = None
+    samples: Counter[str] = field(default_factory=Counter)
+    spans: list[Span] = field(default_factory=list)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    # Guards `samples`, which the sampler thread writes while the loop reads.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_sample(self, stack: str) -> None:
+        with self._lock:
+            self.samples[stack] += 1
+
+    def sample_counts(self) -> Counter[str]:
+        with self._lock:
+            return Counter(self.samples)
+
+    def add_span(self, kind: str, name: str, started: float, ended: float) -> None:
+        self.spans.append(
+            Span(
+                kind=kind,
+                name=name,
+                offset_ms=(started - self._started) * 1000,
+                duration_ms=(ended - started) * 1000,
+            )
+        )
+
+    def folded(self) -> str:
+        """
+        Samples in folded-stack format, for flamegraph.pl or speedscope.
+        """
+        samples = self.sample_counts()
+        return "\n".join(f"{stack} {count}" for stack, count in samples.items())
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "profile_id": self.profile_id,
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "trigger": self.trigger,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "sample_count": sum(self.sample_counts().values()),
+            "span_count": len(self.spans),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.summary(),
+            "spans": [span.__dict__ for span in self.spans],
+            "top_stacks": [
+                {"stack": stack, "samples": count}
+                for stack, count in self.sample_counts().most_common(20)
+            ],
+        }
+
+
+class ProfileStore:
+    """
+    Most recent profiles by profile id, oldest evicted first.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles[profile.profile_id] = profile
+        self._profiles.move_to_end(profile.profile_id)
+        while len(self._profiles) > self._max_entries:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list[RequestProfile]:
+        return list(reversed(self._profiles.values()))
+
+
+def _fold(frame: Any) -> str:
+    names: list[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    Samples the event loop thread's stack every `interval_seconds` while at
+    least one profile is active, and adds each stack to every active profile.
+
+    The loop is shared, so a profile also sees whatever else the loop ran
+    while its request was in flight; the span timeline is per request.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._active: set[RequestProfile] = set()
+        self._thread: threading.Thread | None = None
+        self._target: int | None = None
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.add(profile)
+            self._target = threading.get_ident()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="request-profiler", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.discard(profile)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval_seconds)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                profiles = list(self._active)
+                target = self._target
+            frame = sys._current_frames().get(target) if target else None
+            if frame is None:
+                continue
+            stack = _fold(frame)
+            for profile in profiles:
+                profile.add_sample(stack)
+
+
+profile_store = ProfileStore(settings.PROFILING_MAX_PROFILES)
+stack_sampler = StackSampler(settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+
+
+def is_debug_token(value: str | None) -> bool:
+    token = settings.PROFILING_DEBUG_TOKEN
+    return bool(token and value) and hmac.compare_digest(token, value or "")
+
+
+def record_span(kind: str, name: str, started: float, ended: float) -> None:
+    profile = _current.get()
+    if profile is not None:
+        profile.add_span(kind, name, started, ended)
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[None]:
+    """
+    Record the enclosed block in the active profile, if there is one.
+    """
+    if _current.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(kind, name, started, time.perf_counter())
+
+
+@contextmanager
+def _profiling(
+    profile: RequestProfile, store: ProfileStore, sampler: StackSampler
+) -> Iterator[RequestProfile]:
+    token = _current.set(profile)
+    sampler.add(profile)
+    try:
+        yield profile
+    finally:
+        sampler.remove(profile)
+        _current.reset(token)
+        profile.duration_ms = (time.perf_counter() - profile._started) * 1000
+        store.add(profile)
+
+
+@contextmanager
+def profile_job(
+    name: str, random_fn: Callable[[], float] = random.random
+) -> Iterator[RequestProfile | None]:
+    """
+    Profile a sampled share of background jobs, at PROFILING_SAMPLE_RATE, the
+    way the middleware profiles requests. LLM calls only run in jobs.
+    """
+    sample_rate = settings.PROFILING_SAMPLE_RATE
+    if not settings.PROFILING_ENABLED or not sample_rate or random_fn() >= sample_rate:
+        yield None
+        return
+    profile = RequestProfile(method="JOB", path=name, trigger="sampled")
+    with _profiling(profile, profile_store, stack_sampler):
+        yield profile
+
+
+def trace_redis(client: Any) -> Any:
+    """
+    Record each command on `client` in the active request profile.
+    """
+    execute_command = client.execute_command
+
+    async def traced(*args: Any, **options: Any) -> Any:
+        if _current.get() is None:
+            return await execute_command(*args, **options)
+        started = time.perf_counter()
+        try:
+            return await execute_command(*args, **options)
+        finally:
+            record_span(
+                "redis", str(args[0]) if args else "", started, time.perf_counter()
+            )
+
+    client.execute_command = traced
+    return client
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    started = conn.info.get("profile_started")
+    if started and _current.get() is not None:
+        name = " ".join(statement.split())[:200]
+        record_span("db", name, started.pop(), time.perf_counter())
+
+
+def _handle_error(context: Any) -> None:
+    conn = context.connection
+    started = conn.info.get("profile_started") if conn is not None else None
+    if started:
+        started.pop()
+
+
+def install_profiling_hooks() -> None:
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _hooks_installed = True
+
+
+def _header(scope: Any, name: bytes) -> str | None:
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            return bytes(value).decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles a sampled share of requests, plus any
+    request carrying `X-Debug-Token: <PROFILING_DEBUG_TOKEN>`.
+
+    Unprofiled requests cost a header scan and a random draw. A profiled
+    request gets a stack-sampled profile and a timeline of its DB and Redis
+    calls, stored under a server-generated id returned in `X-Profile-Id`.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        store: ProfileStore,
+        sampler: StackSampler,
+        sample_rate: float = 0.0,
+        random_fn: Callable[[], float] = random.random,
+    ) -> None:
+        self.app = app
+        self._store = store
+        self._sampler = sampler
+        self._sample_rate = sample_rate
+        self._random = random_fn
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        trigger = self._trigger(scope) if scope["type"] == "http" else None
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            method=scope["method"], path=scope["path"], trigger=trigger
+        )
+
+        async def send_with_profile_id(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                headers = list(message.get("headers") or [])
+                for key, value in headers:
+                    if key.lower() == b"x-request-id":
+                        profile.request_id = value.decode("latin-1")
+                headers.append((b"x-profile-id", profile.profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with _profiling(profile, self._store, self._sampler):
+            await self.app(scope, receive, send_with_profile_id)
+
+    def _trigger(self, scope: Any) -> str | None:
+        if is_debug_token(_header(scope, DEBUG_HEADER.encode())):
+            return "header"
+        if self._sample_rate and self._random() < self._sample_rate:
+            return "sampled"
+        return None
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.config import settings
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - dependency resolved in service image
+    redis_asyncio = None  # type: ignore[assignment]
+
+_client: Any = None
+
+
+def get_redis() -> Any:
+    """
+    Shared async Redis client for caches and streams, or None if unavailable.
+    """
+    global _client
+    if redis_asyncio is None:
+        return None
+    if _client is None:
+        _client = redis_asyncio.from_url(settings.REDIS_URL, decode_responses=True)
+        if settings.PROFILING_ENABLED:
+            from app.core.profiling import trace_redis
+
+            trace_redis(_client)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
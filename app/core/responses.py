@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from platform_common.utils.service_response import ServiceResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependency resolved in service image
+    orjson = None  # type: ignore[assignment]
+
+
+def _encode(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=jsonable_encoder,
+    ).encode("utf-8")
+
+
+class ServiceJSONResponse(JSONResponse):
+    """
+    Sends a ServiceResponse envelope encoded with orjson (the stdlib encoder
+    when orjson is not installed).
+
+    Returning a Response from a route skips FastAPI's response_model pass
+    (re-validation plus jsonable_encoder). `data` is expected to be dumped
+    already and is handed to the encoder as is; only the envelope's own
+    fields go through pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, ServiceResponse):
+            data = content.data
+            content = content.model_dump(mode="json", by_alias=True, exclude={"data"})
+            content["data"] = data
+        return _encode(content)
+
+
+def service_response(
+    *,
+    message: str,
+    status_code: int = 200,
+    data: Any = None,
+    headers: dict[str, str] | None = None,
+    **fields: Any,
+) -> ServiceJSONResponse:
+    """
+    ServiceResponse envelope sent as a ServiceJSONResponse. Build `data` with
+    `model_dump(mode="json")` from models that are already validated; the
+    envelope is built with model_construct and not validated again.
+    """
+    envelope = ServiceResponse.model_construct(
+        message=message, status_code=status_code, data=data, **fields
+    )
+    return ServiceJSONResponse(envelope, headers=headers)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+
+from platform_common.db.dal.project_dal import ProjectDAL
+from platform_common.models.project import Project
+from platform_common.utils.time_helpers import get_current_epoch, utcnow
+
+SORTABLE_PROJECT_FIELDS = ("updated_at", "created_at", "name")
+IMMUTABLE_PROJECT_FIELDS = frozenset({"id", "created_at"})
+OWNERSHIP_PROJECT_FIELDS = frozenset({"owner_id", "owner_type", "organization_id"})
+
+
+def next_updated_at(project: Project) -> Any:
+    # Keep whichever representation the model already uses for timestamps.
+    current = getattr(project, "updated_at", None)
+    return utcnow() if hasattr(current, "tzinfo") else get_current_epoch()
+
+
+def updatable_fields(update_data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in update_data.items()
+        if key in Project.model_fields and key not in IMMUTABLE_PROJECT_FIELDS
+    }
+
+
+class ProjectQueryDAL(ProjectDAL):
+    """
+    ProjectDAL with the query shapes this service needs beyond the shared DAL.
+    """
+
+    async def list_page(
+        self,
+        *,
+        owner_id: str | None = None,
+        owner_type: str | None = None,
+        organization_id: str | None = None,
+        sort_key: str = "updated_at",
+        descending: bool = True,
+        after: tuple[Any, str] | None = None,
+        limit: int = 50,
+    ) -> list[Project]:
+        """
+        Keyset page of projects ordered by (sort_key, id), NULL sort keys last.
+        """
+        if sort_key not in SORTABLE_PROJECT_FIELDS:
+            raise ValueError(f"Unsupported sort key '{sort_key}'")
+
+        sort_col = getattr(Project, sort_key)
+        stmt = select(Project)
+        if owner_id is not None:
+            stmt = stmt.where(Project.owner_id == owner_id)
+        if owner_type is not None:
+            stmt = stmt.where(Project.owner_type == owner_type)
+        if organization_id is not None:
+            stmt = stmt.where(Project.organization_id == organization_id)
+
+        if after is not None:
+            after_value, after_id = after
+            id_past = Project.id < after_id if descending else Project.id > after_id
+            if after_value is None:
+                # Already in the NULL tail, which is ordered by id alone.
+                stmt = stmt.where(sort_col.is_(None), id_past)
+            else:
+                value_past = (
+                    sort_col < after_value if descending else sort_col > after_value
+                )
+                stmt = stmt.where(
+                    or_(
+                        value_past,
+                        and_(sort_col == after_value, id_past),
+                        sort_col.is_(None),
+                    )
+                )
+
+        if descending:
+            stmt = stmt.order_by(sort_col.desc().nulls_last(), Project.id.desc())
+        else:
+            stmt = stmt.order_by(sort_col.asc().nulls_last(), Project.id.asc())
+
+        result = await self.session.execute(stmt.limit(limit))
+        return list(result.scalars().all())
+
+    async def update_loaded(
+        self, project: Project, update_data: dict[str, Any]
+    ) -> Project:
+        """
+        Apply an update to an already loaded project without re-reading it.
+        """
+        for key, value in updatable_fields(update_data).items():
+            setattr(project, key, value)
+        project.updated_at = next_updated_at(project)
+
+        self.session.add(project)
+        await self.session.commit()
+        await self.session.refresh(project)
+        return project
+
+    async def get_many(self, project_ids: list[str]) -> list[Project]:
+        if not project_ids:
+            return []
+        result = await self.session.execute(
+            select(Project).where(Project.id.in_(project_ids))
+        )
+        return list(result.scalars().all())
+
+    # The bulk writers below leave committing to the caller so a batch request
+    # can apply its inserts, updates and deletes in one transaction.
+
+    async def insert_many(self, projects: list[Project]) -> None:
+        """
+        Insert projects with a single multi-row INSERT.
+        """
+        if projects:
+            await self.session.execute(
+                insert(Project), [project.model_dump() for project in projects]
+            )
+
+    async def update_many(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Apply per-row changes (each with an "id") as one bulk UPDATE by primary key.
+        """
+        if rows:
+            await self.session.execute(update(Project), rows)
+
+    async def delete_many(self, project_ids: list[str]) -> int:
+        if not project_ids:
+            return 0
+        result = await self.session.execute(
+            delete(Project).where(Project.id.in_(project_ids))
+        )
+        return int(result.rowcount or 0)
@@ -1,21 +1,134 @@
+from __future__ import annotations
+
+from typing import Any, AsyncGenerator
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import create_engine
-from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.orm import sessionmaker
+
 from app.core.config import settings
 
-engine: AsyncEngine = create_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-)
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_engine_options: dict[str, Any] = {}
+_probe_engine: AsyncEngine | None = None
+
+
+def engine_options(url: URL, *, pooled: bool = True) -> dict[str, Any]:
+    """
+    create_async_engine keyword arguments for `url` built from the DB_* settings.
+    `pooled=False` leaves out the pool sizing, for a NullPool engine.
+    """
+    options: dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    # In-memory SQLite gets a StaticPool, which takes no sizing arguments.
+    if pooled and (
+        url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:")
+    ):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
+    if url.get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        }
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+            }
+        options["connect_args"] = connect_args
+    return options
+
+
+def build_engine(url: str | None = None, **overrides: Any) -> AsyncEngine:
+    parsed = make_url(url or settings.DATABASE_URL)
+    return create_async_engine(parsed, **{**engine_options(parsed), **overrides})
+
 
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+def init_engine() -> AsyncEngine:
+    """
+    Create the process-wide engine. Called from the lifespan; later calls
+    return the engine already built.
+    """
+    global _engine, _sessionmaker, _engine_options
+    if _engine is None:
+        url = make_url(settings.DATABASE_URL)
+        _engine_options = engine_options(url)
+        _engine = create_async_engine(url, **_engine_options)
+        _sessionmaker = async_sessionmaker(
+            _engine, class_=AsyncSession, expire_on_commit=False
+        )
+    return _engine
 
-from typing import AsyncGenerator
+
+def get_engine() -> AsyncEngine:
+    return init_engine()
+
+
+def get_probe_engine() -> AsyncEngine:
+    """
+    Unpooled engine for health checks. Each probe opens its own connection, so
+    a saturated shared pool (busy, not down) does not fail readiness.
+    """
+    global _probe_engine
+    if _probe_engine is None:
+        url = make_url(settings.DATABASE_URL)
+        _probe_engine = create_async_engine(
+            url, **engine_options(url, pooled=False), poolclass=NullPool
+        )
+    return _probe_engine
+
+
+async def dispose_engine() -> None:
+    global _engine, _sessionmaker, _probe_engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _sessionmaker = None
+    if _probe_engine is not None:
+        await _probe_engine.dispose()
+        _probe_engine = None
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
+    init_engine()
+    assert _sessionmaker is not None
+    async with _sessionmaker() as session:
         yield session
+
+
+def pool_stats(
+    engine: AsyncEngine | None = None, *, max_overflow: int | None = None
+) -> dict[str, Any] | None:
+    """
+    Checked-out and idle connections of the shared engine's pool, or None
+    before the engine exists. `max_overflow` defaults to the shared engine's
+    setting; pass it for an engine built with other options.
+    """
+    engine = engine or _engine
+    if engine is None:
+        return None
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool": type(pool).__name__}
+    # Only queue pools (AsyncAdaptedQueuePool included) have a fixed size.
+    if not isinstance(pool, QueuePool):
+        return stats
+    if max_overflow is None:
+        max_overflow = int(_engine_options.get("max_overflow", 0))
+    capacity = pool.size() + max(max_overflow, 0)
+    checked_out = pool.checkedout()
+    stats.update(
+        size=pool.size(),
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        utilization=round(checked_out / capacity, 3) if capacity else None,
+    )
+    return stats
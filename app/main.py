@@ -4,35 +4,127 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.api.controller.health_check import router as health_router
+from app.api.controller.metrics import router as metrics_router
+from app.api.controller.profiling import router as profiling_router
 from app.api.router.project_router import router as project_router
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, instrument_sqlalchemy
+from app.core.profiling import (
+    ProfilingMiddleware,
+    install_profiling_hooks,
+    profile_store,
+    stack_sampler,
+)
+from app.core.redis_client import close_redis
+from app.db.session import dispose_engine, get_session, init_engine
+from app.pubsub.outbox_relay import create_outbox_relay
 from app.pubsub.project_workspace_job_subscriber import (
+    create_project_workspace_job_pool,
+    run_streaming_sweeper,
     start_project_workspace_job_subscriber,
 )
+from app.pubsub.project_workspace_stream_subscriber import (
+    start_project_workspace_stream_subscriber,
+)
+from app.services.project_cache import project_cache
 from platform_common.middleware.request_id_middleware import RequestIDMiddleware
 from platform_common.middleware.auth_middleware import AuthMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from platform_common.exception_handling.handlers import add_exception_handlers
+from platform_common.config.settings import get_settings
+from platform_common.db.session import get_session as platform_get_session
 from platform_common.logging.logging import get_logger
+from services.llm.http_client import HTTPClientConfig
+from services.llm.provider_factory import (
+    ProviderFactory,
+    close_provider_factory,
+    configure_provider_factory,
+)
+from services.llm.token_budget import default_token_counter
+from services.metrics import registry as metrics_registry
 
 logger = get_logger("project_management.lifespan")
 
 
+def _init_llm_providers() -> None:
+    factory = configure_provider_factory(
+        ProviderFactory(
+            http_config=HTTPClientConfig(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry_seconds=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                connect_timeout_seconds=settings.LLM_HTTP_CONNECT_TIMEOUT_SECONDS,
+                read_timeout_seconds=settings.LLM_HTTP_READ_TIMEOUT_SECONDS,
+                http2=settings.LLM_HTTP2_ENABLED,
+            )
+        )
+    )
+    try:
+        # Build the default provider up front so the first job skips client setup.
+        factory.create()
+    except RuntimeError as error:
+        logger.warning("Default LLM provider not initialised at startup: %s", error)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    worker_task = asyncio.create_task(start_project_workspace_job_subscriber())
+    init_engine()
+    _init_llm_providers()
+    # Fetch the default model's tokenizer now rather than on the first job.
+    await default_token_counter.load(get_settings().llm_default_model)
+
+    job_pool = create_project_workspace_job_pool()
+    job_pool.start()
+    app.state.project_workspace_job_pool = job_pool
+
+    worker_task = asyncio.create_task(start_project_workspace_job_subscriber(job_pool))
     app.state.project_workspace_job_task = worker_task
+    sweeper_task = asyncio.create_task(run_streaming_sweeper())
+    stream_task = asyncio.create_task(start_project_workspace_stream_subscriber())
+    invalidation_task = asyncio.create_task(project_cache.listen_for_invalidations())
+    relay_task = None
+    relay = create_outbox_relay()
+    if relay is not None:
+        app.state.outbox_relay = relay
+        relay_task = asyncio.create_task(relay.run())
 
     try:
         yield
     finally:
+        background = [sweeper_task, stream_task, invalidation_task]
+        if relay_task is not None:
+            background.append(relay_task)
+        for task in background:
+            task.cancel()
+        # Let them unwind before the Redis and database clients they use close.
+        await asyncio.gather(*background, return_exceptions=True)
+        # Stop taking new jobs first, then let the in-flight ones finish.
         worker_task.cancel()
         try:
             await worker_task
         except asyncio.CancelledError:
             logger.info("Project workspace job subscriber task cancelled cleanly.")
 
+        drained = await job_pool.drain(
+            timeout=settings.PROJECT_WORKSPACE_JOB_DRAIN_TIMEOUT_SECONDS
+        )
+        logger.info(
+            "Project workspace job pool drained (complete=%s, stats=%s).",
+            drained,
+            job_pool.stats(),
+        )
+        await close_provider_factory()
+        await close_redis()
+        await dispose_engine()
+
+
+metrics_registry.enabled = settings.METRICS_ENABLED
+if settings.METRICS_ENABLED:
+    instrument_sqlalchemy()
 
 app = FastAPI(title="Core Service", lifespan=lifespan)
+# Platform DAL dependencies draw their sessions from the shared engine too.
+app.dependency_overrides[platform_get_session] = get_session
 origins = [
     "http://localhost:5173",  # common React dev port
     "http://127.0.0.1:5173",
@@ -45,10 +137,23 @@ app.add_middleware(
     allow_methods=["*"],  # <-- GET, POST, PUT, DELETE, etc
     allow_headers=["*"],  # <-- allow all headers (Authorization, Content-Type…)
 )
+if settings.PROFILING_ENABLED:
+    # Inside RequestIDMiddleware, so profiles are keyed by its request id.
+    install_profiling_hooks()
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        sampler=stack_sampler,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+    )
 app.add_middleware(RequestIDMiddleware)
 app.add_middleware(AuthMiddleware)
+# Outermost, so request timings include auth and the other middleware.
+app.add_middleware(MetricsMiddleware)
 add_exception_handlers(app)
 
 # REST endpoints
 app.include_router(health_router, prefix="/health", tags=["Health"])
+app.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
+app.include_router(profiling_router, prefix="/admin/profiles", tags=["Admin"])
 app.include_router(project_router, prefix="/api/project", tags=["Project"])
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+IsDisconnected = Callable[[], Awaitable[bool]]
+
+KEEPALIVE_FRAME = ": keep-alive\n\n"
+
+
+@dataclass(frozen=True)
+class StreamFrame:
+    id: str
+    event: str
+    data: dict[str, Any]
+
+    def encode(self) -> str:
+        payload = json.dumps(self.data, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+    def merge(self, newer: StreamFrame) -> StreamFrame | None:
+        """
+        Fold a later delta of the same message into this frame, if possible.
+        """
+        if self.event != newer.event:
+            return None
+        if self.data.get("delta") is None or newer.data.get("delta") is None:
+            return None
+        if self.data.get("message_id") != newer.data.get("message_id"):
+            return None
+        data = {**newer.data, "delta": self.data["delta"] + newer.data["delta"]}
+        return replace(newer, data=data)
+
+
+def frame_id(payload: dict[str, Any], event: str) -> str:
+    seq = payload.get("seq")
+    return f"{payload.get('message_id')}:{event if seq is None else seq}"
+
+
+class _Client:
+    def __init__(self, max_frames: int) -> None:
+        self._max_frames = max_frames
+        self._frames: deque[StreamFrame] = deque()
+        self._ready = asyncio.Event()
+        self.coalesced = 0
+
+    def push(self, frame: StreamFrame) -> None:
+        # A reader that has fallen max_frames behind gets its pending deltas
+        # folded into one frame instead of an ever-growing backlog.
+        if len(self._frames) >= self._max_frames:
+            merged = self._frames[-1].merge(frame)
+            if merged is not None:
+                self._frames[-1] = merged
+                self.coalesced += 1
+                self._ready.set()
+                return
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def next_frames(self, timeout: float) -> list[StreamFrame]:
+        if not self._frames:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        frames = list(self._frames)
+        self._frames.clear()
+        self._ready.clear()
+        return frames
+
+
+class ConversationStreamHub:
+    """
+    Fans assistant stream events out to the SSE clients of this process.
+
+    A single pub/sub subscription feeds `publish()`; every event is appended
+    to a short per-conversation ring buffer and pushed to the conversation's
+    connected clients. A client reconnecting with `Last-Event-ID` is replayed
+    the buffered frames after that id, or the whole buffer when the id is no
+    longer (or was never) held here; frame ids are `<message_id>:<seq>`, so
+    clients can drop any duplicates. Slow readers are never blocked on: their
+    backlog is capped at `client_max_frames` and further deltas are coalesced
+    into the last pending frame.
+    """
+
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 256,
+        max_conversations: int = 1_000,
+        client_max_frames: int = 32,
+        keepalive_seconds: float = 15.0,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._max_conversations = max_conversations
+        self._client_max_frames = client_max_frames
+        self._keepalive_seconds = keepalive_seconds
+        self._buffers: OrderedDict[str, deque[StreamFrame]] = OrderedDict()
+        self._clients: dict[str, set[_Client]] = {}
+        self.published = 0
+        self.replayed = 0
+        self.coalesced = 0
+
+    def publish(self, event_type: Any, payload: dict[str, Any]) -> None:
+        conversation_id = str(payload.get("conversation_id") or "")
+        if not conversation_id:
+            return
+        event = str(getattr(event_type, "value", event_type))
+        frame = StreamFrame(id=frame_id(payload, event), event=event, data=payload)
+
+        buffer = self._buffers.get(conversation_id)
+        if buffer is None:
+            buffer = self._buffers[conversation_id] = deque(maxlen=self._buffer_size)
+            if len(self._buffers) > self._max_conversations:
+                self._buffers.popitem(last=False)
+        else:
+            self._buffers.move_to_end(conversation_id)
+        buffer.append(frame)
+        self.published += 1
+
+        for client in self._clients.get(conversation_id, ()):
+            client.push(frame)
+
+    def subscribe(
+        self, conversation_id: str, last_event_id: str | None = None
+    ) -> _Client:
+        client = _Client(self._client_max_frames)
+        if last_event_id:
+            for frame in self._replay(conversation_id, last_event_id):
+                client.push(frame)
+                self.replayed += 1
+        self._clients.setdefault(conversation_id, set()).add(client)
+        return client
+
+    def unsubscribe(self, conversation_id: str, client: _Client) -> None:
+        self.coalesced += client.coalesced
+        clients = self._clients.get(conversation_id)
+        if clients is None:
+            return
+        clients.discard(client)
+        if not clients:
+            del self._clients[conversation_id]
+
+    async def stream(
+        self,
+        conversation_id: str,
+        *,
+        last_event_id: str | None = None,
+        is_disconnected: IsDisconnected | None = None,
+    ) -> AsyncIterator[str]:
+        client = self.subscribe(conversation_id, last_event_id)
+        try:
+            while True:
+                frames = await client.next_frames(self._keepalive_seconds)
+                if not frames:
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    yield KEEPALIVE_FRAME
+                    continue
+                yield "".join(frame.encode() for frame in frames)
+        finally:
+            self.unsubscribe(conversation_id, client)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "conversations_buffered": len(self._buffers),
+            "clients": sum(len(clients) for clients in self._clients.values()),
+            "published": self.published,
+            "replayed": self.replayed,
+            "coalesced": self.coalesced
+            + sum(
+                client.coalesced
+                for clients in self._clients.values()
+                for client in clients
+            ),
+        }
+
+    def _replay(self, conversation_id: str, last_event_id: str) -> list[StreamFrame]:
+        frames = list(self._buffers.get(conversation_id, ()))
+        for index, frame in enumerate(frames):
+            if frame.id == last_event_id:
+                return frames[index + 1 :]
+        return frames
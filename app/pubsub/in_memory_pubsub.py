@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+Handler = Callable[[Any], Awaitable[None]]
+
+
+@dataclass
+class PublishedEvent:
+    topic: str
+    event_type: str
+    payload: dict[str, Any]
+    published_at: float
+
+
+class InMemoryPubSub:
+    """
+    In-process stand-in for the platform publisher and subscriber.
+
+    `publish` records every event with a monotonic timestamp and awaits the
+    handlers subscribed to its topic and event type. `subscribe` takes the
+    same `{topic: {event_type: handler}}` mapping as the platform subscriber
+    and, like it, blocks until the pub/sub is closed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._handlers: dict[tuple[str, str], list[Handler]] = {}
+        self._closed = asyncio.Event()
+        self.events: list[PublishedEvent] = []
+
+    async def publish(self, topic: str, event: Any) -> None:
+        event_type = str(getattr(event.event_type, "value", event.event_type))
+        self.events.append(
+            PublishedEvent(
+                topic=topic,
+                event_type=event_type,
+                payload=dict(event.payload or {}),
+                published_at=self._clock(),
+            )
+        )
+        for handler in self._handlers.get((topic, event_type), ()):
+            await handler(event)
+
+    async def subscribe(self, subscriptions: dict[str, dict[str, Handler]]) -> None:
+        for topic, handlers in subscriptions.items():
+            for event_type, handler in handlers.items():
+                self._handlers.setdefault((topic, event_type), []).append(handler)
+        await self._closed.wait()
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def counts(self) -> Counter[str]:
+        return Counter(event.event_type for event in self.events)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Hashable
+
+from platform_common.logging.logging import get_logger
+
+logger = get_logger("project_management.job_worker_pool")
+
+JobHandler = Callable[[Any], Awaitable[None]]
+KeyFn = Callable[[Any], Hashable]
+
+
+class JobWorkerPool:
+    """
+    Bounded pool of asyncio workers for subscriber jobs.
+
+    - At most `concurrency` jobs run at once.
+    - Jobs that share a key (e.g. a conversation id) run one after another;
+      a job whose key is busy is parked behind it without taking a worker.
+    - `submit` waits while `max_pending` jobs are accepted but unfinished,
+      which pushes back on the subscriber loop instead of growing memory.
+    - `drain` stops intake and lets accepted jobs finish before cancelling.
+    """
+
+    def __init__(
+        self,
+        handler: JobHandler,
+        *,
+        concurrency: int,
+        max_pending: int,
+        key_fn: KeyFn,
+        name: str = "jobs",
+    ) -> None:
+        self._handler = handler
+        self._concurrency = concurrency
+        self._key_fn = key_fn
+        self.name = name
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_pending)
+        self._max_pending = max_pending
+        self._parked: dict[Hashable, deque[Any]] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._accepting = False
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+
+    async def submit(self, job: Any) -> None:
+        if not self._accepting:
+            raise RuntimeError(f"Worker pool '{self.name}' is not accepting jobs")
+        await self._slots.acquire()
+        self._pending += 1
+        self._idle.clear()
+        self._queue.put_nowait(job)
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """
+        Stop intake, wait for accepted jobs, then stop the workers.
+
+        Returns False if the timeout expired with jobs still unfinished.
+        """
+        self._accepting = False
+        drained = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            drained = False
+            logger.warning(
+                "Worker pool '%s' drain timed out with %s jobs pending",
+                self.name,
+                self._pending,
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return drained
+
+    def stats(self) -> dict[str, Any]:
+        parked = sum(len(jobs) for jobs in self._parked.values())
+        return {
+            "name": self.name,
+            "concurrency": self._concurrency,
+            "max_pending": self._max_pending,
+            "queue_depth": self._queue.qsize() + parked,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            key = self._key_fn(job)
+            if key in self._parked:
+                # Another worker owns this key; it will pick the job up next.
+                self._parked[key].append(job)
+                continue
+
+            self._parked[key] = deque()
+            try:
+                while True:
+                    await self._run(job)
+                    if not self._parked[key]:
+                        break
+                    job = self._parked[key].popleft()
+            finally:
+                # If cancelled mid-key, parked jobs are dropped with the worker.
+                for _ in self._parked.pop(key, ()):
+                    self._finish()
+
+    async def _run(self, job: Any) -> None:
+        self.in_flight += 1
+        try:
+            await self._handler(job)
+            self.completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            logger.exception("Worker pool '%s' job failed", self.name)
+        finally:
+            self.in_flight -= 1
+            self._finish()
+
+    def _finish(self) -> None:
+        self._pending -= 1
+        self._slots.release()
+        if self._pending == 0:
+            self._idle.set()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import select, update
+
+from platform_common.logging.logging import get_logger
+from platform_common.models.event_outbox import EventOutbox
+from platform_common.pubsub.event import PubSubEvent
+from platform_common.pubsub.factory import get_publisher
+from platform_common.utils.enums import EventType
+from platform_common.utils.time_helpers import utcnow
+
+from app.core.config import settings
+from app.db.session import get_session
+
+logger = get_logger("project_management.outbox_relay")
+
+SENT_AT_COLUMN = "published_at"
+
+# Outbox event names that are not EventType values themselves.
+OUTBOX_EVENT_TYPES: dict[str, EventType] = {
+    "project.assistant_message_finalized": EventType.PROJECT_ASSISTANT_COMPLETED,
+}
+
+
+def outbox_event_type(name: str | None) -> EventType | None:
+    if not name:
+        return None
+    if name in OUTBOX_EVENT_TYPES:
+        return OUTBOX_EVENT_TYPES[name]
+    try:
+        return EventType(name)
+    except ValueError:
+        return None
+
+
+def outbox_event(row: EventOutbox) -> PubSubEvent | None:
+    """
+    The event to publish for `row`, or None if its event name maps to no
+    EventType.
+    """
+    payload = dict(row.payload or {})
+    event_type = outbox_event_type(payload.get("event_name") or row.new_status)
+    if event_type is None:
+        return None
+    payload.setdefault("outbox_id", str(row.id))
+    payload.setdefault("entity_type", row.entity_type)
+    payload.setdefault("entity_id", row.entity_id)
+    return PubSubEvent(event_type=event_type, payload=payload)
+
+
+class OutboxRelay:
+    """
+    Publishes pending EventOutbox rows and marks them sent.
+
+    Each pass claims up to `batch_size` rows with FOR UPDATE SKIP LOCKED, so
+    relays on other replicas skip rows already claimed instead of sending them
+    twice. The platform publisher has no batch API, so the batch goes out as
+    concurrent single-message publishes; the rows that went out are marked in
+    a single UPDATE in the same transaction, and rows whose publish failed
+    stay pending for the next pass. A crash between publish and commit
+    releases the locks and the rows are sent again (at-least-once), so
+    consumers should dedupe on `outbox_id`.
+
+    A row whose event name maps to no EventType is poisoned: it is logged
+    once, left pending for repair and excluded from this relay's claims, so
+    it cannot hold up the rows behind it.
+    """
+
+    def __init__(
+        self,
+        *,
+        topic: str,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        self._topic = topic
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._sent_at = EventOutbox.__table__.c[SENT_AT_COLUMN]
+        self._poisoned: set[Any] = set()
+        self.sent = 0
+        self.failed = 0
+        self.batches = 0
+
+    async def run(self) -> None:
+        logger.info("Relaying event outbox to topic '%s'", self._topic)
+        while True:
+            try:
+                claimed = await self.relay_once()
+            except Exception:
+                logger.exception("Outbox relay pass failed")
+                claimed = 0
+            # A full batch means there is likely a backlog; keep draining.
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval_seconds)
+
+    async def relay_once(self) -> int:
+        async for session in get_session():
+            query = select(EventOutbox).where(self._sent_at.is_(None))
+            if self._poisoned:
+                query = query.where(EventOutbox.id.not_in(self._poisoned))
+            rows = (
+                await session.scalars(
+                    query.order_by(EventOutbox.occurred_at)
+                    .limit(self._batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if not rows:
+                await session.rollback()
+                return 0
+
+            sent_ids = await self._publish(rows)
+            if sent_ids:
+                await session.execute(
+                    update(EventOutbox)
+                    .where(EventOutbox.id.in_(sent_ids))
+                    .values({SENT_AT_COLUMN: utcnow()})
+                    .execution_options(synchronize_session=False)
+                )
+            await session.commit()
+            self.batches += 1
+            return len(rows)
+        return 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "topic": self._topic,
+            "sent": self.sent,
+            "failed": self.failed,
+            "poisoned": len(self._poisoned),
+            "batches": self.batches,
+        }
+
+    async def _publish(self, rows: list[EventOutbox]) -> list[Any]:
+        publishable = []
+        events = []
+        for row in rows:
+            event = outbox_event(row)
+            if event is None:
+                self._poisoned.add(row.id)
+                logger.error(
+                    "Outbox row %s has no known event type (%s); skipping it",
+                    row.id,
+                    (row.payload or {}).get("event_name") or row.new_status,
+                )
+                continue
+            publishable.append(row)
+            events.append(event)
+
+        publisher = get_publisher()
+        results = await asyncio.gather(
+            *(publisher.publish(self._topic, event) for event in events),
+            return_exceptions=True,
+        )
+        sent_ids = []
+        for row, result in zip(publishable, results):
+            if isinstance(result, BaseException):
+                self.failed += 1
+                logger.warning("Outbox row %s publish failed: %s", row.id, result)
+            else:
+                sent_ids.append(row.id)
+        self.sent += len(sent_ids)
+        return sent_ids
+
+
+def create_outbox_relay() -> OutboxRelay | None:
+    """
+    The relay configured by OUTBOX_RELAY_*, or None when it is disabled or
+    the EventOutbox model has no sent marker to relay against.
+    """
+    if not settings.OUTBOX_RELAY_ENABLED:
+        return None
+    if SENT_AT_COLUMN not in EventOutbox.__table__.c:
+        logger.warning(
+            "EventOutbox has no '%s' column; outbox relay disabled", SENT_AT_COLUMN
+        )
+        return None
+    return OutboxRelay(
+        topic=settings.OUTBOX_RELAY_TOPIC,
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+        poll_interval_seconds=settings.OUTBOX_RELAY_POLL_INTERVAL_SECONDS,
+    )
@@ -1,29 +1,124 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
+from sqlalchemy import Table, case, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import Insert as PgInsert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from platform_common.config.settings import get_settings
 from platform_common.constants.pubsub_topics import (
     PROJECT_WORKSPACE_JOBS_TOPIC,
     PROJECT_WORKSPACE_STREAM_TOPIC,
 )
-from platform_common.db.dal.project_conversation_message_dal import (
-    ProjectConversationMessageDAL,
-)
-from platform_common.db.session import get_session
 from platform_common.logging.logging import get_logger
 from platform_common.models.event_outbox import EventOutbox
 from platform_common.models.project_conversation import ProjectConversation
-from platform_common.models.project_conversation_message import ProjectConversationMessage
+from platform_common.models.project_conversation_message import (
+    ProjectConversationMessage,
+)
 from platform_common.pubsub.event import PubSubEvent
 from platform_common.pubsub.factory import get_publisher, get_subscriber
 from platform_common.utils.enums import EventType
 from platform_common.utils.time_helpers import get_current_epoch, utcnow
 
-from services.llm import LLMService
+from app.core.config import settings
+from app.core.profiling import profile_job, span
+from app.core.redis_client import get_redis
+from app.db.session import get_session
+from app.pubsub.job_worker_pool import JobWorkerPool
+from app.pubsub.stream_checkpointer import StreamCheckpointer
+from app.pubsub.stream_coalescer import StreamDeltaCoalescer
+from app.pubsub.stream_job_consumer import (
+    RedisStreamJobConsumer,
+    StreamJob,
+    default_consumer_name,
+)
+from services.llm import (
+    ContextBudget,
+    ConversationContextCache,
+    LLMRequest,
+    LLMResponseCache,
+    LLMService,
+    ProviderRouter,
+)
+from services.llm.circuit_breaker import CircuitBreakerConfig
+from services.llm.provider_router import parse_routes
+from services.llm.rate_limiter import LLMRateLimiter, parse_rate_limits
+from services.llm.token_budget import HistoryMessage
+from services.metrics import registry
 
 logger = get_logger("project_management.project_workspace_job_subscriber")
 
 FRIENDLY_ERROR_PREFIX = "Lucy's tired right now, has to take a nap. Come back later."
+INTERRUPTED_MESSAGE = f"{FRIENDLY_ERROR_PREFIX} Response interrupted."
+
+JOB_SECONDS = registry.histogram(
+    "project_workspace_job_seconds",
+    "Assistant reply job duration by outcome.",
+    ("outcome",),
+)
+JOB_STREAM_PUBLISHES = registry.histogram(
+    "project_workspace_job_stream_publishes",
+    "Stream events published per assistant reply job.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+STREAM_PUBLISHES = registry.counter(
+    "project_workspace_stream_publishes",
+    "Stream events published by type.",
+    ("event_type",),
+)
+DB_COMMIT_SECONDS = registry.histogram(
+    "project_workspace_db_commit_seconds",
+    "Commit latency of the assistant message writes.",
+    ("operation",),
+)
+LLM_TOKENS = registry.counter(
+    "llm_tokens", "LLM token usage from usage_json.", ("provider", "model", "kind")
+)
+
+conversation_context_cache = ConversationContextCache(
+    max_entries=settings.LLM_CONTEXT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CONTEXT_CACHE_TTL_SECONDS,
+    max_messages=get_settings().llm_context_window_messages,
+    redis=get_redis() if settings.LLM_CONTEXT_CACHE_REDIS_ENABLED else None,
+)
+
+llm_response_cache = (
+    LLMResponseCache(
+        max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+        redis=get_redis() if settings.LLM_RESPONSE_CACHE_REDIS_ENABLED else None,
+    )
+    if settings.LLM_RESPONSE_CACHE_ENABLED
+    else None
+)
+
+llm_rate_limiter = LLMRateLimiter(
+    parse_rate_limits(settings.LLM_RATE_LIMITS),
+    max_wait_seconds=settings.LLM_RATE_LIMIT_MAX_WAIT_SECONDS,
+    redis=get_redis() if settings.LLM_RATE_LIMIT_REDIS_ENABLED else None,
+)
+
+provider_router = ProviderRouter(
+    fallback_routes=parse_routes(settings.LLM_FALLBACK_ROUTES),
+    first_token_timeout_seconds=settings.LLM_FIRST_TOKEN_TIMEOUT_SECONDS,
+    hedging_enabled=settings.LLM_HEDGING_ENABLED,
+    breaker_config=CircuitBreakerConfig(
+        error_rate_threshold=settings.LLM_BREAKER_ERROR_RATE,
+        min_requests=settings.LLM_BREAKER_MIN_REQUESTS,
+        window_seconds=settings.LLM_BREAKER_WINDOW_SECONDS,
+        cooldown_seconds=settings.LLM_BREAKER_COOLDOWN_SECONDS,
+    ),
+    rate_limiter=llm_rate_limiter,
+)
 
 
 def _trim_preview(value: str | None, limit: int = 120) -> str | None:
@@ -49,9 +144,7 @@ def _serialize_provider_error(error: Exception) -> dict[str, Any]:
     response = getattr(error, "response", None)
     if response is not None:
         payload["response"] = (
-            response.model_dump()
-            if hasattr(response, "model_dump")
-            else str(response)
+            response.model_dump() if hasattr(response, "model_dump") else str(response)
         )
 
     return payload
@@ -85,7 +178,9 @@ async def _publish_stream_event(
     message_id: str,
     delta: str | None = None,
     friendly_message: str | None = None,
+    seq: int | None = None,
 ) -> None:
+    STREAM_PUBLISHES.inc(str(getattr(event_type, "value", event_type)))
     await get_publisher().publish(
         PROJECT_WORKSPACE_STREAM_TOPIC,
         PubSubEvent(
@@ -95,40 +190,42 @@ async def _publish_stream_event(
                 "message_id": message_id,
                 "delta": delta,
                 "friendly_message": friendly_message,
+                "seq": seq,
             },
         ),
     )
 
 
+def _insert_ignoring_conflicts(
+    session: AsyncSession, table: Table
+) -> PgInsert | SqliteInsert:
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+
 async def _create_streaming_message(
     *,
-    session,
-    conversation_id: str,
+    session: AsyncSession,
+    conversation: ProjectConversation,
     project_id: str,
     user_message_id: str,
     provider: str,
     model: str,
 ) -> ProjectConversationMessage | None:
-    message_dal = ProjectConversationMessageDAL(session)
-    existing = await message_dal.get_assistant_by_parent_message_id(
-        conversation_id=conversation_id,
-        parent_message_id=user_message_id,
-    )
-    if existing:
-        logger.info(
-            "Skipping duplicate LLM job for conversation=%s parent_message_id=%s existing_message_id=%s status=%s",
-            conversation_id,
-            user_message_id,
-            existing.id,
-            existing.status,
-        )
-        return None
-
+    """
+    Create the STREAMING reply for `user_message_id` unless one already exists.
+
+    Two statements and one commit: an INSERT ... SELECT that only inserts when
+    the parent has no assistant reply, then an UPDATE ... RETURNING for the
+    conversation counters. The message table has no unique index on the
+    parent, so on Postgres a transaction-scoped advisory lock on
+    (conversation_id, parent_message_id) serializes concurrent jobs for the
+    same turn; the one that waited sees the committed reply and skips.
+    """
+    conversation_id = str(conversation.id)
     now_epoch = get_current_epoch()
-    conversation = await session.get(ProjectConversation, conversation_id)
-    if conversation is None:
-        raise RuntimeError(f"Conversation {conversation_id} not found")
-
     message = ProjectConversationMessage(
         conversation_id=conversation_id,
         project_id=project_id,
@@ -140,19 +237,318 @@ async def _create_streaming_message(
         provider=provider,
         model=model,
     )
+    table = ProjectConversationMessage.__table__
+    # Client-side defaults (id, timestamps) come from the model; unset columns
+    # are left to the database.
+    values = {
+        column.key: getattr(message, column.key)
+        for column in table.columns
+        if getattr(message, column.key, None) is not None
+    }
+    existing_reply = select(table.c.id).where(
+        table.c.conversation_id == conversation_id,
+        table.c.parent_message_id == user_message_id,
+        table.c.role == ProjectConversationMessage.Role.ASSISTANT,
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    func.hashtext(conversation_id), func.hashtext(user_message_id)
+                )
+            )
+        )
+    inserted_id = await session.scalar(
+        _insert_ignoring_conflicts(session, table)
+        .from_select(
+            list(values),
+            select(
+                *(
+                    literal(value, type_=table.c[key].type)
+                    for key, value in values.items()
+                )
+            ).where(~exists(existing_reply)),
+        )
+        .on_conflict_do_nothing()
+        .returning(table.c.id)
+    )
+    if inserted_id is None:
+        # End the transaction so the advisory lock is not held past the check.
+        await session.commit()
+        logger.info(
+            "Skipping duplicate LLM job for conversation=%s parent_message_id=%s",
+            conversation_id,
+            user_message_id,
+        )
+        return None
+
+    message_count = await session.scalar(
+        update(ProjectConversation)
+        .where(ProjectConversation.id == conversation_id)
+        .values(
+            message_count=func.coalesce(ProjectConversation.message_count, 0) + 1,
+            last_message_at=now_epoch,
+            updated_at=now_epoch,
+        )
+        .returning(ProjectConversation.message_count)
+        .execution_options(synchronize_session=False)
+    )
+    if message_count is None:
+        await session.rollback()
+        raise RuntimeError(f"Conversation {conversation_id} not found")
+    with DB_COMMIT_SECONDS.time("create_message"):
+        await session.commit()
+
+    # The row is already written; attach it to the session without a reload.
+    message.id = inserted_id
+    make_transient_to_detached(message)
     session.add(message)
+    set_committed_value(  # type: ignore[no-untyped-call]
+        conversation, "message_count", message_count
+    )
+    return message
 
-    conversation.message_count = int(conversation.message_count or 0) + 1
-    conversation.last_message_at = now_epoch
-    conversation.updated_at = now_epoch
-    session.add(conversation)
 
+async def _take_over_streaming_message(
+    *,
+    session: AsyncSession,
+    conversation_id: str,
+    user_message_id: str,
+    provider: str,
+    model: str,
+    stale_before: int,
+) -> ProjectConversationMessage | None:
+    """
+    Restart a reclaimed job on the STREAMING reply its crashed worker left.
+
+    Only a reply not checkpointed since `stale_before` is taken, so a live
+    worker's row is never reset, and the conditional UPDATE lets a single
+    reclaiming consumer win. The partial text is dropped because the reply is
+    generated again from the start.
+    """
+    message = ProjectConversationMessage
+    message_id = await session.scalar(
+        update(message)
+        .where(
+            message.conversation_id == conversation_id,
+            message.parent_message_id == user_message_id,
+            message.role == message.Role.ASSISTANT,
+            message.status == message.Status.STREAMING,
+            message.updated_at < stale_before,
+        )
+        .values(
+            content_text="",
+            provider=provider,
+            model=model,
+            updated_at=get_current_epoch(),
+        )
+        .returning(message.id)
+        .execution_options(synchronize_session=False)
+    )
     await session.commit()
-    await session.refresh(message)
-    return message
+    if message_id is None:
+        return None
+    return await session.get(message, message_id, populate_existing=True)
+
+
+async def _has_streaming_reply(
+    session: AsyncSession, conversation_id: str, user_message_id: str
+) -> bool:
+    message = ProjectConversationMessage
+    reply_id = await session.scalar(
+        select(message.id)
+        .where(
+            message.conversation_id == conversation_id,
+            message.parent_message_id == user_message_id,
+            message.role == message.Role.ASSISTANT,
+            message.status == message.Status.STREAMING,
+        )
+        .limit(1)
+    )
+    return reply_id is not None
+
+
+async def _touch_conversation(
+    session: AsyncSession, conversation_id: str, preview: str | None, now_epoch: int
+) -> None:
+    await session.execute(
+        update(ProjectConversation)
+        .where(ProjectConversation.id == conversation_id)
+        .values(
+            last_message_preview=preview,
+            last_message_at=now_epoch,
+            updated_at=now_epoch,
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
-async def _handle_generate_assistant_response(event: PubSubEvent) -> None:
+async def _complete_assistant_message(
+    session: AsyncSession,
+    *,
+    request: LLMRequest,
+    assistant_message: ProjectConversationMessage,
+    full_text: str,
+    usage_json: dict[str, Any] | None,
+) -> None:
+    """
+    Finalize a completed reply: message UPDATE, conversation UPDATE and the
+    outbox INSERT, in one commit.
+    """
+    conversation_id = str(assistant_message.conversation_id)
+    now_epoch = get_current_epoch()
+    assistant_message.content_text = full_text
+    assistant_message.status = ProjectConversationMessage.Status.COMPLETED
+    assistant_message.usage_json = usage_json
+    assistant_message.updated_at = now_epoch
+    session.add(assistant_message)
+
+    await _touch_conversation(
+        session, conversation_id, _trim_preview(full_text), now_epoch
+    )
+
+    session.add(
+        EventOutbox(
+            entity_type="project_conversation_message",
+            entity_id=assistant_message.id,
+            datastore_id=getattr(request.context.project, "datastore_id", None),
+            old_status=None,
+            new_status="assistant_finalized",
+            payload={
+                "event_name": "project.assistant_message_finalized",
+                "project_id": request.context.project.id,
+                "conversation_id": conversation_id,
+                "message_id": assistant_message.id,
+                "parent_message_id": assistant_message.parent_message_id,
+                "provider": assistant_message.provider,
+                "model": assistant_message.model,
+                "usage_json": usage_json,
+            },
+            occurred_at=utcnow(),
+        )
+    )
+    with DB_COMMIT_SECONDS.time("complete_message"):
+        await session.commit()
+
+
+async def _fail_assistant_message(
+    session: AsyncSession,
+    *,
+    assistant_message: ProjectConversationMessage,
+    friendly_message: str,
+    error: Exception,
+) -> None:
+    now_epoch = get_current_epoch()
+    assistant_message.content_text = friendly_message
+    assistant_message.status = ProjectConversationMessage.Status.ERROR
+    assistant_message.provider_error_json = _serialize_provider_error(error)
+    assistant_message.updated_at = now_epoch
+    session.add(assistant_message)
+
+    await _touch_conversation(
+        session, str(assistant_message.conversation_id), friendly_message, now_epoch
+    )
+    with DB_COMMIT_SECONDS.time("fail_message"):
+        await session.commit()
+
+
+async def _checkpoint_partial_text(message_id: str, text: str, persisted: int) -> bool:
+    """
+    Append the unsaved tail of `text` to the STREAMING message.
+
+    The append only applies while the stored text is exactly `persisted`
+    characters long; otherwise (say an earlier append committed but reported
+    an error) the whole text is rewritten once to get back in step.
+    """
+    message = ProjectConversationMessage
+    stored = func.coalesce(message.content_text, "")
+    now_epoch = get_current_epoch()
+    # Own short session: a failed checkpoint must not roll back (and expire)
+    # the job session's objects, and the job's pending state is not committed.
+    try:
+        async for session in get_session():
+            appended_id = await session.scalar(
+                update(message)
+                .where(message.id == message_id, func.length(stored) == persisted)
+                .values(content_text=stored + text[persisted:], updated_at=now_epoch)
+                .returning(message.id)
+                .execution_options(synchronize_session=False)
+            )
+            if appended_id is None:
+                await session.execute(
+                    update(message)
+                    .where(message.id == message_id)
+                    .values(content_text=text, updated_at=now_epoch)
+                    .execution_options(synchronize_session=False)
+                )
+            with DB_COMMIT_SECONDS.time("checkpoint"):
+                await session.commit()
+            return True
+    except Exception:
+        logger.warning(
+            "Checkpoint failed for streaming message=%s", message_id, exc_info=True
+        )
+    return False
+
+
+async def _record_turn_in_context_cache(
+    conversation_id: str,
+    conversation: ProjectConversation,
+    message: HistoryMessage | None,
+) -> None:
+    # Errored turns stay out of the prompt but still advance the message count.
+    await conversation_context_cache.append(
+        conversation_id,
+        message,
+        message_count=int(conversation.message_count or 0),
+    )
+
+
+def _record_token_usage(
+    message: ProjectConversationMessage, usage: dict[str, Any] | None
+) -> None:
+    if not usage:
+        return
+    provider, model = str(message.provider), str(message.model)
+    for kind in ("prompt", "completion"):
+        tokens = usage.get(f"{kind}_tokens")
+        if tokens:
+            LLM_TOKENS.inc(provider, model, kind, amount=tokens)
+
+
+async def _wait_for_provider_capacity(
+    llm_service: LLMService, request: LLMRequest, conversation_id: str
+) -> None:
+    if request.cached_response is not None:
+        logger.info("Serving cached reply for conversation=%s", conversation_id)
+        return
+    # Queue briefly for provider capacity rather than provoking a 429.
+    waited = await llm_rate_limiter.acquire(
+        request.provider,
+        request.model,
+        llm_service.estimated_tokens(request),
+    )
+    if waited:
+        logger.info(
+            "LLM call for conversation=%s waited %.2fs for rate limit",
+            conversation_id,
+            waited,
+        )
+
+
+async def _handle_generate_assistant_response(
+    event: PubSubEvent, reclaimed: bool = False
+) -> str:
+    started = time.perf_counter()
+    with profile_job("generate_assistant_response"):
+        outcome = await _generate_assistant_response(event, reclaimed=reclaimed)
+    JOB_SECONDS.observe(time.perf_counter() - started, outcome)
+    return outcome
+
+
+async def _generate_assistant_response(
+    event: PubSubEvent, *, reclaimed: bool = False
+) -> str:
     payload = event.payload or {}
     conversation_id = str(payload.get("conversation_id") or "").strip()
     project_id = str(payload.get("project_id") or "").strip()
@@ -160,9 +556,17 @@ async def _handle_generate_assistant_response(event: PubSubEvent) -> None:
 
     if not conversation_id or not project_id or not user_message_id:
         logger.warning("Invalid LLM job payload: %r", payload)
-        return
+        return "invalid"
 
-    llm_service = LLMService()
+    llm_service = LLMService(
+        context_budget=ContextBudget(
+            max_context_tokens=settings.LLM_CONTEXT_MAX_TOKENS,
+            response_reserve_tokens=settings.LLM_RESPONSE_RESERVE_TOKENS,
+        ),
+        context_cache=conversation_context_cache,
+        router=provider_router,
+        response_cache=llm_response_cache,
+    )
     assistant_message_id: str | None = None
 
     try:
@@ -170,116 +574,296 @@ async def _handle_generate_assistant_response(event: PubSubEvent) -> None:
             request = await llm_service.build_request(
                 session=session,
                 conversation_id=conversation_id,
+                user_message_id=user_message_id,
             )
+            # Claim the turn before queueing for provider capacity, so a
+            # duplicate or in-progress job never reserves (or waits for) rate
+            # limit budget. Every claim path commits, so the wait below holds
+            # no pooled connection.
             assistant_message = await _create_streaming_message(
                 session=session,
-                conversation_id=conversation_id,
+                conversation=request.context.conversation,
                 project_id=project_id,
                 user_message_id=user_message_id,
                 provider=request.provider,
                 model=request.model,
             )
+            if assistant_message is None and reclaimed:
+                # The crashed worker's STREAMING reply would otherwise make
+                # the reclaimed job look like a duplicate and get it acked.
+                assistant_message = await _take_over_streaming_message(
+                    session=session,
+                    conversation_id=conversation_id,
+                    user_message_id=user_message_id,
+                    provider=request.provider,
+                    model=request.model,
+                    stale_before=get_current_epoch()
+                    - settings.PROJECT_WORKSPACE_JOB_CLAIM_IDLE_MS // 1000,
+                )
+                if assistant_message is None and await _has_streaming_reply(
+                    session, conversation_id, user_message_id
+                ):
+                    return "in_progress"
             if assistant_message is None:
-                return
+                return "duplicate"
             assistant_message_id = assistant_message.id
 
-            chunks: list[str] = []
             usage_json: dict[str, Any] | None = None
+            message_id = assistant_message.id
+
+            async def publish_chunk(text: str, seq: int) -> None:
+                await _publish_stream_event(
+                    EventType.PROJECT_ASSISTANT_CHUNK,
+                    conversation_id=conversation_id,
+                    message_id=message_id,
+                    delta=text,
+                    seq=seq,
+                )
+
+            async def write_checkpoint(text: str, persisted: int) -> bool:
+                return await _checkpoint_partial_text(message_id, text, persisted)
+
+            coalescer = StreamDeltaCoalescer(
+                publish_chunk,
+                max_bytes=settings.STREAM_COALESCE_MAX_BYTES,
+                window_seconds=settings.STREAM_COALESCE_WINDOW_MS / 1000,
+            )
+            checkpointer = StreamCheckpointer(
+                write_checkpoint,
+                min_bytes=settings.STREAM_CHECKPOINT_MIN_BYTES,
+                interval_seconds=settings.STREAM_CHECKPOINT_INTERVAL_SECONDS,
+            )
 
+            outcome = "completed"
             try:
-                async for stream_event in llm_service.stream_chat(request):
-                    if stream_event.delta:
-                        chunks.append(stream_event.delta)
-                        await _publish_stream_event(
-                            EventType.PROJECT_ASSISTANT_CHUNK,
-                            conversation_id=conversation_id,
-                            message_id=assistant_message.id,
-                            delta=stream_event.delta,
-                        )
-                    if stream_event.usage:
-                        usage_json = stream_event.usage
-
-                full_text = "".join(chunks)
-                now_epoch = get_current_epoch()
-                assistant_message.content_text = full_text
-                assistant_message.status = ProjectConversationMessage.Status.COMPLETED
-                assistant_message.usage_json = usage_json
-                assistant_message.updated_at = now_epoch
-                session.add(assistant_message)
-
-                conversation = await session.get(ProjectConversation, conversation_id)
-                if conversation is not None:
-                    conversation.last_message_preview = _trim_preview(full_text)
-                    conversation.last_message_at = now_epoch
-                    conversation.updated_at = now_epoch
-                    session.add(conversation)
-
-                session.add(
-                    EventOutbox(
-                        entity_type="project_conversation_message",
-                        entity_id=assistant_message.id,
-                        datastore_id=getattr(request.context.project, "datastore_id", None),
-                        old_status=None,
-                        new_status="assistant_finalized",
-                        payload={
-                            "event_name": "project.assistant_message_finalized",
-                            "project_id": request.context.project.id,
-                            "conversation_id": conversation_id,
-                            "message_id": assistant_message.id,
-                            "parent_message_id": assistant_message.parent_message_id,
-                            "provider": request.provider,
-                            "model": request.model,
-                            "usage_json": usage_json,
-                        },
-                        occurred_at=utcnow(),
-                    )
+                # A rejection is reported on the claimed reply like any error.
+                await _wait_for_provider_capacity(llm_service, request, conversation_id)
+                with span("llm", f"{request.provider}:{request.model}"):
+                    async for stream_event in llm_service.stream_chat(request):
+                        if stream_event.provider:
+                            assistant_message.provider = stream_event.provider
+                            assistant_message.model = stream_event.model
+                        if stream_event.delta:
+                            await coalescer.add(stream_event.delta)
+                            await checkpointer.add(stream_event.delta)
+                        if stream_event.usage:
+                            usage_json = stream_event.usage
+                await coalescer.close()
+
+                full_text = checkpointer.text
+                await _complete_assistant_message(
+                    session,
+                    request=request,
+                    assistant_message=assistant_message,
+                    full_text=full_text,
+                    usage_json=usage_json,
                 )
-                await session.commit()
+                _record_token_usage(assistant_message, usage_json)
 
                 await _publish_stream_event(
                     EventType.PROJECT_ASSISTANT_COMPLETED,
                     conversation_id=conversation_id,
                     message_id=assistant_message.id,
+                    seq=coalescer.next_seq,
+                )
+                await _record_turn_in_context_cache(
+                    conversation_id,
+                    request.context.conversation,
+                    (
+                        HistoryMessage(
+                            id=str(assistant_message.id),
+                            role="assistant",
+                            content=full_text.strip(),
+                        )
+                        if full_text.strip()
+                        else None
+                    ),
                 )
             except Exception as error:
+                outcome = "error"
                 logger.exception(
                     "LLM streaming failed for conversation=%s parent_message_id=%s",
                     conversation_id,
                     user_message_id,
                 )
+                coalescer.cancel()
                 friendly_message = _compose_friendly_error_message(error)
-                now_epoch = get_current_epoch()
-                assistant_message.content_text = friendly_message
-                assistant_message.status = ProjectConversationMessage.Status.ERROR
-                assistant_message.provider_error_json = _serialize_provider_error(error)
-                assistant_message.updated_at = now_epoch
-                session.add(assistant_message)
-
-                conversation = await session.get(ProjectConversation, conversation_id)
-                if conversation is not None:
-                    conversation.last_message_preview = friendly_message
-                    conversation.last_message_at = now_epoch
-                    conversation.updated_at = now_epoch
-                    session.add(conversation)
-
-                await session.commit()
+                await _fail_assistant_message(
+                    session,
+                    assistant_message=assistant_message,
+                    friendly_message=friendly_message,
+                    error=error,
+                )
 
                 await _publish_stream_event(
                     EventType.PROJECT_ASSISTANT_ERROR,
                     conversation_id=conversation_id,
                     message_id=assistant_message.id,
                     friendly_message=friendly_message,
+                    seq=coalescer.next_seq,
                 )
-            break
+                await _record_turn_in_context_cache(
+                    conversation_id, request.context.conversation, None
+                )
+            JOB_STREAM_PUBLISHES.observe(coalescer.publish_count + 1)
+            return outcome
     except Exception:
         logger.exception(
             "Project workspace LLM job handler crashed for conversation=%s message_id=%s",
             conversation_id,
             assistant_message_id,
         )
+    return "crashed"
+
 
+async def sweep_stale_streaming_messages() -> int:
+    """
+    Finalize STREAMING messages whose job is gone (e.g. the pod restarted).
+
+    A live stream refreshes updated_at with every checkpoint, so anything
+    older than STREAMING_STALE_AFTER_SECONDS has no writer left. The
+    checkpointed partial text is kept and the interruption noted after it.
+    The claim is a single conditional UPDATE, so replicas can sweep
+    concurrently.
+    """
+    now_epoch = get_current_epoch()
+    cutoff = now_epoch - settings.STREAMING_STALE_AFTER_SECONDS
+    message = ProjectConversationMessage
+    stale_ids = (
+        select(message.id)
+        .where(
+            message.status == message.Status.STREAMING,
+            message.updated_at < cutoff,
+        )
+        .limit(settings.STREAMING_SWEEP_BATCH_SIZE)
+        .scalar_subquery()
+    )
+    swept: list[tuple[str, str]] = []
+    async for session in get_session():
+        result = await session.execute(
+            update(message)
+            .where(
+                message.id.in_(stale_ids),
+                message.status == message.Status.STREAMING,
+            )
+            .values(
+                status=message.Status.ERROR,
+                content_text=case(
+                    (
+                        or_(message.content_text.is_(None), message.content_text == ""),
+                        INTERRUPTED_MESSAGE,
+                    ),
+                    else_=message.content_text + "\n\n" + INTERRUPTED_MESSAGE,
+                ),
+                provider_error_json={
+                    "type": "StreamInterrupted",
+                    "message": "Streaming job stopped before the reply completed",
+                },
+                updated_at=now_epoch,
+            )
+            .returning(message.id, message.conversation_id)
+            .execution_options(synchronize_session=False)
+        )
+        swept = [(str(row[0]), str(row[1])) for row in result.all()]
+        await session.commit()
+        break
+
+    for message_id, conversation_id in swept:
+        await _publish_stream_event(
+            EventType.PROJECT_ASSISTANT_ERROR,
+            conversation_id=conversation_id,
+            message_id=message_id,
+            friendly_message=INTERRUPTED_MESSAGE,
+        )
+        await conversation_context_cache.invalidate(conversation_id)
+    if swept:
+        logger.warning("Finalized %s stale streaming messages", len(swept))
+    return len(swept)
+
+
+async def run_streaming_sweeper() -> None:
+    """
+    Sweep once at startup, then every STREAMING_SWEEP_INTERVAL_SECONDS.
+    """
+    while True:
+        try:
+            while await sweep_stale_streaming_messages() >= (
+                settings.STREAMING_SWEEP_BATCH_SIZE
+            ):
+                pass
+        except Exception:
+            logger.exception("Streaming message sweep failed")
+        await asyncio.sleep(settings.STREAMING_SWEEP_INTERVAL_SECONDS)
+
+
+async def _handle_pubsub_job(event: PubSubEvent) -> None:
+    # Pub/sub deliveries are fire-and-forget, so the outcome is only recorded.
+    await _handle_generate_assistant_response(event)
+
+
+async def _handle_stream_job(job: StreamJob) -> None:
+    outcome = None
+    if job.event.event_type == EventType.GENERATE_ASSISTANT_RESPONSE:
+        outcome = await _handle_generate_assistant_response(
+            job.event, reclaimed=job.reclaimed
+        )
+    else:
+        logger.warning("Ignoring unsupported stream job type %s", job.event.event_type)
+    if outcome in ("in_progress", "crashed"):
+        # Either the reply is still being checkpointed elsewhere or the job hit
+        # a transient failure; leave the entry pending so it is reclaimed once
+        # idle. The consumer dead-letters it after too many deliveries.
+        logger.info("Leaving job %s pending (%s)", job.entry_id, outcome)
+        await job.release()
+        return
+    # Ack only once the job is finalized so a crash leaves it pending for reclaim.
+    await job.ack()
+
+
+def _uses_streams() -> bool:
+    return settings.PROJECT_WORKSPACE_JOB_TRANSPORT.strip().lower() == "streams"
+
+
+def project_workspace_job_stream() -> str:
+    return (
+        settings.PROJECT_WORKSPACE_JOB_STREAM
+        or f"{PROJECT_WORKSPACE_JOBS_TOPIC}:stream"
+    )
+
+
+def _job_conversation_key(job: PubSubEvent | StreamJob) -> str:
+    event = job.event if isinstance(job, StreamJob) else job
+    payload = event.payload or {}
+    return str(payload.get("conversation_id") or "").strip()
+
+
+def create_project_workspace_job_pool() -> JobWorkerPool:
+    return JobWorkerPool(
+        _handle_stream_job if _uses_streams() else _handle_pubsub_job,
+        concurrency=settings.PROJECT_WORKSPACE_JOB_CONCURRENCY,
+        max_pending=settings.PROJECT_WORKSPACE_JOB_MAX_PENDING,
+        key_fn=_job_conversation_key,
+        name="project_workspace_jobs",
+    )
+
+
+async def start_project_workspace_job_subscriber(pool: JobWorkerPool) -> None:
+    if _uses_streams():
+        redis = get_redis()
+        if redis is None:
+            raise RuntimeError("redis package is required for the streams transport")
+        consumer = RedisStreamJobConsumer(
+            redis,
+            stream=project_workspace_job_stream(),
+            group=settings.PROJECT_WORKSPACE_JOB_GROUP,
+            consumer=default_consumer_name(),
+            submit=pool.submit,
+            claim_idle_ms=settings.PROJECT_WORKSPACE_JOB_CLAIM_IDLE_MS,
+            max_deliveries=settings.PROJECT_WORKSPACE_JOB_MAX_DELIVERIES,
+        )
+        await consumer.run()
+        return
 
-async def start_project_workspace_job_subscriber() -> None:
     subscriber = get_subscriber()
     logger.info(
         "Starting Redis subscription for project workspace jobs on topic '%s'",
@@ -288,9 +872,7 @@ async def start_project_workspace_job_subscriber() -> None:
     await subscriber.subscribe(
         {
             PROJECT_WORKSPACE_JOBS_TOPIC: {
-                EventType.GENERATE_ASSISTANT_RESPONSE.value: (
-                    _handle_generate_assistant_response
-                ),
+                EventType.GENERATE_ASSISTANT_RESPONSE.value: pool.submit,
             }
         }
     )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from platform_common.constants.pubsub_topics import PROJECT_WORKSPACE_STREAM_TOPIC
+from platform_common.logging.logging import get_logger
+from platform_common.pubsub.event import PubSubEvent
+from platform_common.pubsub.factory import get_subscriber
+from platform_common.utils.enums import EventType
+
+from app.core.config import settings
+from app.pubsub.conversation_stream_hub import ConversationStreamHub
+
+logger = get_logger("project_management.project_workspace_stream_subscriber")
+
+# One hub and one topic subscription per process, shared by every SSE client.
+conversation_stream_hub = ConversationStreamHub(
+    buffer_size=settings.SSE_REPLAY_BUFFER_SIZE,
+    max_conversations=settings.SSE_REPLAY_MAX_CONVERSATIONS,
+    client_max_frames=settings.SSE_CLIENT_MAX_PENDING_FRAMES,
+    keepalive_seconds=settings.SSE_KEEPALIVE_SECONDS,
+)
+
+
+async def _dispatch(event: PubSubEvent) -> None:
+    conversation_stream_hub.publish(event.event_type, event.payload or {})
+
+
+async def start_project_workspace_stream_subscriber() -> None:
+    logger.info(
+        "Starting Redis subscription for assistant streams on topic '%s'",
+        PROJECT_WORKSPACE_STREAM_TOPIC,
+    )
+    await get_subscriber().subscribe(
+        {
+            PROJECT_WORKSPACE_STREAM_TOPIC: {
+                EventType.PROJECT_ASSISTANT_CHUNK.value: _dispatch,
+                EventType.PROJECT_ASSISTANT_COMPLETED.value: _dispatch,
+                EventType.PROJECT_ASSISTANT_ERROR.value: _dispatch,
+            }
+        }
+    )
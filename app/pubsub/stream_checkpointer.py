@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from typing import Awaitable, Callable
+
+# Called with the full text and how much of it is already stored; only the
+# rest needs writing. Returns whether the text is now persisted.
+WriteCheckpoint = Callable[[str, int], Awaitable[bool]]
+
+
+class StreamCheckpointer:
+    """
+    Accumulates an assistant reply and periodically persists the partial text.
+
+    A checkpoint is written once `min_bytes` of new text has arrived or
+    `interval_seconds` have passed since the last one, so a restart mid-stream
+    loses at most that much of the reply. Only text past the last successful
+    checkpoint is sent, so the bytes written grow linearly with the reply. Each
+    checkpoint also refreshes the message's updated_at, which is how the
+    sweeper tells live streams from abandoned ones.
+    """
+
+    def __init__(
+        self,
+        write: WriteCheckpoint,
+        *,
+        min_bytes: int,
+        interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._write = write
+        self._min_bytes = min_bytes
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._parts: list[str] = []
+        self._pending_bytes = 0
+        self._persisted_chars = 0
+        self._last_checkpoint_at = clock()
+        self.checkpoint_count = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    async def add(self, delta: str) -> None:
+        if not delta:
+            return
+        self._parts.append(delta)
+        self._pending_bytes += len(delta.encode("utf-8"))
+        if (
+            self._pending_bytes >= self._min_bytes
+            or self._clock() - self._last_checkpoint_at >= self._interval_seconds
+        ):
+            await self.checkpoint()
+
+    async def checkpoint(self) -> None:
+        if not self._pending_bytes:
+            return
+        self._pending_bytes = 0
+        self._last_checkpoint_at = self._clock()
+        self.checkpoint_count += 1
+        text = self.text
+        # A failed write leaves the offset alone; the next one resends its text.
+        if await self._write(text, self._persisted_chars):
+            self._persisted_chars = len(text)
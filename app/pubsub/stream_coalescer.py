@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+PublishChunk = Callable[[str, int], Awaitable[None]]
+
+
+class StreamDeltaCoalescer:
+    """
+    Buffers LLM stream deltas and publishes them as larger, sequenced chunks.
+
+    A chunk is flushed once the buffer reaches `max_bytes` or the oldest
+    buffered delta is `window_seconds` old. `close()` flushes whatever is left
+    and must be awaited before the stream is reported complete. With
+    `max_bytes <= 1` every delta is published on its own.
+    """
+
+    def __init__(
+        self,
+        publish: PublishChunk,
+        *,
+        max_bytes: int,
+        window_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._publish = publish
+        self._max_bytes = max_bytes
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._parts: list[str] = []
+        self._buffered_bytes = 0
+        self._first_buffered_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+        self.next_seq = 0
+        self.publish_count = 0
+
+    async def add(self, delta: str) -> None:
+        self._raise_deferred_error()
+        if not delta:
+            return
+        async with self._lock:
+            self._parts.append(delta)
+            self._buffered_bytes += len(delta.encode("utf-8"))
+            if self._first_buffered_at is None:
+                self._first_buffered_at = self._clock()
+
+            if (
+                self._buffered_bytes >= self._max_bytes
+                or self._clock() - self._first_buffered_at >= self._window_seconds
+            ):
+                await self._flush_locked()
+            elif self._timer is None and self._window_seconds > 0:
+                self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def close(self) -> None:
+        """
+        Flush the remaining buffer and stop the window timer.
+        """
+        self._cancel_timer()
+        self._raise_deferred_error()
+        async with self._lock:
+            await self._flush_locked()
+
+    def cancel(self) -> None:
+        """
+        Drop the window timer without publishing, e.g. when the stream failed.
+        """
+        self._cancel_timer()
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._window_seconds)
+        async with self._lock:
+            self._timer = None
+            try:
+                await self._flush_locked()
+            except Exception as error:
+                # Surface timer-driven publish failures to the stream loop.
+                self._error = error
+
+    def _raise_deferred_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    async def _flush_locked(self) -> None:
+        if not self._parts:
+            return
+        self._cancel_timer()
+        text = "".join(self._parts)
+        seq = self.next_seq
+        self._parts = []
+        self._buffered_bytes = 0
+        self._first_buffered_at = None
+        self.next_seq += 1
+        self.publish_count += 1
+        await self._publish(text, seq)
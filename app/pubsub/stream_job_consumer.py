@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from platform_common.logging.logging import get_logger
+from platform_common.pubsub.event import PubSubEvent
+
+logger = get_logger("project_management.stream_job_consumer")
+
+EVENT_FIELD = "event"
+
+
+@dataclass
+class StreamJob:
+    entry_id: str
+    event: PubSubEvent
+    ack: Callable[[], Awaitable[None]]
+    # Hands the entry back unacked, so it can be reclaimed again once idle.
+    release: Callable[[], Awaitable[None]]
+    # Set when the entry was taken over from another consumer via XAUTOCLAIM.
+    reclaimed: bool = False
+
+
+def default_consumer_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def encode_event(event: PubSubEvent) -> dict[str, str]:
+    return {
+        EVENT_FIELD: json.dumps(
+            {
+                "event_type": getattr(event.event_type, "value", event.event_type),
+                "payload": event.payload,
+            }
+        )
+    }
+
+
+async def add_job(
+    redis: Any, stream: str, event: PubSubEvent, maxlen: int | None = None
+) -> str:
+    """
+    Append a job to the stream; the producer-side counterpart of the consumer.
+    """
+    kwargs: dict[str, Any] = {}
+    if maxlen:
+        kwargs.update(maxlen=maxlen, approximate=True)
+    return str(await redis.xadd(stream, encode_event(event), **kwargs))
+
+
+def _entries(response: Any) -> list[tuple[str, dict[str, str]]]:
+    # XREADGROUP replies are [[stream, entries]] on RESP2 and {stream: ...} on RESP3.
+    if not response:
+        return []
+    if isinstance(response, dict):
+        groups = list(response.values())
+    else:
+        groups = [entries for _, entries in response]
+    entries: list[tuple[str, dict[str, str]]] = []
+    for group in groups:
+        if group and isinstance(group[0], list):
+            group = group[0]
+        entries.extend((str(entry_id), fields) for entry_id, fields in group)
+    return entries
+
+
+class RedisStreamJobConsumer:
+    """
+    Consumes jobs from a Redis Stream through a consumer group.
+
+    Each entry is delivered to exactly one consumer in the group and is only
+    XACKed after the job handler finishes. Entries left pending by a crashed
+    consumer for longer than `claim_idle_ms` are reclaimed with XAUTOCLAIM; an
+    entry delivered more than `max_deliveries` times is moved to the
+    dead-letter stream instead of being retried again.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        stream: str,
+        group: str,
+        consumer: str,
+        submit: Callable[[StreamJob], Awaitable[None]],
+        batch_size: int = 16,
+        block_ms: int = 5000,
+        claim_idle_ms: int = 60_000,
+        claim_interval_seconds: float = 30.0,
+        max_deliveries: int = 5,
+        dead_letter_stream: str | None = None,
+    ) -> None:
+        self._redis = redis
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self._submit = submit
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._claim_idle_ms = claim_idle_ms
+        self._claim_interval_seconds = claim_interval_seconds
+        self._max_deliveries = max_deliveries
+        self.dead_letter_stream = dead_letter_stream or f"{stream}:dead-letter"
+        self._in_flight: set[str] = set()
+        self.delivered = 0
+        self.acked = 0
+        self.reclaimed = 0
+        self.dead_lettered = 0
+
+    async def ensure_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except Exception as error:
+            if "BUSYGROUP" not in str(error):
+                raise
+
+    async def run(self) -> None:
+        await self.ensure_group()
+        logger.info(
+            "Consuming stream '%s' as %s/%s", self.stream, self.group, self.consumer
+        )
+        # Dispatch blocks while the worker pool is full, so the heartbeat runs
+        # on its own timer or held entries would go idle and be reclaimed.
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        loop = asyncio.get_running_loop()
+        next_claim_at = 0.0
+        try:
+            while True:
+                if loop.time() >= next_claim_at:
+                    await self.reclaim_stale()
+                    next_claim_at = loop.time() + self._claim_interval_seconds
+                await self.read_once()
+        finally:
+            heartbeat_task.cancel()
+            await asyncio.gather(heartbeat_task, return_exceptions=True)
+
+    async def read_once(self) -> int:
+        response = await self._redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: ">"},
+            count=self._batch_size,
+            block=self._block_ms,
+        )
+        entries = _entries(response)
+        for entry_id, fields in entries:
+            await self._dispatch(entry_id, fields)
+        return len(entries)
+
+    async def heartbeat(self) -> None:
+        """
+        Reset the idle time of entries still being processed here, so other
+        consumers do not reclaim long-running jobs from a live worker.
+        """
+        if self._in_flight:
+            await self._redis.xclaim(
+                self.stream,
+                self.group,
+                self.consumer,
+                0,
+                sorted(self._in_flight),
+                justid=True,
+            )
+
+    async def _heartbeat_loop(self) -> None:
+        # Three beats per idle window, so one slow or failed beat is harmless.
+        interval = min(self._claim_interval_seconds, self._claim_idle_ms / 3000)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.heartbeat()
+            except Exception:
+                logger.warning(
+                    "Heartbeat failed for stream '%s'", self.stream, exc_info=True
+                )
+
+    async def reclaim_stale(self) -> int:
+        """
+        Take over entries other consumers read but never acknowledged.
+        """
+        claimed = 0
+        start_id = "0-0"
+        while True:
+            response = await self._redis.xautoclaim(
+                self.stream,
+                self.group,
+                self.consumer,
+                min_idle_time=self._claim_idle_ms,
+                start_id=start_id,
+                count=self._batch_size,
+            )
+            start_id, entries = str(response[0]), response[1]
+            for entry_id, fields in entries:
+                entry_id = str(entry_id)
+                if fields is None or entry_id in self._in_flight:
+                    continue
+                if await self._deliveries(entry_id) > self._max_deliveries:
+                    await self.dead_letter(entry_id, fields)
+                    continue
+                claimed += 1
+                await self._dispatch(entry_id, fields, reclaimed=True)
+            if start_id == "0-0" or not entries:
+                break
+        if claimed:
+            self.reclaimed += claimed
+            logger.warning(
+                "Reclaimed %s stale entries from stream '%s'", claimed, self.stream
+            )
+        return claimed
+
+    async def ack(self, entry_id: str) -> None:
+        await self._redis.xack(self.stream, self.group, entry_id)
+        self._in_flight.discard(entry_id)
+        self.acked += 1
+
+    async def release(self, entry_id: str) -> None:
+        # Stop the heartbeat for the entry without acking it.
+        self._in_flight.discard(entry_id)
+
+    async def dead_letter(self, entry_id: str, fields: dict[str, str]) -> None:
+        """
+        Park an entry that keeps failing on the dead-letter stream and ack it.
+        """
+        await self._redis.xadd(
+            self.dead_letter_stream, {**fields, "source_id": entry_id}
+        )
+        await self.ack(entry_id)
+        self.dead_lettered += 1
+        logger.error(
+            "Moved stream entry %s to '%s' after %s deliveries",
+            entry_id,
+            self.dead_letter_stream,
+            self._max_deliveries,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "stream": self.stream,
+            "group": self.group,
+            "consumer": self.consumer,
+            "delivered": self.delivered,
+            "acked": self.acked,
+            "reclaimed": self.reclaimed,
+            "dead_lettered": self.dead_lettered,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def _deliveries(self, entry_id: str) -> int:
+        # XAUTOCLAIM counts as a delivery; the heartbeat's JUSTID XCLAIM does not.
+        pending = await self._redis.xpending_range(
+            self.stream, self.group, min=entry_id, max=entry_id, count=1
+        )
+        return int(pending[0]["times_delivered"]) if pending else 0
+
+    async def _dispatch(
+        self, entry_id: str, fields: dict[str, str], reclaimed: bool = False
+    ) -> None:
+        try:
+            raw = json.loads(fields[EVENT_FIELD])
+            event = PubSubEvent(event_type=raw["event_type"], payload=raw["payload"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Dropping malformed stream entry %s: %r", entry_id, fields)
+            await self.ack(entry_id)
+            return
+
+        async def ack() -> None:
+            await self.ack(entry_id)
+
+        async def release() -> None:
+            await self.release(entry_id)
+
+        self.delivered += 1
+        self._in_flight.add(entry_id)
+        await self._submit(
+            StreamJob(
+                entry_id=entry_id,
+                event=event,
+                ack=ack,
+                release=release,
+                reclaimed=reclaimed,
+            )
+        )
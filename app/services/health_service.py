@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+
+from platform_common.logging.logging import get_logger
+
+from app.core.config import settings
+from app.core.redis_client import get_redis
+from app.db.session import get_probe_engine
+
+logger = get_logger("health")
+
+# A check returns "ok" or "skipped", or raises when the dependency is unhealthy.
+Check = Callable[[Any], Awaitable[str]]
+
+
+async def check_database(app: Any) -> str:
+    # A dedicated connection: waiting on the shared pool would report a busy
+    # pod as unready and pull it from rotation exactly when it has work.
+    async with get_probe_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return "ok"
+
+
+async def check_redis(app: Any) -> str:
+    redis = get_redis()
+    if redis is None:
+        return "skipped"
+    await redis.ping()
+    return "ok"
+
+
+async def check_job_subscriber(app: Any) -> str:
+    """
+    The pub/sub subscriber may return once its handlers are registered, so a
+    finished task is only unhealthy when it was cancelled or raised. The
+    streams consumer loops until cancelled and can only stop by raising.
+    """
+    task = getattr(app.state, "project_workspace_job_task", None)
+    if task is None:
+        raise RuntimeError("job subscriber not started")
+    if not task.done():
+        return "ok"
+    if task.cancelled():
+        raise RuntimeError("job subscriber cancelled")
+    error = task.exception()
+    if error is not None:
+        raise RuntimeError(f"job subscriber stopped: {error!r}")
+    return "ok"
+
+
+class ReadinessProbe:
+    """
+    Runs the readiness checks at most once per `ttl_seconds` and serves the
+    cached result in between, so frequent orchestrator probes cost a dict
+    lookup. Concurrent probes that find the result stale share one run.
+    """
+
+    def __init__(
+        self,
+        checks: dict[str, Check],
+        *,
+        ttl_seconds: float,
+        timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._checks = checks
+        self._ttl_seconds = ttl_seconds
+        self._timeout_seconds = timeout_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._result: dict[str, Any] | None = None
+        self._checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return (
+            self._result is not None
+            and self._clock() - self._checked_at < self._ttl_seconds
+        )
+
+    async def check(self, app: Any) -> dict[str, Any]:
+        if self._fresh():
+            return self._result  # type: ignore[return-value]
+        async with self._lock:
+            if not self._fresh():
+                self._record(await self._run(app))
+        return self._result  # type: ignore[return-value]
+
+    async def _run(self, app: Any) -> dict[str, Any]:
+        names = list(self._checks)
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(check(app), self._timeout_seconds)
+                for check in self._checks.values()
+            ),
+            return_exceptions=True,
+        )
+        checks: dict[str, Any] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                error = "timeout" if isinstance(outcome, TimeoutError) else outcome
+                checks[name] = {"status": "error", "error": str(error)}
+            else:
+                checks[name] = {"status": outcome}
+        ready = all(check["status"] != "error" for check in checks.values())
+        return {"status": "ready" if ready else "unready", "checks": checks}
+
+    def _record(self, result: dict[str, Any]) -> None:
+        previous = self._result["status"] if self._result else "ready"
+        if result["status"] != previous:
+            # Only transitions are logged; steady-state probes stay silent.
+            if result["status"] == "ready":
+                logger.info("Service is ready again.")
+            else:
+                logger.warning(f"Service is not ready: {result['checks']}")
+        self._result = result
+        self._checked_at = self._clock()
+
+
+readiness_probe = ReadinessProbe(
+    {
+        "database": check_database,
+        "redis": check_redis,
+        "job_subscriber": check_job_subscriber,
+    },
+    ttl_seconds=settings.HEALTH_READY_CACHE_SECONDS,
+    timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+)
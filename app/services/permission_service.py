@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from platform_common.auth.guards import require_project_perm_by_id
+from platform_common.auth.permissions import can, require_perm
+from platform_common.logging.logging import get_logger
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from services.metrics import registry
+
+logger = get_logger("permission_service")
+
+DecisionKey = tuple[str, str, int]
+
+# Cross-request decisions keyed by (user_id, resource_id, perm_bit). Project
+# changes made here invalidate their entries; membership and role changes are
+# made by other services, so those reach this cache when entries expire.
+permission_cache: TTLCache[bool] = TTLCache(
+    name="permission_decisions",
+    maxsize=settings.PERMISSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PERMISSION_CACHE_TTL_SECONDS,
+)
+
+_request_memo_hits = 0
+
+PERMISSION_DECISIONS = registry.counter(
+    "permission_decisions", "Permission checks by where they were decided.", ("source",)
+)
+PERMISSION_CHECK_SECONDS = registry.histogram(
+    "permission_check_seconds", "Latency of uncached permission checks."
+)
+
+
+def _request_memo(request: Request | None) -> dict[DecisionKey, bool] | None:
+    if request is None:
+        return None
+    memo = getattr(request.state, "permission_memo", None)
+    if memo is None:
+        memo = {}
+        request.state.permission_memo = memo
+    return memo
+
+
+def _lookup(request: Request | None, key: DecisionKey) -> bool | None:
+    global _request_memo_hits
+    memo = _request_memo(request)
+    if memo is not None and key in memo:
+        _request_memo_hits += 1
+        return memo[key]
+    decision = permission_cache.get(key)
+    if decision is not None and memo is not None:
+        memo[key] = decision
+    return decision
+
+
+def _remember(request: Request | None, key: DecisionKey, allowed: bool) -> None:
+    permission_cache.set(key, allowed)
+    memo = _request_memo(request)
+    if memo is not None:
+        memo[key] = allowed
+
+
+def invalidate_resource(resource_id: str) -> int:
+    """
+    Drop cached decisions for a resource, e.g. after ownership changes.
+    """
+    return permission_cache.delete_where(lambda key: key[1] == str(resource_id))
+
+
+def permission_cache_stats() -> dict[str, Any]:
+    return {**permission_cache.stats(), "request_memo_hits": _request_memo_hits}
+
+
+async def check_perm(
+    *,
+    request: Request | None,
+    session: AsyncSession,
+    user_id: str,
+    perm_bit: int,
+    resource_type: str,
+    resource_obj: Any,
+) -> bool:
+    key = (str(user_id), str(resource_obj.id), perm_bit)
+    cached = _lookup(request, key)
+    if cached is not None:
+        PERMISSION_DECISIONS.inc("cache")
+        return cached
+
+    PERMISSION_DECISIONS.inc("db")
+    with PERMISSION_CHECK_SECONDS.time():
+        allowed = await can(
+            session=session,
+            user_id=user_id,
+            perm_bit=perm_bit,
+            resource_type=resource_type,
+            resource_obj=resource_obj,
+        )
+    _remember(request, key, allowed)
+    return allowed
+
+
+async def require_perm_cached(
+    *,
+    request: Request | None,
+    session: AsyncSession,
+    user_id: str,
+    perm_bit: int,
+    resource_type: str,
+    resource_obj: Any,
+) -> None:
+    allowed = await check_perm(
+        request=request,
+        session=session,
+        user_id=user_id,
+        perm_bit=perm_bit,
+        resource_type=resource_type,
+        resource_obj=resource_obj,
+    )
+    if not allowed:
+        # Let the shared guard raise so denials keep their canonical error.
+        await require_perm(
+            session=session,
+            user_id=user_id,
+            perm_bit=perm_bit,
+            resource_type=resource_type,
+            resource_obj=resource_obj,
+        )
+
+
+async def require_project_perm_by_id_cached(
+    *,
+    request: Request | None,
+    session: AsyncSession,
+    user_id: str,
+    project_id: str,
+    perm_bit: int,
+) -> None:
+    key = (str(user_id), str(project_id), perm_bit)
+    if _lookup(request, key):
+        PERMISSION_DECISIONS.inc("cache")
+        return
+
+    # Only grants are cached here; a denial raises out of the guard.
+    PERMISSION_DECISIONS.inc("db")
+    with PERMISSION_CHECK_SECONDS.time():
+        await require_project_perm_by_id(
+            session=session,
+            user_id=user_id,
+            project_id=project_id,
+            perm_bit=perm_bit,
+        )
+    _remember(request, key, True)
+
+
+def _is_personal_owner(resource_obj: Any, user_id: str) -> bool:
+    # A user-owned resource grants every bit to its owner, so no lookup is needed.
+    owner_type = str(getattr(resource_obj, "owner_type", "") or "").lower()
+    return owner_type == "user" and getattr(resource_obj, "owner_id", None) == user_id
+
+
+def _organization_id(resource_obj: Any) -> str | None:
+    owner_type = str(getattr(resource_obj, "owner_type", "") or "").lower()
+    organization_id = getattr(resource_obj, "organization_id", None)
+    if owner_type in {"org", "organization"} and organization_id:
+        return str(organization_id)
+    return None
+
+
+async def _org_role_grants(
+    *,
+    session: AsyncSession,
+    user_id: str,
+    perm_bit: int,
+    resource_type: str,
+    organization_id: str,
+    request: Request | None,
+) -> bool:
+    """
+    Whether the user's org membership alone grants `perm_bit` on the org's
+    resources, decided once per org with `can` on a resource that has no
+    per-resource grants of its own.
+    """
+    key = (str(user_id), f"organization:{organization_id}", perm_bit)
+    cached = _lookup(request, key)
+    if cached is not None:
+        return cached
+    PERMISSION_DECISIONS.inc("db")
+    with PERMISSION_CHECK_SECONDS.time():
+        allowed = await can(
+            session=session,
+            user_id=user_id,
+            perm_bit=perm_bit,
+            resource_type=resource_type,
+            resource_obj=SimpleNamespace(
+                id=key[1],
+                owner_type="org",
+                owner_id=None,
+                organization_id=organization_id,
+            ),
+        )
+    _remember(request, key, allowed)
+    return allowed
+
+
+async def can_many(
+    *,
+    session: AsyncSession,
+    user_id: str,
+    perm_bit: int,
+    resource_type: str,
+    resource_objs: Iterable[Any],
+    request: Request | None = None,
+) -> dict[str, bool]:
+    """
+    Resolve one permission bit for a set of resources.
+
+    Personally owned resources are decided in memory and the rest come from the
+    decision cache where possible. Uncached org resources are resolved with one
+    membership lookup per organization; only those the org role does not cover
+    fall back to `can` per resource, for their own grants.
+    """
+    decisions: dict[str, bool] = {}
+    pending: list[Any] = []
+
+    for resource_obj in resource_objs:
+        resource_id = str(resource_obj.id)
+        if resource_id in decisions:
+            continue
+        if _is_personal_owner(resource_obj, user_id):
+            decisions[resource_id] = True
+            continue
+        cached = _lookup(request, (str(user_id), resource_id, perm_bit))
+        if cached is not None:
+            decisions[resource_id] = cached
+        else:
+            decisions[resource_id] = False
+            pending.append(resource_obj)
+
+    by_org: dict[str, list[Any]] = {}
+    for resource_obj in pending:
+        organization_id = _organization_id(resource_obj)
+        if organization_id:
+            by_org.setdefault(organization_id, []).append(resource_obj)
+    lookups = 0
+    granted: set[str] = set()
+    for organization_id, org_resources in by_org.items():
+        if len(org_resources) < 2:
+            continue  # A single resource costs one lookup either way.
+        lookups += 1
+        if await _org_role_grants(
+            session=session,
+            user_id=user_id,
+            perm_bit=perm_bit,
+            resource_type=resource_type,
+            organization_id=organization_id,
+            request=request,
+        ):
+            for resource_obj in org_resources:
+                resource_id = str(resource_obj.id)
+                _remember(request, (str(user_id), resource_id, perm_bit), True)
+                decisions[resource_id] = True
+                granted.add(resource_id)
+    pending = [obj for obj in pending if str(obj.id) not in granted]
+
+    for resource_obj in pending:
+        lookups += 1
+        allowed = await can(
+            session=session,
+            user_id=user_id,
+            perm_bit=perm_bit,
+            resource_type=resource_type,
+            resource_obj=resource_obj,
+        )
+        _remember(request, (str(user_id), str(resource_obj.id), perm_bit), allowed)
+        decisions[str(resource_obj.id)] = allowed
+
+    if lookups:
+        logger.debug(
+            f"can_many resolved {len(decisions)} resources with "
+            f"{lookups} permission lookups"
+        )
+    return decisions
+
+
+async def filter_permitted(
+    *,
+    session: AsyncSession,
+    user_id: str,
+    perm_bit: int,
+    resource_type: str,
+    resource_objs: list[Any],
+    request: Request | None = None,
+) -> list[Any]:
+    """
+    Return the resources the user holds `perm_bit` on, preserving input order.
+    """
+    decisions = await can_many(
+        session=session,
+        user_id=user_id,
+        perm_bit=perm_bit,
+        resource_type=resource_type,
+        resource_objs=resource_objs,
+        request=request,
+    )
+    return [obj for obj in resource_objs if decisions.get(str(obj.id))]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any
+
+from platform_common.logging.logging import get_logger
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis_client import get_redis
+
+logger = get_logger("project_cache")
+
+REDIS_KEY_PREFIX = "project-management:project:"
+INVALIDATION_CHANNEL = "project-management:project-invalidations"
+
+
+def project_etag(data: dict[str, Any]) -> str:
+    """
+    Strong ETag for a serialized project, derived from the whole body so any
+    field change yields a new tag even when updated_at does not move.
+    """
+    body = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ProjectCache:
+    """
+    Read-through cache of JSON-serialized projects.
+
+    The in-process LRU is always used; Redis is a shared second tier when
+    PROJECT_CACHE_REDIS_ENABLED is set. Redis failures degrade to a miss.
+
+    Invalidations are published on INVALIDATION_CHANNEL so that other replicas
+    drop their local copies (see `listen_for_invalidations`). Without Redis, or
+    while the listener is disconnected, a replica may serve a project changed
+    elsewhere for up to PROJECT_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self._local: TTLCache[dict[str, Any]] = TTLCache(
+            name="projects",
+            maxsize=settings.PROJECT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.PROJECT_CACHE_TTL_SECONDS,
+        )
+        self.redis_hits = 0
+        self.redis_errors = 0
+        self.remote_invalidations = 0
+
+    def _redis(self) -> Any:
+        return get_redis() if settings.PROJECT_CACHE_REDIS_ENABLED else None
+
+    async def get(self, project_id: str) -> dict[str, Any] | None:
+        data = self._local.get(project_id)
+        if data is not None:
+            return data
+
+        redis = self._redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(f"{REDIS_KEY_PREFIX}{project_id}")
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Project cache read failed for {project_id}: {e}")
+            return None
+        if raw is None:
+            return None
+
+        self.redis_hits += 1
+        data = json.loads(raw)
+        self._local.set(project_id, data)
+        return data
+
+    async def set(self, project_id: str, data: dict[str, Any]) -> None:
+        self._local.set(project_id, data)
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                f"{REDIS_KEY_PREFIX}{project_id}",
+                json.dumps(data),
+                ex=settings.PROJECT_CACHE_REDIS_TTL_SECONDS,
+            )
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Project cache write failed for {project_id}: {e}")
+
+    async def invalidate(self, project_id: str) -> None:
+        self._local.delete(project_id)
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(f"{REDIS_KEY_PREFIX}{project_id}")
+            await redis.publish(INVALIDATION_CHANNEL, project_id)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Project cache invalidation failed for {project_id}: {e}")
+
+    async def listen_for_invalidations(self, retry_seconds: float = 1.0) -> None:
+        """
+        Drop local entries invalidated by other replicas until cancelled.
+
+        The local tier is cleared on every (re)subscribe, since invalidations
+        published while disconnected are lost.
+        """
+        redis = self._redis()
+        if redis is None:
+            return
+        while True:
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    self._local.clear()
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        self._local.delete(message["data"])
+                        self.remote_invalidations += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Project cache invalidation listener failed: {e}")
+                await asyncio.sleep(retry_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._local.stats(),
+            "redis_hits": self.redis_hits,
+            "redis_errors": self.redis_errors,
+            "remote_invalidations": self.remote_invalidations,
+        }
+
+
+project_cache = ProjectCache()
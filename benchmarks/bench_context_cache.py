@@ -0,0 +1,149 @@
+"""
+Context-build round-trips and latency over a multi-turn conversation.
+
+Runs TURNS user/assistant turns through `build_context`, with and without a
+ConversationContextCache. DAL calls are faked; each query costs
+ROUND_TRIP_SECONDS and is counted.
+
+    python -m benchmarks.bench_context_cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from services.llm import context_builder
+from services.llm.context_cache import ConversationContextCache
+from services.llm.token_budget import HistoryMessage
+
+ROUND_TRIP_SECONDS = 0.002
+TURNS = 40
+WINDOW_MESSAGES = 50
+CONVERSATION_ID = "conversation-1"
+
+
+class _Row(SimpleNamespace):
+    Status = SimpleNamespace(ERROR="error")
+
+
+class _FakeStore:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.project = SimpleNamespace(
+            id="project-1", llm_system_prompt=None, llm_model_override=None
+        )
+        self.conversation = SimpleNamespace(
+            id=CONVERSATION_ID, project_id="project-1", message_count=0
+        )
+        self.rows: dict[str, _Row] = {}
+
+    async def query(self) -> None:
+        self.queries += 1
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+    def add_message(self, role: str, content: str) -> _Row:
+        row = _Row(
+            id=f"m{len(self.rows)}",
+            conversation_id=CONVERSATION_ID,
+            role=role,
+            status="complete",
+            content_text=content,
+        )
+        self.rows[row.id] = row
+        self.conversation.message_count += 1
+        return row
+
+
+def _patch_dals(store: _FakeStore) -> None:
+    class ConversationDAL:
+        def __init__(self, session: Any) -> None:
+            pass
+
+        async def get_active(self, conversation_id: str) -> Any:
+            await store.query()
+            return store.conversation
+
+    class ProjectDAL:
+        def __init__(self, session: Any) -> None:
+            pass
+
+        async def get_by_id(self, project_id: str) -> Any:
+            await store.query()
+            return store.project
+
+    class MessageDAL:
+        def __init__(self, session: Any) -> None:
+            pass
+
+        async def list_recent_for_conversation(
+            self, conversation_id: str, limit: int
+        ) -> list[_Row]:
+            await store.query()
+            return list(store.rows.values())[-limit:]
+
+    context_builder.ProjectConversationDAL = ConversationDAL  # type: ignore
+    context_builder.ProjectDAL = ProjectDAL  # type: ignore
+    context_builder.ProjectConversationMessageDAL = MessageDAL  # type: ignore
+    context_builder.get_settings = lambda: SimpleNamespace(  # type: ignore
+        llm_context_window_messages=WINDOW_MESSAGES,
+        llm_default_model="gpt-4o",
+    )
+
+
+async def _run(cache: ConversationContextCache | None) -> dict[str, float]:
+    store = _FakeStore()
+    _patch_dals(store)
+
+    async def get(model: Any, message_id: str) -> Any:
+        await store.query()
+        return store.rows.get(message_id)
+
+    session = SimpleNamespace(get=get)
+    latencies: list[float] = []
+    for turn in range(TURNS):
+        user = store.add_message("user", f"question {turn} " * 20)
+        started = time.perf_counter()
+        await context_builder.build_context(
+            session,  # type: ignore[arg-type]
+            CONVERSATION_ID,
+            cache=cache,
+            user_message_id=user.id,
+        )
+        latencies.append(time.perf_counter() - started)
+
+        reply = store.add_message("assistant", f"answer {turn} " * 40)
+        if cache is not None:
+            await cache.append(
+                CONVERSATION_ID,
+                HistoryMessage(
+                    id=reply.id, role="assistant", content=reply.content_text
+                ),
+                message_count=store.conversation.message_count,
+            )
+
+    return {
+        "queries_per_turn": store.queries / TURNS,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[18] * 1000,
+    }
+
+
+async def main() -> None:
+    print(f"{'mode':>8} {'queries/turn':>12} {'p50 ms':>7} {'p95 ms':>7}")
+    for label, cache in (
+        ("uncached", None),
+        ("cached", ConversationContextCache(max_messages=WINDOW_MESSAGES)),
+    ):
+        result = await _run(cache)
+        print(
+            f"{label:>8} {result['queries_per_turn']:>12.2f} "
+            f"{result['p50_ms']:>7.1f} {result['p95_ms']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+Connection pool saturation benchmark.
+
+Runs REQUESTS unit-of-work tasks at each CONCURRENCY level against an engine
+built by `app.db.session.build_engine`. Each task checks out a connection,
+runs `SELECT 1` and holds the connection for HOLD_MS, standing in for a
+handler's transaction. Reports requests/sec, the time spent waiting for a
+connection, pool timeouts and peak utilization; once concurrency passes
+pool_size + max_overflow, throughput flattens and the wait grows instead.
+
+    python -m benchmarks.bench_db_pool --pool-size 5 --max-overflow 5 \\
+        --concurrency 5,10,20,40
+
+Pass --url to run against Postgres; the default is a temporary SQLite file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import exc, text
+
+from app.db.session import build_engine, pool_stats
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+
+async def _run_level(
+    engine: Any, concurrency: int, args: argparse.Namespace
+) -> dict[str, float]:
+    waits: list[float] = []
+    timeouts = 0
+    peak = 0.0
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining, timeouts, peak
+        while remaining > 0:
+            remaining -= 1
+            requested = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    waits.append((time.perf_counter() - requested) * 1000)
+                    stats = pool_stats(engine, max_overflow=args.max_overflow)
+                    peak = max(peak, (stats or {}).get("utilization") or 0.0)
+                    await conn.execute(text("SELECT 1"))
+                    await asyncio.sleep(args.hold_ms / 1000)
+            except exc.TimeoutError:
+                timeouts += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests_per_sec": args.requests / elapsed,
+        "wait_p50_ms": _percentile(waits, 50),
+        "wait_p95_ms": _percentile(waits, 95),
+        "timeouts": timeouts,
+        "peak_utilization": peak,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(
+            args.url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+            pool_size=args.pool_size,
+            max_overflow=args.max_overflow,
+            pool_timeout=args.pool_timeout,
+        )
+        results = []
+        for level in args.concurrency:
+            results.append(await _run_level(engine, level, args))
+        await engine.dispose()
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=5)
+    parser.add_argument("--pool-timeout", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--hold-ms", type=float, default=20.0)
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=[5, 10, 20, 40],
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    results = asyncio.run(run(_parse_args()))
+    columns = list(results[0])
+    print(" ".join(f"{column:>17}" for column in columns))
+    for result in results:
+        print(" ".join(f"{result[column]:>17.2f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Load test for the assistant job pipeline.
+
+Pushes JOBS GENERATE_ASSISTANT_RESPONSE jobs, one conversation each, through
+`_handle_pubsub_job` on a JobWorkerPool with CONCURRENCY workers. The database
+is SQLite, the provider is a FakeProvider and pub/sub is an InMemoryPubSub, so
+a run needs no API keys or Redis. Reports jobs/sec, time to first published
+chunk, publishes per job and SQL statements per job; compare runs before and
+after a change.
+
+    python -m benchmarks.bench_job_pipeline --jobs 200 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from platform_common.models.event_outbox import EventOutbox
+from platform_common.models.project import Project
+from platform_common.models.project_conversation import ProjectConversation
+from platform_common.models.project_conversation_message import (
+    ProjectConversationMessage,
+)
+from platform_common.pubsub.event import PubSubEvent
+from platform_common.utils.enums import EventType
+
+from app.pubsub import project_workspace_job_subscriber as subscriber
+from app.pubsub.in_memory_pubsub import InMemoryPubSub
+from app.pubsub.job_worker_pool import JobWorkerPool
+from services.llm import context_builder, llm_service
+from services.llm.fake_provider import FakeProvider, FakeProviderConfig
+from services.llm.provider_factory import (
+    ProviderFactory,
+    close_provider_factory,
+    configure_provider_factory,
+)
+from tests.support import model_row
+
+TABLES = [
+    Project.__table__,
+    ProjectConversation.__table__,
+    ProjectConversationMessage.__table__,
+    EventOutbox.__table__,
+]
+PROJECT_ID = "bench-project"
+
+
+async def _seed(engine: Any, jobs: int) -> list[PubSubEvent]:
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+        )
+
+    events = []
+    async with AsyncSession(engine) as session:
+        session.add(model_row(Project, id=PROJECT_ID))
+        for index in range(jobs):
+            conversation_id = f"conversation-{index}"
+            message_id = f"user-message-{index}"
+            session.add(
+                model_row(
+                    ProjectConversation,
+                    id=conversation_id,
+                    project_id=PROJECT_ID,
+                    message_count=1,
+                )
+            )
+            session.add(
+                model_row(
+                    ProjectConversationMessage,
+                    id=message_id,
+                    conversation_id=conversation_id,
+                    project_id=PROJECT_ID,
+                    role=ProjectConversationMessage.Role.USER,
+                    status=ProjectConversationMessage.Status.COMPLETED,
+                    content_text=f"How do I set up project {index}?",
+                )
+            )
+            events.append(
+                PubSubEvent(
+                    event_type=EventType.GENERATE_ASSISTANT_RESPONSE,
+                    payload={
+                        "conversation_id": conversation_id,
+                        "project_id": PROJECT_ID,
+                        "user_message_id": message_id,
+                    },
+                )
+            )
+        await session.commit()
+    return events
+
+
+def _patch(engine: Any, pubsub: InMemoryPubSub, fake: FakeProvider) -> None:
+    async def get_session():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    llm_settings = SimpleNamespace(
+        llm_default_provider=fake.name,
+        llm_default_model="fake-model",
+        llm_temperature=0.0,
+        llm_context_window_messages=50,
+    )
+    subscriber.get_session = get_session  # type: ignore[assignment]
+    subscriber.get_publisher = lambda: pubsub  # type: ignore[assignment]
+    llm_service.get_settings = lambda: llm_settings  # type: ignore[assignment]
+    context_builder.get_settings = lambda: llm_settings  # type: ignore
+    configure_provider_factory(ProviderFactory()).register(fake)
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+
+async def run(args: argparse.Namespace) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+            connect_args={"timeout": 30},
+        )
+        jobs = await _seed(engine, args.jobs)
+
+        statements = 0
+
+        def count(*_: Any) -> None:
+            nonlocal statements
+            statements += 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+
+        pubsub = InMemoryPubSub(clock=time.perf_counter)
+        fake = FakeProvider(
+            config=FakeProviderConfig(
+                tokens_per_second=args.tokens_per_second,
+                reply_tokens=args.reply_tokens,
+                first_token_latency_seconds=args.first_token_ms / 1000,
+                error_rate=args.error_rate,
+                error_after_tokens=args.reply_tokens // 2,
+            )
+        )
+        _patch(engine, pubsub, fake)
+
+        pool = JobWorkerPool(
+            subscriber._handle_pubsub_job,
+            concurrency=args.concurrency,
+            max_pending=args.concurrency * 2,
+            key_fn=subscriber._job_conversation_key,
+            name="bench_jobs",
+        )
+        submitted_at: dict[str, float] = {}
+        started = time.perf_counter()
+        pool.start()
+        for job in jobs:
+            submitted_at[job.payload["conversation_id"]] = time.perf_counter()
+            await pool.submit(job)
+        await pool.drain(timeout=args.timeout)
+        elapsed = time.perf_counter() - started
+
+        await close_provider_factory()
+        await engine.dispose()
+
+    first_chunk: dict[str, float] = {}
+    for published in pubsub.events:
+        conversation_id = published.payload.get("conversation_id")
+        if (
+            published.event_type == EventType.PROJECT_ASSISTANT_CHUNK.value
+            and conversation_id not in first_chunk
+        ):
+            first_chunk[conversation_id] = published.published_at
+    ttfc = [
+        (first_chunk[key] - submitted_at[key]) * 1000
+        for key in first_chunk
+        if key in submitted_at
+    ]
+    counts = pubsub.counts()
+
+    return {
+        "jobs_per_sec": args.jobs / elapsed,
+        "ttfc_p50_ms": _percentile(ttfc, 50),
+        "ttfc_p95_ms": _percentile(ttfc, 95),
+        "publishes_per_job": len(pubsub.events) / args.jobs,
+        "completed": counts[EventType.PROJECT_ASSISTANT_COMPLETED.value],
+        "errored": counts[EventType.PROJECT_ASSISTANT_ERROR.value],
+        "statements_per_job": statements / args.jobs,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--reply-tokens", type=int, default=200)
+    parser.add_argument("--tokens-per-second", type=float, default=400.0)
+    parser.add_argument("--first-token-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    return parser.parse_args()
+
+
+def main() -> None:
+    result = asyncio.run(run(_parse_args()))
+    for key, value in result.items():
+        print(f"{key:>20} {value:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Project list authorization latency vs. project count.
+
+Compares the previous per-project `can()` loop with `filter_permitted`. Each
+permission lookup is simulated as a DB round-trip of ROUND_TRIP_SECONDS.
+
+    python -m benchmarks.bench_project_list_permissions
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from app.services import permission_service
+
+ROUND_TRIP_SECONDS = 0.001
+PROJECT_COUNTS = (10, 100, 400, 1000)
+USER_ID = "user-1"
+
+
+async def _fake_can(**kwargs: Any) -> bool:
+    await asyncio.sleep(ROUND_TRIP_SECONDS)
+    return True
+
+
+def _projects(count: int, owner_type: str) -> list[SimpleNamespace]:
+    organization_id = "org-1" if owner_type == "org" else None
+    return [
+        SimpleNamespace(
+            id=f"project-{i}",
+            owner_id=USER_ID,
+            owner_type=owner_type,
+            organization_id=organization_id,
+        )
+        for i in range(count)
+    ]
+
+
+async def _legacy_loop(projects: list[SimpleNamespace]) -> list[SimpleNamespace]:
+    authorized = []
+    for project in projects:
+        if await _fake_can(resource_obj=project):
+            authorized.append(project)
+    return authorized
+
+
+async def _bulk(projects: list[SimpleNamespace]) -> list[Any]:
+    return await permission_service.filter_permitted(
+        session=None,  # type: ignore[arg-type]
+        user_id=USER_ID,
+        perm_bit=1,
+        resource_type="project",
+        resource_objs=projects,
+    )
+
+
+async def _time(coro_factory: Any) -> float:
+    started = time.perf_counter()
+    await coro_factory()
+    return (time.perf_counter() - started) * 1000
+
+
+async def main() -> None:
+    permission_service.can = _fake_can  # type: ignore[assignment]
+    print(f"{'projects':>8} {'scope':>6} {'legacy ms':>10} {'bulk ms':>10}")
+    for count in PROJECT_COUNTS:
+        for owner_type in ("user", "org"):
+            projects = _projects(count, owner_type)
+            legacy = await _time(lambda: _legacy_loop(projects))
+            bulk = await _time(lambda: _bulk(projects))
+            print(f"{count:>8} {owner_type:>6} {legacy:>10.1f} {bulk:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+Serialization micro-benchmark for ServiceResponse list payloads.
+
+Serializes a list response of PROJECTS projects to bytes, REPEAT times per path:
+
+  fastapi     .dict() items in a ServiceResponse, then FastAPI's response_model
+              pass (serialize_response) and the stdlib JSONResponse encoder,
+              as the handlers did before `service_response`
+  fast        the list handler's path: one TypeAdapter dump of the page in
+              JSON mode, sent through `service_response` (orjson)
+  fast-stdlib the same path with the stdlib encoder, as used when orjson is
+              not installed
+
+    python -m benchmarks.bench_service_response --projects 1000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from platform_common.models.project import Project
+from platform_common.utils.service_response import ServiceResponse
+
+from app.api.handler.get_project_list_handler import PROJECT_LIST
+from app.core import responses
+from app.core.responses import service_response
+from tests.support import model_row
+
+MESSAGE = "Project list retrieved successfully"
+
+
+def _projects(count: int) -> list[Project]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        model_row(
+            Project,
+            id=f"project-{index}",
+            name=f"Project {index}",
+            description="Shared workspace for the data labelling pipeline.",
+            owner_id="user-1",
+            owner_type="user",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def _fastapi_path(projects: list[Project]) -> Callable[[], bytes]:
+    field = create_model_field(
+        name="Response_bench", type_=ServiceResponse, mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    def render() -> bytes:
+        envelope = ServiceResponse(
+            message=MESSAGE,
+            status_code=200,
+            data={"items": [project.dict() for project in projects]},
+        )
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=envelope)
+        )
+        return JSONResponse(content).body
+
+    return render
+
+
+def _fast_path(projects: list[Project]) -> Callable[[], bytes]:
+    def render() -> bytes:
+        return service_response(
+            message=MESSAGE,
+            status_code=200,
+            data={"items": PROJECT_LIST.dump_python(projects, mode="json")},
+        ).body
+
+    return render
+
+
+def _time(render: Callable[[], bytes], repeat: int) -> dict[str, float]:
+    size = len(render())
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "p50_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "kib": size / 1024,
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    projects = _projects(args.projects)
+    results = {"fastapi": _time(_fastapi_path(projects), args.repeat)}
+    if responses.orjson is not None:
+        results["fast"] = _time(_fast_path(projects), args.repeat)
+
+    orjson: Any = responses.orjson
+    responses.orjson = None
+    try:
+        results["fast-stdlib"] = _time(_fast_path(projects), args.repeat)
+    finally:
+        responses.orjson = orjson
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    return parser.parse_args()
+
+
+def main() -> None:
+    for path, result in run(_parse_args()).items():
+        print(f"{path:>12} " + " ".join(f"{k}={v:.2f}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Publishes/sec and delivery latency for assistant stream deltas.
+
+Streams TOKENS deltas at a steady rate through StreamDeltaCoalescer, with a
+fake publisher that costs PUBLISH_SECONDS per call (a Redis round-trip), and
+compares per-delta publishing against a few coalescing settings.
+
+    python -m benchmarks.bench_stream_coalescing
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+from app.pubsub.stream_coalescer import StreamDeltaCoalescer
+
+TOKENS = 2000
+TOKEN_INTERVAL_SECONDS = 0.0005
+PUBLISH_SECONDS = 0.0003
+DELTA = "tok "
+SETTINGS = (
+    ("per-delta", 1, 0.0),
+    ("256B/30ms", 256, 0.030),
+    ("512B/40ms", 512, 0.040),
+    ("1KB/50ms", 1024, 0.050),
+)
+
+
+async def _run(max_bytes: int, window_seconds: float) -> dict[str, float]:
+    produced_at: list[float] = []
+    latencies: list[float] = []
+    delivered = 0
+
+    async def publish(text: str, seq: int) -> None:
+        nonlocal delivered
+        await asyncio.sleep(PUBLISH_SECONDS)
+        now = time.perf_counter()
+        count = len(text) // len(DELTA)
+        for created in produced_at[delivered : delivered + count]:
+            latencies.append(now - created)
+        delivered += count
+
+    coalescer = StreamDeltaCoalescer(
+        publish, max_bytes=max_bytes, window_seconds=window_seconds
+    )
+    started = time.perf_counter()
+    for _ in range(TOKENS):
+        await asyncio.sleep(TOKEN_INTERVAL_SECONDS)
+        produced_at.append(time.perf_counter())
+        await coalescer.add(DELTA)
+    await coalescer.close()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "publishes": coalescer.publish_count,
+        "publishes_per_sec": coalescer.publish_count / elapsed,
+        "total_ms": elapsed * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000,
+    }
+
+
+async def main() -> None:
+    print(
+        f"{'setting':>10} {'publishes':>9} {'pub/s':>8} "
+        f"{'total ms':>9} {'p50 ms':>7} {'p99 ms':>7}"
+    )
+    for label, max_bytes, window_seconds in SETTINGS:
+        result = await _run(max_bytes, window_seconds)
+        print(
+            f"{label:>10} {result['publishes']:>9.0f} "
+            f"{result['publishes_per_sec']:>8.0f} {result['total_ms']:>9.0f} "
+            f"{result['p50_ms']:>7.1f} {result['p99_ms']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
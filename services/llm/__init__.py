@@ -3,15 +3,26 @@ from .context_builder import (
     ContextBuildResult,
     build_context,
 )
+from .context_cache import ConversationContextCache
 from .llm_service import LLMRequest, LLMService
-from .provider_interface import LLMProvider, LLMStreamEvent
+from .provider_interface import LLMProvider, LLMProviderError, LLMStreamEvent
+from .provider_router import ProviderRoute, ProviderRouter
+from .response_cache import LLMResponseCache
+from .token_budget import ContextBudget, TokenCounter
 
 __all__ = [
     "DEFAULT_PROJECT_SYSTEM_PROMPT",
+    "ContextBudget",
     "ContextBuildResult",
+    "ConversationContextCache",
     "LLMProvider",
+    "LLMProviderError",
     "LLMRequest",
+    "LLMResponseCache",
     "LLMService",
     "LLMStreamEvent",
+    "ProviderRoute",
+    "ProviderRouter",
+    "TokenCounter",
     "build_context",
 ]
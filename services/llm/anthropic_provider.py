@@ -1,13 +1,101 @@
 from __future__ import annotations
 
-from typing import AsyncIterator
+import json
+from typing import Any, AsyncIterator
 
-from services.llm.provider_interface import LLMProvider, LLMStreamEvent
+import httpx
+
+from platform_common.config.settings import get_settings
+
+from services.llm.http_client import build_http_client
+from services.llm.provider_interface import (
+    LLMProvider,
+    LLMProviderError,
+    LLMStreamEvent,
+)
+from services.llm.rate_limiter import parse_retry_after
+
+DEFAULT_BASE_URL = "https://api.anthropic.com"
+ANTHROPIC_VERSION = "2023-06-01"
+DEFAULT_MAX_TOKENS = 4_096
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def build_messages_payload(
+    messages: list[dict[str, str]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split chat-style messages into Anthropic's `system` blocks and turns.
+
+    The system prompt and the history before the newest message are the same
+    on every turn of a conversation, so both ends of that prefix get a cache
+    breakpoint; the next turn reads it from the prompt cache. Assistant turns
+    left at the start by history trimming are dropped, since the Messages API
+    requires the first turn to come from the user.
+    """
+    system = [
+        {"type": "text", "text": message["content"]}
+        for message in messages
+        if message["role"] == "system"
+    ]
+    turns: list[dict[str, Any]] = []
+    for message in messages:
+        if message["role"] == "system":
+            continue
+        block = {"type": "text", "text": message["content"]}
+        if turns and turns[-1]["role"] == message["role"]:
+            turns[-1]["content"].append(block)
+        else:
+            turns.append({"role": message["role"], "content": [block]})
+    while turns and turns[0]["role"] != "user":
+        turns.pop(0)
+
+    if system:
+        system[-1]["cache_control"] = CACHE_CONTROL
+    if len(turns) > 1:
+        turns[-2]["content"][-1]["cache_control"] = CACHE_CONTROL
+    return system, turns
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[tuple[str, str]]:
+    event, data = "message", []
+    async for line in response.aiter_lines():
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+    if data:
+        yield event, "\n".join(data)
 
 
 class AnthropicProvider(LLMProvider):
     name = "anthropic"
 
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+    ) -> None:
+        super().__init__(http_client)
+        settings = get_settings()
+        self._api_key = api_key or getattr(settings, "anthropic_api_key", None)
+        if not self._api_key:
+            raise RuntimeError("ANTHROPIC_API_KEY is not configured")
+        self._base_url = (
+            base_url
+            or getattr(settings, "anthropic_base_url", None)
+            or DEFAULT_BASE_URL
+        ).rstrip("/")
+        self._max_tokens = max_tokens
+        self._client = http_client or build_http_client()
+
     async def stream_chat(
         self,
         *,
@@ -15,7 +103,78 @@ class AnthropicProvider(LLMProvider):
         model: str,
         temperature: float,
     ) -> AsyncIterator[LLMStreamEvent]:
-        raise RuntimeError(
-            "Anthropic streaming is not implemented in this service yet"
-        )
-        yield LLMStreamEvent()
+        system, turns = build_messages_payload(messages)
+        body: dict[str, Any] = {
+            "model": model,
+            "messages": turns,
+            "max_tokens": self._max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        if system:
+            body["system"] = system
+        headers = {
+            "x-api-key": self._api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "accept": "text/event-stream",
+        }
+
+        async with self._client.stream(
+            "POST", f"{self._base_url}/v1/messages", json=body, headers=headers
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                raise LLMProviderError(
+                    f"Anthropic request failed: {response.text[:500]}",
+                    provider=self.name,
+                    status_code=response.status_code,
+                    retry_after=parse_retry_after(response.headers),
+                )
+
+            usage: dict[str, Any] = {}
+            async for event, data in _iter_sse(response):
+                if event == "ping":
+                    continue
+                payload = json.loads(data)
+                if event == "content_block_delta":
+                    delta = payload.get("delta") or {}
+                    if delta.get("type") == "text_delta" and delta.get("text"):
+                        yield LLMStreamEvent(delta=delta["text"])
+                elif event == "message_start":
+                    usage.update((payload.get("message") or {}).get("usage") or {})
+                elif event == "message_delta":
+                    usage.update(payload.get("usage") or {})
+                elif event == "error":
+                    error = payload.get("error") or {}
+                    raise LLMProviderError(
+                        f"Anthropic stream error: {error.get('message', data)}",
+                        provider=self.name,
+                        error_type=error.get("type"),
+                    )
+                elif event == "message_stop":
+                    break
+
+        if usage:
+            yield LLMStreamEvent(usage=_normalize_usage(usage))
+
+    async def aclose(self) -> None:
+        if self._http_client is None:
+            await self._client.aclose()
+
+
+def _normalize_usage(usage: dict[str, Any]) -> dict[str, Any]:
+    """
+    Keep Anthropic's fields and add the OpenAI-style totals stored elsewhere.
+    """
+    prompt_tokens = (
+        int(usage.get("input_tokens") or 0)
+        + int(usage.get("cache_creation_input_tokens") or 0)
+        + int(usage.get("cache_read_input_tokens") or 0)
+    )
+    completion_tokens = int(usage.get("output_tokens") or 0)
+    return {
+        **usage,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
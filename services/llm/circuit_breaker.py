@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    error_rate_threshold: float = 0.5
+    min_requests: int = 5
+    window_seconds: float = 60.0
+    cooldown_seconds: float = 30.0
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker for one provider.
+
+    Opens once at least `min_requests` outcomes in the last `window_seconds`
+    fail at `error_rate_threshold` or more. After `cooldown_seconds` a single
+    probe request is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened_count = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self._config.cooldown_seconds
+        ):
+            self._state = HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            self._close()
+            return
+        self._record(True)
+
+    def record_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+        self._record(False)
+        total = len(self._outcomes)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        if (
+            total >= self._config.min_requests
+            and failures / total >= self._config.error_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """
+        Give back an allowed call that ended without an outcome (e.g. cancelled).
+        """
+        self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        self._trim()
+        total = len(self._outcomes)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return {
+            "state": self.state,
+            "requests": total,
+            "error_rate": round(failures / total, 3) if total else 0.0,
+            "opened_count": self.opened_count,
+        }
+
+    def _record(self, ok: bool) -> None:
+        self._outcomes.append((self._clock(), ok))
+        self._trim()
+
+    def _trim(self) -> None:
+        cutoff = self._clock() - self._config.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+        self.opened_count += 1
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._probing = False
@@ -13,6 +13,20 @@ from platform_common.db.dal.project_dal import ProjectDAL
 from platform_common.errors.base import NotFoundError
 from platform_common.models.project import Project
 from platform_common.models.project_conversation import ProjectConversation
+from platform_common.models.project_conversation_message import (
+    ProjectConversationMessage,
+)
+
+from services.llm.context_cache import (
+    CachedConversationContext,
+    ConversationContextCache,
+)
+from services.llm.token_budget import (
+    ContextBudget,
+    HistoryMessage,
+    default_token_counter,
+    fit_messages,
+)
 
 DEFAULT_PROJECT_SYSTEM_PROMPT = (
     "You are Lucy, an intelligent AI assistant helping with this project."
@@ -24,12 +38,76 @@ class ContextBuildResult:
     conversation: ProjectConversation
     project: Project
     messages: list[dict[str, str]]
+    token_count: int = 0
+    dropped_messages: int = 0
+    truncated_messages: int = 0
+
+
+def resolve_model(project: Project, default_model: str) -> str:
+    return getattr(project, "llm_model_override", None) or default_model
+
+
+def _system_prompt(project: Project) -> str:
+    return (
+        project.llm_system_prompt.strip()
+        if getattr(project, "llm_system_prompt", None)
+        and project.llm_system_prompt.strip()
+        else DEFAULT_PROJECT_SYSTEM_PROMPT
+    )
+
+
+def _history_message(row: ProjectConversationMessage) -> HistoryMessage | None:
+    content = (row.content_text or "").strip()
+    if not content:
+        return None
+    if row.status == row.Status.ERROR:
+        return None
+    role = getattr(row.role, "value", row.role)
+    return HistoryMessage(id=str(row.id), role=str(role), content=content)
+
+
+async def _extend_cached(
+    session: AsyncSession,
+    cached: CachedConversationContext,
+    conversation: ProjectConversation,
+    user_message_id: str | None,
+) -> bool:
+    """
+    Bring a cached window up to date with just the job's new user message.
+    Returns False when the entry cannot be trusted and a rebuild is needed.
+    """
+    message_count = int(conversation.message_count or 0)
+    if user_message_id is None or message_count - cached.message_count not in (0, 1):
+        return False
+    if any(message.id == user_message_id for message in cached.history):
+        return message_count == cached.message_count
+
+    row = await session.get(ProjectConversationMessage, user_message_id)
+    if row is None or str(row.conversation_id) != str(conversation.id):
+        return False
+    message = _history_message(row)
+    if message is not None:
+        cached.history.append(message)
+    cached.message_count = message_count
+    return True
 
 
 async def build_context(
     session: AsyncSession,
     conversation_id: str,
+    *,
+    budget: ContextBudget | None = None,
+    cache: ConversationContextCache | None = None,
+    user_message_id: str | None = None,
 ) -> ContextBuildResult:
+    """
+    Load the conversation and assemble the prompt for its next assistant turn.
+
+    With a `cache`, a warm conversation costs the active-conversation and
+    project lookups plus one primary-key read of the new user message instead
+    of re-reading the recent message window. The project is always read fresh,
+    so prompt and model changes apply from the next turn.
+    """
     settings = get_settings()
     conversation = await ProjectConversationDAL(session).get_active(conversation_id)
     if not conversation:
@@ -39,29 +117,44 @@ async def build_context(
     if not project:
         raise NotFoundError("Project not found")
 
-    rows = await ProjectConversationMessageDAL(session).list_recent_for_conversation(
-        conversation_id,
-        limit=settings.llm_context_window_messages,
-    )
+    cached = await cache.get(conversation_id) if cache is not None else None
+    if cached is not None and await _extend_cached(
+        session, cached, conversation, user_message_id
+    ):
+        await cache.put(conversation_id, cached)  # type: ignore[union-attr]
+    else:
+        rows = await ProjectConversationMessageDAL(
+            session
+        ).list_recent_for_conversation(
+            conversation_id,
+            limit=settings.llm_context_window_messages,
+        )
+        history = [
+            message
+            for message in (_history_message(row) for row in rows)
+            if message is not None
+        ]
+        cached = CachedConversationContext(
+            message_count=int(conversation.message_count or 0),
+            history=history,
+        )
+        if cache is not None:
+            await cache.put(conversation_id, cached)
 
-    prompt = (
-        project.llm_system_prompt.strip()
-        if getattr(project, "llm_system_prompt", None)
-        and project.llm_system_prompt.strip()
-        else DEFAULT_PROJECT_SYSTEM_PROMPT
+    model = resolve_model(project, settings.llm_default_model)
+    await default_token_counter.load(model)
+    fitted = fit_messages(
+        system_prompt=_system_prompt(project),
+        history=cached.history,
+        model=model,
+        budget=budget or ContextBudget(),
     )
-    messages: list[dict[str, str]] = [{"role": "system", "content": prompt}]
-
-    for row in rows:
-        content = (row.content_text or "").strip()
-        if not content:
-            continue
-        if row.status == row.Status.ERROR:
-            continue
-        messages.append({"role": row.role, "content": content})
 
     return ContextBuildResult(
         conversation=conversation,
         project=project,
-        messages=messages,
+        messages=fitted.messages,
+        token_count=fitted.token_count,
+        dropped_messages=fitted.dropped_messages,
+        truncated_messages=fitted.truncated_messages,
     )
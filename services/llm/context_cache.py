@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from platform_common.logging.logging import get_logger
+
+from services.llm.token_budget import HistoryMessage
+
+logger = get_logger("project_management.context_cache")
+
+# v2: entries no longer carry the project or its system prompt.
+REDIS_KEY_PREFIX = "project-management:llm-context:v2:"
+
+
+@dataclass
+class CachedConversationContext:
+    """
+    Prepared message history for one conversation.
+
+    `message_count` is the conversation's message_count this entry reflects;
+    it is how a later turn checks the entry is still in step with the table.
+    The project and its system prompt are not cached: they are re-read every
+    turn, so project edits apply to conversations already in flight.
+    """
+
+    message_count: int
+    history: list[HistoryMessage] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedConversationContext":
+        data = json.loads(raw)
+        data["history"] = [HistoryMessage(**item) for item in data["history"]]
+        return cls(**data)
+
+
+class ConversationContextCache:
+    """
+    Per-conversation context window, kept in an in-process LRU and optionally
+    mirrored to Redis so replicas can pick up where another left off.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 2_000,
+        ttl_seconds: float = 300.0,
+        max_messages: int = 50,
+        redis: Any = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._max_messages = max_messages
+        self._redis = redis
+        self._entries: OrderedDict[str, tuple[float, CachedConversationContext]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.appends = 0
+
+    async def get(self, conversation_id: str) -> CachedConversationContext | None:
+        entry = self._entries.get(conversation_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(conversation_id)
+            self.hits += 1
+            return entry[1]
+        self._entries.pop(conversation_id, None)
+
+        context = await self._redis_get(conversation_id)
+        if context is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._store_local(conversation_id, context)
+        return context
+
+    async def put(
+        self, conversation_id: str, context: CachedConversationContext
+    ) -> None:
+        context.history = context.history[-self._max_messages :]
+        self._store_local(conversation_id, context)
+        await self._redis_set(conversation_id, context)
+
+    async def append(
+        self,
+        conversation_id: str,
+        message: HistoryMessage | None,
+        *,
+        message_count: int,
+    ) -> None:
+        """
+        Record a message that completed after the entry was built. A `None`
+        message only advances the count (e.g. an errored turn that is kept out
+        of the context). Entries that are out of step are dropped.
+        """
+        context = await self.get(conversation_id)
+        if context is None:
+            return
+        if message_count != context.message_count + 1:
+            await self.invalidate(conversation_id)
+            return
+        if message is not None:
+            context.history.append(message)
+        context.message_count = message_count
+        self.appends += 1
+        await self.put(conversation_id, context)
+
+    async def invalidate(self, conversation_id: str) -> None:
+        self._entries.pop(conversation_id, None)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(f"{REDIS_KEY_PREFIX}{conversation_id}")
+        except Exception as e:
+            logger.warning("Context cache invalidation failed: %s", e)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "appends": self.appends,
+        }
+
+    def _store_local(
+        self, conversation_id: str, context: CachedConversationContext
+    ) -> None:
+        self._entries[conversation_id] = (
+            time.monotonic() + self._ttl_seconds,
+            context,
+        )
+        self._entries.move_to_end(conversation_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_get(
+        self, conversation_id: str
+    ) -> CachedConversationContext | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"{REDIS_KEY_PREFIX}{conversation_id}")
+            return CachedConversationContext.from_json(raw) if raw else None
+        except Exception as e:
+            logger.warning("Context cache read failed: %s", e)
+            return None
+
+    async def _redis_set(
+        self, conversation_id: str, context: CachedConversationContext
+    ) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                f"{REDIS_KEY_PREFIX}{conversation_id}",
+                context.to_json(),
+                ex=int(self._ttl_seconds),
+            )
+        except Exception as e:
+            logger.warning("Context cache write failed: %s", e)
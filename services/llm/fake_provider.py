@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+import httpx
+
+from services.llm.provider_interface import (
+    LLMProvider,
+    LLMProviderError,
+    LLMStreamEvent,
+)
+
+
+@dataclass
+class FakeProviderConfig:
+    """
+    Shape of the fake stream. `error_rate` is the share of calls that fail,
+    after `error_after_tokens` tokens (0 fails before the first token).
+    """
+
+    tokens_per_second: float = 50.0
+    reply_tokens: int = 200
+    first_token_latency_seconds: float = 0.2
+    error_rate: float = 0.0
+    error_after_tokens: int = 0
+    error_status_code: int = 503
+    seed: int = 0
+
+
+class FakeProvider(LLMProvider):
+    """
+    Deterministic provider for load tests and local runs without API keys.
+
+    Replies are "token<i> " repeated `reply_tokens` times at the configured
+    rate. Which calls fail is drawn from a generator seeded with `seed`, so a
+    run with the same config fails the same calls.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        *,
+        config: FakeProviderConfig | None = None,
+    ) -> None:
+        super().__init__(http_client)
+        self.config = config or FakeProviderConfig()
+        self._random = random.Random(self.config.seed)
+        self.calls = 0
+
+    async def stream_chat(
+        self,
+        *,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        config = self.config
+        self.calls += 1
+        fail = self._random.random() < config.error_rate
+        interval = 1.0 / config.tokens_per_second if config.tokens_per_second else 0
+        prompt_tokens = sum(len(m.get("content", "").split()) for m in messages)
+
+        await asyncio.sleep(config.first_token_latency_seconds)
+        for index in range(config.reply_tokens):
+            if fail and index >= config.error_after_tokens:
+                raise self._error()
+            if index:
+                await asyncio.sleep(interval)
+            yield LLMStreamEvent(delta=f"token{index} ")
+        if fail:
+            raise self._error()
+
+        yield LLMStreamEvent(
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": config.reply_tokens,
+                "total_tokens": prompt_tokens + config.reply_tokens,
+            }
+        )
+
+    def _error(self) -> LLMProviderError:
+        return LLMProviderError(
+            "Injected fake provider failure",
+            provider=self.name,
+            status_code=self.config.error_status_code,
+            error_type="fake_error",
+        )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import importlib.util
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass
+class HTTPClientConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    read_timeout_seconds: float = 120.0
+    http2: bool = True
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client(config: HTTPClientConfig | None = None) -> httpx.AsyncClient:
+    """
+    Long-lived HTTP client shared by the LLM providers of one process.
+
+    HTTP/2 is only enabled when the optional `h2` package is installed.
+    """
+    config = config or HTTPClientConfig()
+    return httpx.AsyncClient(
+        http2=config.http2 and http2_available(),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            config.read_timeout_seconds,
+            connect=config.connect_timeout_seconds,
+        ),
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import AsyncIterator
 
@@ -7,9 +8,37 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from platform_common.config.settings import get_settings
 
-from services.llm.context_builder import ContextBuildResult, build_context
-from services.llm.provider_factory import ProviderFactory
+from services.llm.context_builder import (
+    ContextBuildResult,
+    build_context,
+    resolve_model,
+)
+from services.llm.context_cache import ConversationContextCache
+from services.llm.provider_factory import ProviderFactory, get_provider_factory
 from services.llm.provider_interface import LLMStreamEvent
+from services.llm.provider_router import ProviderRoute, ProviderRouter
+from services.llm.response_cache import (
+    CachedResponse,
+    LLMResponseCache,
+    response_cache_key,
+)
+from services.llm.token_budget import ContextBudget
+from services.metrics import registry
+
+BUILD_CONTEXT_SECONDS = registry.histogram(
+    "llm_build_context_seconds", "Time to load and assemble the LLM prompt."
+)
+TIME_TO_FIRST_TOKEN_SECONDS = registry.histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from stream start to the first reply delta.",
+    ("provider", "model"),
+)
+STREAM_SECONDS = registry.histogram(
+    "llm_stream_seconds", "Duration of a full LLM reply stream.", ("provider", "model")
+)
+RESPONSE_CACHE_LOOKUPS = registry.counter(
+    "llm_response_cache_lookups", "Response cache lookups by result.", ("result",)
+)
 
 
 @dataclass
@@ -18,28 +47,128 @@ class LLMRequest:
     model: str
     temperature: float
     context: ContextBuildResult
+    cache_key: str | None = None
+    # Set by build_request when an identical prompt has already been answered.
+    cached_response: CachedResponse | None = None
 
 
 class LLMService:
-    def __init__(self, provider_factory: ProviderFactory | None = None) -> None:
+    def __init__(
+        self,
+        provider_factory: ProviderFactory | None = None,
+        context_budget: ContextBudget | None = None,
+        context_cache: ConversationContextCache | None = None,
+        router: ProviderRouter | None = None,
+        response_cache: LLMResponseCache | None = None,
+        replay_chunk_chars: int = 64,
+    ) -> None:
         self._settings = get_settings()
-        self._provider_factory = provider_factory or ProviderFactory()
+        self._provider_factory = provider_factory or get_provider_factory()
+        self._context_budget = context_budget
+        self._context_cache = context_cache
+        self._router = router
+        self._response_cache = response_cache
+        self._replay_chunk_chars = replay_chunk_chars
 
     async def build_request(
         self,
         *,
         session: AsyncSession,
         conversation_id: str,
+        user_message_id: str | None = None,
     ) -> LLMRequest:
-        context = await build_context(session, conversation_id)
-        return LLMRequest(
+        with BUILD_CONTEXT_SECONDS.time():
+            context = await build_context(
+                session,
+                conversation_id,
+                budget=self._context_budget,
+                cache=self._context_cache,
+                user_message_id=user_message_id,
+            )
+        request = LLMRequest(
             provider=self._settings.llm_default_provider,
-            model=context.project.llm_model_override or self._settings.llm_default_model,
+            model=resolve_model(context.project, self._settings.llm_default_model),
             temperature=self._settings.llm_temperature,
             context=context,
         )
+        if self._response_cache is not None:
+            request.cache_key = response_cache_key(
+                context.project.id,
+                request.model,
+                request.temperature,
+                context.messages,
+            )
+            request.cached_response = await self._response_cache.get(request.cache_key)
+            RESPONSE_CACHE_LOOKUPS.inc("hit" if request.cached_response else "miss")
+        return request
+
+    def estimated_tokens(self, request: LLMRequest) -> int:
+        """
+        Tokens a call is expected to use: the prompt plus the reserved reply.
+        """
+        reserve = (
+            self._context_budget.response_reserve_tokens if self._context_budget else 0
+        )
+        return request.context.token_count + reserve
 
     async def stream_chat(self, request: LLMRequest) -> AsyncIterator[LLMStreamEvent]:
+        if request.cached_response is not None:
+            async for event in self._replay(request.cached_response):
+                yield event
+            return
+
+        parts: list[str] = []
+        provider, model = request.provider, request.model
+        started = time.perf_counter()
+        first_token = False
+        async for event in self._stream_provider(request):
+            if event.provider:
+                provider, model = event.provider, event.model or model
+            if event.delta and not first_token:
+                first_token = True
+                TIME_TO_FIRST_TOKEN_SECONDS.observe(
+                    time.perf_counter() - started, provider, model
+                )
+            parts.append(event.delta)
+            yield event
+        STREAM_SECONDS.observe(time.perf_counter() - started, provider, model)
+
+        text = "".join(parts)
+        if self._response_cache is not None and request.cache_key and text.strip():
+            await self._response_cache.put(
+                request.cache_key,
+                CachedResponse(text=text, provider=provider, model=model),
+            )
+
+    async def _replay(self, cached: CachedResponse) -> AsyncIterator[LLMStreamEvent]:
+        # Same event shape as a live stream, so downstream publishing and
+        # persistence are unchanged.
+        yield LLMStreamEvent(provider=cached.provider, model=cached.model)
+        step = max(1, self._replay_chunk_chars)
+        for start in range(0, len(cached.text), step):
+            yield LLMStreamEvent(delta=cached.text[start : start + step])
+        yield LLMStreamEvent(
+            usage={
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+                "cache_hit": True,
+            }
+        )
+
+    async def _stream_provider(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamEvent]:
+        if self._router is not None:
+            async for event in self._router.stream(
+                ProviderRoute(provider=request.provider, model=request.model),
+                messages=request.context.messages,
+                temperature=request.temperature,
+                estimated_tokens=self.estimated_tokens(request),
+            ):
+                yield event
+            return
+
         provider = self._provider_factory.create(request.provider)
         async for event in provider.stream_chat(
             messages=request.context.messages,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import AsyncIterator
 
+import httpx
+
 from platform_common.config.settings import get_settings
 
 from services.llm.provider_interface import LLMProvider, LLMStreamEvent
@@ -15,13 +17,19 @@ except ImportError:  # pragma: no cover - dependency resolved in service image
 class OpenAIProvider(LLMProvider):
     name = "openai"
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        super().__init__(http_client)
         settings = get_settings()
         if AsyncOpenAI is None:
             raise RuntimeError("openai package is not installed")
         if not settings.openai_api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured")
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # Reuse the factory's pooled client so connections and TLS sessions survive
+        # across requests; the factory owns and closes it.
+        self._client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=http_client,
+        )
 
     async def stream_chat(
         self,
@@ -48,3 +56,7 @@ class OpenAIProvider(LLMProvider):
             if usage:
                 usage_json = usage.model_dump() if hasattr(usage, "model_dump") else dict(usage)
                 yield LLMStreamEvent(usage=usage_json)
+
+    async def aclose(self) -> None:
+        if self._http_client is None:
+            await self._client.close()
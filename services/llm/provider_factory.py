@@ -1,22 +1,83 @@
 from __future__ import annotations
 
+import httpx
+
 from platform_common.config.settings import get_settings
 
 from services.llm.anthropic_provider import AnthropicProvider
+from services.llm.fake_provider import FakeProvider
+from services.llm.http_client import HTTPClientConfig, build_http_client
 from services.llm.openai_provider import OpenAIProvider
 from services.llm.provider_interface import LLMProvider
 
 
 class ProviderFactory:
-    def __init__(self) -> None:
+    """
+    Creates each provider once and shares one HTTP connection pool between them.
+    """
+
+    def __init__(self, http_config: HTTPClientConfig | None = None) -> None:
         self._providers: dict[str, type[LLMProvider]] = {
             OpenAIProvider.name: OpenAIProvider,
             AnthropicProvider.name: AnthropicProvider,
+            FakeProvider.name: FakeProvider,
         }
+        self._http_config = http_config
+        self._http_client: httpx.AsyncClient | None = None
+        self._instances: dict[str, LLMProvider] = {}
 
     def create(self, provider_name: str | None = None) -> LLMProvider:
         resolved_name = (provider_name or get_settings().llm_default_provider).strip().lower()
+        instance = self._instances.get(resolved_name)
+        if instance is not None:
+            return instance
+
         provider_cls = self._providers.get(resolved_name)
         if provider_cls is None:
             raise RuntimeError(f"Unsupported LLM provider '{resolved_name}'")
-        return provider_cls()
+        if self._http_client is None:
+            self._http_client = build_http_client(self._http_config)
+        instance = provider_cls(http_client=self._http_client)
+        self._instances[resolved_name] = instance
+        return instance
+
+    def register(self, instance: LLMProvider) -> LLMProvider:
+        """
+        Serve a pre-built provider under its name, e.g. a configured FakeProvider.
+        """
+        self._instances[instance.name] = instance
+        return instance
+
+    async def aclose(self) -> None:
+        instances, self._instances = self._instances, {}
+        for instance in instances.values():
+            await instance.aclose()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+_shared_factory: ProviderFactory | None = None
+
+
+def get_provider_factory() -> ProviderFactory:
+    """
+    Process-wide factory; configured in the app lifespan, lazily created otherwise.
+    """
+    global _shared_factory
+    if _shared_factory is None:
+        _shared_factory = ProviderFactory()
+    return _shared_factory
+
+
+def configure_provider_factory(factory: ProviderFactory) -> ProviderFactory:
+    global _shared_factory
+    _shared_factory = factory
+    return factory
+
+
+async def close_provider_factory() -> None:
+    global _shared_factory
+    if _shared_factory is not None:
+        await _shared_factory.aclose()
+        _shared_factory = None
@@ -4,16 +4,45 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, AsyncIterator
 
+import httpx
+
 
 @dataclass
 class LLMStreamEvent:
     delta: str = ""
     usage: dict[str, Any] | None = None
+    # Set on routing events to name the provider/model serving the reply.
+    provider: str | None = None
+    model: str | None = None
+
+
+class LLMProviderError(RuntimeError):
+    """
+    A provider call that failed before or during streaming.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        provider: str,
+        status_code: int | None = None,
+        error_type: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+        self.error_type = error_type
+        self.retry_after = retry_after
 
 
 class LLMProvider(ABC):
     name: str
 
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        self._http_client = http_client
+
     @abstractmethod
     async def stream_chat(
         self,
@@ -23,3 +52,9 @@ class LLMProvider(ABC):
         temperature: float,
     ) -> AsyncIterator[LLMStreamEvent]:
         raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """
+        Release provider resources. The shared HTTP client is closed by the factory.
+        """
+        return None
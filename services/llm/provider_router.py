@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+from platform_common.logging.logging import get_logger
+
+from services.llm.circuit_breaker import (
+    HALF_OPEN,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+)
+from services.llm.provider_factory import ProviderFactory, get_provider_factory
+from services.llm.provider_interface import LLMProviderError, LLMStreamEvent
+from services.llm.rate_limiter import (
+    LLMRateLimiter,
+    RateLimitExceeded,
+    retry_after_seconds,
+)
+from services.metrics import registry
+
+logger = get_logger("project_management.provider_router")
+
+LLM_PROVIDER_ERRORS = registry.counter(
+    "llm_provider_errors", "LLM provider call failures.", ("provider", "status")
+)
+LLM_ROUTE_SWITCHES = registry.counter(
+    "llm_route_switches", "Hedges and failovers to another LLM route.", ("kind",)
+)
+
+
+@dataclass(frozen=True)
+class ProviderRoute:
+    provider: str
+    model: str
+
+
+def parse_routes(value: str | None) -> list[ProviderRoute]:
+    """
+    Parse "provider:model,provider:model" into routes, skipping blanks.
+    """
+    routes = []
+    for item in (value or "").split(","):
+        provider, _, model = item.strip().partition(":")
+        if provider and model:
+            routes.append(
+                ProviderRoute(provider=provider.strip().lower(), model=model.strip())
+            )
+    return routes
+
+
+@dataclass
+class _Failed:
+    error: Exception
+
+
+_DONE = object()
+
+
+@dataclass
+class _Attempt:
+    route: ProviderRoute
+    breaker: CircuitBreaker
+    probe: bool = False
+    task: asyncio.Task[None] | None = None
+
+
+class ProviderRouter:
+    """
+    Streams a chat completion from the first healthy route.
+
+    - Routes are tried in order: the request's own provider/model, then the
+      configured fallbacks. Providers with an open circuit are skipped.
+    - An attempt that fails before its first event fails over to the next
+      route straight away.
+    - With hedging on, an attempt with no event after
+      `first_token_timeout_seconds` gets a second attempt on the next route in
+      parallel; whichever emits first wins and the others are cancelled.
+    - Once an attempt has streamed output, errors are raised as-is; switching
+      providers mid-reply would duplicate text.
+
+    Fallback and hedge attempts only start if `rate_limiter` has capacity for
+    them right away; the primary route is admitted by the caller. Errors that
+    carry a retry-after are applied to the limiter.
+
+    A provider-only event (`provider`/`model` set, no delta) is emitted first
+    so callers can record which route served the reply.
+    """
+
+    def __init__(
+        self,
+        *,
+        fallback_routes: list[ProviderRoute] | None = None,
+        first_token_timeout_seconds: float | None = None,
+        hedging_enabled: bool = True,
+        breaker_config: CircuitBreakerConfig | None = None,
+        provider_factory: ProviderFactory | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+    ) -> None:
+        self._fallback_routes = fallback_routes or []
+        self._first_token_timeout = first_token_timeout_seconds
+        self._hedging_enabled = hedging_enabled
+        self._breaker_config = breaker_config or CircuitBreakerConfig()
+        self._provider_factory = provider_factory
+        self._rate_limiter = rate_limiter
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.hedges = 0
+        self.failovers = 0
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(provider, self._breaker_config)
+            self._breakers[provider] = breaker
+        return breaker
+
+    def routes_for(self, primary: ProviderRoute) -> list[ProviderRoute]:
+        routes = [primary]
+        routes.extend(route for route in self._fallback_routes if route != primary)
+        return routes
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hedges": self.hedges,
+            "failovers": self.failovers,
+            "breakers": {
+                name: breaker.stats() for name, breaker in self._breakers.items()
+            },
+        }
+
+    async def stream(
+        self,
+        primary: ProviderRoute,
+        *,
+        messages: list[dict[str, str]],
+        temperature: float,
+        estimated_tokens: int = 0,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        factory = self._provider_factory or get_provider_factory()
+        queue: asyncio.Queue[tuple[_Attempt, Any]] = asyncio.Queue()
+        candidates = self._candidates(self.routes_for(primary))
+        attempts: list[_Attempt] = []
+        loop = asyncio.get_running_loop()
+
+        async def pump(attempt: _Attempt) -> None:
+            try:
+                route = attempt.route
+                if (
+                    self._rate_limiter is not None
+                    and route != primary
+                    and not await self._rate_limiter.try_acquire(
+                        route.provider, route.model, estimated_tokens
+                    )
+                ):
+                    raise RateLimitExceeded(
+                        f"No rate limit capacity for {route.provider}/{route.model}",
+                        provider=route.provider,
+                        status_code=429,
+                    )
+                provider = factory.create(route.provider)
+                async for event in provider.stream_chat(
+                    messages=messages,
+                    model=attempt.route.model,
+                    temperature=temperature,
+                ):
+                    await queue.put((attempt, event))
+            except Exception as error:
+                await queue.put((attempt, _Failed(error)))
+            else:
+                await queue.put((attempt, _DONE))
+
+        def start_next() -> bool:
+            attempt = next(candidates, None)
+            if attempt is None:
+                return False
+            attempt.task = asyncio.create_task(pump(attempt))
+            attempts.append(attempt)
+            return True
+
+        if not start_next():
+            raise LLMProviderError(
+                "All LLM providers are unavailable (circuits open)",
+                provider=primary.provider,
+            )
+
+        winner: _Attempt | None = None
+        try:
+            deadline = self._deadline(loop)
+            while winner is None:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                try:
+                    attempt, item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    if not start_next():
+                        deadline = None
+                        continue
+                    self.hedges += 1
+                    LLM_ROUTE_SWITCHES.inc("hedge")
+                    logger.info(
+                        "No first token from %s within %.1fs; hedging to %s",
+                        attempts[0].route.provider,
+                        self._first_token_timeout,
+                        attempts[-1].route.provider,
+                    )
+                    deadline = self._deadline(loop)
+                    continue
+
+                if not isinstance(item, _Failed):
+                    winner = attempt
+                    break
+
+                attempts.remove(attempt)
+                await self._record_failure(attempt, item.error)
+                logger.warning(
+                    "LLM route %s/%s failed before first token: %s",
+                    attempt.route.provider,
+                    attempt.route.model,
+                    item.error,
+                )
+                if not attempts:
+                    if not start_next():
+                        raise item.error
+                    self.failovers += 1
+                    LLM_ROUTE_SWITCHES.inc("failover")
+                    deadline = self._deadline(loop)
+
+            for loser in attempts:
+                if loser is not winner:
+                    self._cancel(loser)
+
+            yield LLMStreamEvent(
+                provider=winner.route.provider, model=winner.route.model
+            )
+            while item is not _DONE:
+                if isinstance(item, _Failed):
+                    await self._record_failure(winner, item.error)
+                    raise item.error
+                yield item
+                attempt, item = await queue.get()
+                while attempt is not winner:
+                    attempt, item = await queue.get()
+            winner.breaker.record_success()
+        finally:
+            for attempt in attempts:
+                if attempt.task is not None and not attempt.task.done():
+                    self._cancel(attempt)
+            tasks = [attempt.task for attempt in attempts if attempt.task]
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _candidates(self, routes: list[ProviderRoute]) -> Iterator[_Attempt]:
+        for route in routes:
+            breaker = self.breaker(route.provider)
+            probe = breaker.state == HALF_OPEN
+            if breaker.allow():
+                yield _Attempt(route=route, breaker=breaker, probe=probe)
+            else:
+                logger.warning("Skipping LLM route %s: circuit open", route.provider)
+
+    async def _record_failure(self, attempt: _Attempt, error: Exception) -> None:
+        status = getattr(error, "status_code", None) or type(error).__name__
+        LLM_PROVIDER_ERRORS.inc(attempt.route.provider, str(status))
+        retry_after = retry_after_seconds(error)
+        if self._rate_limiter is not None and retry_after:
+            await self._rate_limiter.penalize(
+                attempt.route.provider, attempt.route.model, retry_after
+            )
+        if isinstance(error, RateLimitExceeded):
+            # Our own admission control, not a provider fault.
+            if attempt.probe:
+                attempt.breaker.release()
+            return
+        attempt.breaker.record_failure()
+
+    def _deadline(self, loop: asyncio.AbstractEventLoop) -> float | None:
+        if not self._hedging_enabled or not self._first_token_timeout:
+            return None
+        return loop.time() + self._first_token_timeout
+
+    @staticmethod
+    def _cancel(attempt: _Attempt) -> None:
+        if attempt.task is not None:
+            attempt.task.cancel()
+        if attempt.probe:
+            attempt.breaker.release()
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+from platform_common.logging.logging import get_logger
+
+from services.llm.provider_interface import LLMProviderError
+from services.metrics import registry
+
+logger = get_logger("project_management.rate_limiter")
+
+LLM_RATE_LIMIT_WAIT_SECONDS = registry.histogram(
+    "llm_rate_limit_wait_seconds",
+    "Time LLM calls queued for rate limit capacity, by limit key.",
+    ("key",),
+)
+LLM_RATE_LIMIT_REJECTIONS = registry.counter(
+    "llm_rate_limit_rejections",
+    "LLM calls rejected by the client-side rate limiter, by limit key.",
+    ("key",),
+)
+
+REDIS_KEY_PREFIX = "project-management:llm-rate:"
+
+# Reserves `amount` from each bucket (KEYS[2..]) only if every bucket, and the
+# retry-after block in KEYS[1], clears within max_wait. Returns the wait in
+# seconds, or -1 when the reservation would take longer than max_wait.
+# ARGV: max_wait, then capacity/refill-per-second/amount per bucket.
+_RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local max_wait = tonumber(ARGV[1])
+local wait = math.max(redis.call('PTTL', KEYS[1]), 0) / 1000
+local states = {}
+for i = 2, #KEYS do
+  local base = (i - 2) * 3 + 1
+  local capacity = tonumber(ARGV[base + 1])
+  local rate = tonumber(ARGV[base + 2])
+  local amount = tonumber(ARGV[base + 3])
+  local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local tokens = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  tokens = math.min(capacity, tokens + (now - ts) * rate)
+  if tokens < amount then
+    wait = math.max(wait, (amount - tokens) / rate)
+  end
+  states[i] = {tokens - amount, math.ceil(capacity / rate * 1000) + 1000}
+end
+if wait > max_wait then
+  return '-1'
+end
+for i = 2, #KEYS do
+  redis.call('HSET', KEYS[i], 'tokens', states[i][1], 'ts', now)
+  redis.call('PEXPIRE', KEYS[i], states[i][2])
+end
+return tostring(wait)
+"""
+
+
+class RateLimitExceeded(LLMProviderError):
+    """
+    Raised when a call would have to queue longer than the limiter allows.
+    """
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+def parse_rate_limits(value: str | None) -> dict[str, RateLimit]:
+    """
+    Parse "provider[:model]=rpm/tpm,..." (either side may be blank or 0).
+    """
+    limits: dict[str, RateLimit] = {}
+    for item in (value or "").split(","):
+        key, _, spec = item.strip().partition("=")
+        if not key or not spec:
+            continue
+        rpm, _, tpm = spec.partition("/")
+        limits[key.strip().lower()] = RateLimit(
+            requests_per_minute=int(rpm) if rpm.strip() else None,
+            tokens_per_minute=int(tpm) if tpm.strip() else None,
+        )
+    return limits
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """
+    Seconds a provider asked us to back off, from the error or its response.
+    """
+    value = getattr(error, "retry_after", None)
+    if value is not None:
+        return float(value)
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers)
+
+
+def parse_retry_after(headers: Any) -> float | None:
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    """
+    Token bucket that allows reservations into debt; the debt is the queue.
+    """
+
+    def __init__(
+        self, per_minute: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    def wait_for(self, amount: float) -> float:
+        self._refill()
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= amount
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+
+@dataclass
+class _KeyStats:
+    acquired: int = 0
+    waited: int = 0
+    wait_seconds_total: float = 0.0
+    max_wait_seconds: float = 0.0
+    rejected: int = 0
+    penalties: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds_total": round(self.wait_seconds_total, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "rejected": self.rejected,
+            "penalties": self.penalties,
+        }
+
+
+class LLMRateLimiter:
+    """
+    Client-side admission control for LLM calls, per provider or provider:model.
+
+    Each limited key has a requests/min and a tokens/min bucket. `acquire`
+    reserves from both and sleeps until the reservation is due, so bursts are
+    queued briefly instead of turning into provider 429s; a call that would
+    wait longer than `max_wait_seconds` is rejected with RateLimitExceeded.
+    `penalize` applies a provider's retry-after to everyone using the key.
+
+    With `redis`, buckets and retry-after blocks are shared by all replicas; a
+    Redis failure falls back to the local buckets.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        *,
+        max_wait_seconds: float = 30.0,
+        redis: Any = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = limits or {}
+        self._max_wait_seconds = max_wait_seconds
+        self._redis = redis
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._blocked_until: dict[str, float] = {}
+        self._stats: dict[str, _KeyStats] = {}
+
+    def limit_key(self, provider: str, model: str) -> str:
+        model_key = f"{provider}:{model}".lower()
+        # Unlimited providers still get a key so retry-after blocks apply.
+        return model_key if model_key in self._limits else provider.lower()
+
+    async def acquire(self, provider: str, model: str, tokens: int = 0) -> float:
+        """
+        Wait for capacity for one call of about `tokens` tokens.
+
+        Returns the seconds waited.
+        """
+        key = self.limit_key(provider, model)
+        wait = await self.reserve(key, tokens, self._max_wait_seconds)
+        stats = self._stats.setdefault(key, _KeyStats())
+        if wait is None:
+            stats.rejected += 1
+            LLM_RATE_LIMIT_REJECTIONS.inc(key)
+            raise RateLimitExceeded(
+                f"Rate limit for {key} would need a wait over "
+                f"{self._max_wait_seconds:.0f}s",
+                provider=provider,
+                status_code=429,
+            )
+        stats.acquired += 1
+        LLM_RATE_LIMIT_WAIT_SECONDS.observe(wait, key)
+        if wait > 0:
+            stats.waited += 1
+            stats.wait_seconds_total += wait
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    async def try_acquire(self, provider: str, model: str, tokens: int = 0) -> bool:
+        """
+        Take capacity only if it is available now; never waits.
+        """
+        key = self.limit_key(provider, model)
+        stats = self._stats.setdefault(key, _KeyStats())
+        if await self.reserve(key, tokens, 0.0) is None:
+            stats.rejected += 1
+            LLM_RATE_LIMIT_REJECTIONS.inc(key)
+            return False
+        stats.acquired += 1
+        return True
+
+    async def penalize(self, provider: str, model: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        key = self.limit_key(provider, model)
+        self._stats.setdefault(key, _KeyStats()).penalties += 1
+        self._blocked_until[key] = max(
+            self._blocked_until.get(key, 0.0), self._clock() + seconds
+        )
+        if self._redis is not None:
+            try:
+                await self._redis.set(
+                    f"{REDIS_KEY_PREFIX}{{{key}}}:blocked", "1", px=int(seconds * 1000)
+                )
+            except Exception as e:
+                logger.warning("Rate limit penalty write failed: %s", e)
+
+    async def reserve(self, key: str, tokens: int, max_wait: float) -> float | None:
+        """
+        Reserve one request and `tokens` tokens; None if over `max_wait`.
+        """
+        amounts = self._amounts(key, tokens)
+        if self._redis is not None:
+            try:
+                return await self._reserve_redis(key, amounts, max_wait)
+            except Exception as e:
+                logger.warning("Shared rate limiter unavailable: %s", e)
+        return self._reserve_local(key, amounts, max_wait)
+
+    def stats(self) -> dict[str, Any]:
+        return {key: stats.as_dict() for key, stats in self._stats.items()}
+
+    def _amounts(self, key: str, tokens: int) -> list[tuple[str, int, float]]:
+        limit = self._limits.get(key) or RateLimit()
+        amounts = []
+        if limit.requests_per_minute:
+            amounts.append(("requests", limit.requests_per_minute, 1.0))
+        if limit.tokens_per_minute:
+            # A call larger than the bucket could never be admitted; cap it.
+            amounts.append(
+                (
+                    "tokens",
+                    limit.tokens_per_minute,
+                    float(min(tokens, limit.tokens_per_minute)),
+                )
+            )
+        return amounts
+
+    def _reserve_local(
+        self, key: str, amounts: list[tuple[str, int, float]], max_wait: float
+    ) -> float | None:
+        buckets = []
+        for kind, per_minute, amount in amounts:
+            bucket = self._buckets.get((key, kind))
+            if bucket is None:
+                bucket = _Bucket(per_minute, self._clock)
+                self._buckets[(key, kind)] = bucket
+            buckets.append((bucket, amount))
+
+        wait = max(self._blocked_until.get(key, 0.0) - self._clock(), 0.0)
+        for bucket, amount in buckets:
+            wait = max(wait, bucket.wait_for(amount))
+        if wait > max_wait:
+            return None
+        for bucket, amount in buckets:
+            bucket.take(amount)
+        return wait
+
+    async def _reserve_redis(
+        self, key: str, amounts: list[tuple[str, int, float]], max_wait: float
+    ) -> float | None:
+        keys = [f"{REDIS_KEY_PREFIX}{{{key}}}:blocked"]
+        args: list[Any] = [max_wait]
+        for kind, per_minute, amount in amounts:
+            keys.append(f"{REDIS_KEY_PREFIX}{{{key}}}:{kind}")
+            args.extend([per_minute, per_minute / 60.0, amount])
+        result = float(await self._redis.eval(_RESERVE_SCRIPT, len(keys), *keys, *args))
+        return None if result < 0 else result
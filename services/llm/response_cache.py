@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from platform_common.logging.logging import get_logger
+
+logger = get_logger("project_management.response_cache")
+
+REDIS_KEY_PREFIX = "project-management:llm-response:"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class CachedResponse:
+    text: str
+    provider: str
+    model: str
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResponse":
+        return cls(**json.loads(raw))
+
+
+def response_cache_key(
+    project_id: str, model: str, temperature: float, messages: list[dict[str, str]]
+) -> str:
+    """
+    Hash of the project, model, temperature and prompt, with whitespace in each
+    message collapsed so trivially different spacing still hits. The project id
+    keeps projects that share the default system prompt from sharing replies.
+    """
+    normalized = [
+        [message.get("role", ""), _WHITESPACE.sub(" ", message.get("content", ""))]
+        for message in messages
+    ]
+    raw = json.dumps([str(project_id), model, round(float(temperature), 3), normalized])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache of completed assistant replies, kept in an in-process
+    LRU and optionally mirrored to Redis so every replica can serve a hit.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1_000,
+        ttl_seconds: float = 3_600.0,
+        redis: Any = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._redis = redis
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self._entries.pop(key, None)
+
+        response = await self._redis_get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._store_local(key, response)
+        return response
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        self.stores += 1
+        self._store_local(key, response)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                f"{REDIS_KEY_PREFIX}{key}",
+                response.to_json(),
+                ex=int(self._ttl_seconds),
+            )
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+        }
+
+    def _store_local(self, key: str, response: CachedResponse) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_get(self, key: str) -> CachedResponse | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"{REDIS_KEY_PREFIX}{key}")
+            return CachedResponse.from_json(raw) if raw else None
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
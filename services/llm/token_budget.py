@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - dependency resolved in service image
+    tiktoken = None  # type: ignore[assignment]
+
+# Chat formats add a few framing tokens per message on top of the content.
+MESSAGE_OVERHEAD_TOKENS = 4
+CHARS_PER_TOKEN_ESTIMATE = 4
+MIN_TRUNCATED_MESSAGE_TOKENS = 64
+TRUNCATION_MARKER = "\n...[truncated {count} tokens]...\n"
+
+DEFAULT_CONTEXT_WINDOW = 8_192
+# Longest matching prefix wins.
+MODEL_CONTEXT_WINDOWS: dict[str, int] = {
+    "gpt-3.5-turbo": 16_385,
+    "gpt-4": 8_192,
+    "gpt-4-turbo": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4.1": 1_047_576,
+    "o1": 200_000,
+    "o3": 200_000,
+    "o4": 200_000,
+    "claude": 200_000,
+}
+
+
+def context_window_for_model(model: str) -> int:
+    matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_WINDOW
+    return MODEL_CONTEXT_WINDOWS[max(matches, key=len)]
+
+
+@dataclass
+class ContextBudget:
+    """
+    Token limits for a prompt. `max_context_tokens` caps the prompt below the
+    model's window (to bound cost); `response_reserve_tokens` is kept free for
+    the completion.
+    """
+
+    max_context_tokens: int | None = None
+    response_reserve_tokens: int = 1_024
+
+    def prompt_tokens_for(self, model: str) -> int:
+        window = context_window_for_model(model)
+        if self.max_context_tokens:
+            window = min(window, self.max_context_tokens)
+        return max(window - self.response_reserve_tokens, 0)
+
+
+@dataclass
+class HistoryMessage:
+    id: str
+    role: str
+    content: str
+
+
+@dataclass
+class FittedContext:
+    messages: list[dict[str, str]]
+    token_count: int
+    dropped_messages: int
+    truncated_messages: int
+
+
+class TokenCounter:
+    """
+    Counts tokens with tiktoken when available, else a chars/4 estimate.
+
+    Counts for stored messages are memoized by message id, so a conversation's
+    history is only tokenized once per process.
+    """
+
+    def __init__(self, maxsize: int = 50_000) -> None:
+        self._maxsize = maxsize
+        self._counts: OrderedDict[Hashable, int] = OrderedDict()
+        self._encodings: dict[str, Any] = {}
+
+    def _encoding(self, model: str) -> Any:
+        if tiktoken is None:
+            return None
+        if model not in self._encodings:
+            try:
+                self._encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encodings[model] = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                # Encodings are fetched on first use; fall back if that fails.
+                self._encodings[model] = None
+        return self._encodings[model]
+
+    async def load(self, model: str) -> None:
+        """
+        Resolve the encoding for `model` in a worker thread. tiktoken downloads
+        an encoding's BPE file on first use, which must not block the loop.
+        """
+        if tiktoken is not None and model not in self._encodings:
+            await asyncio.to_thread(self._encoding, model)
+
+    def count(self, text: str, model: str) -> int:
+        encoding = self._encoding(model)
+        if encoding is None:
+            return -(-len(text) // CHARS_PER_TOKEN_ESTIMATE)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_message(self, message: HistoryMessage, model: str) -> int:
+        key = (message.id, len(message.content), model)
+        cached = self._counts.get(key)
+        if cached is not None:
+            self._counts.move_to_end(key)
+            return cached
+        tokens = self.count(message.content, model) + MESSAGE_OVERHEAD_TOKENS
+        self._counts[key] = tokens
+        while len(self._counts) > self._maxsize:
+            self._counts.popitem(last=False)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int, model: str) -> str:
+        """
+        Keep the head and tail of `text` within `max_tokens`, marking the cut.
+        """
+        total = self.count(text, model)
+        if total <= max_tokens:
+            return text
+        marker = TRUNCATION_MARKER.format(count=total - max_tokens)
+        keep = max(max_tokens - self.count(marker, model), 0)
+        head, tail = keep // 2, keep - keep // 2
+
+        encoding = self._encoding(model)
+        if encoding is None:
+            head *= CHARS_PER_TOKEN_ESTIMATE
+            tail *= CHARS_PER_TOKEN_ESTIMATE
+            return f"{text[:head]}{marker}{text[len(text) - tail:]}"
+        tokens = encoding.encode(text, disallowed_special=())
+        return (
+            f"{encoding.decode(tokens[:head])}{marker}"
+            f"{encoding.decode(tokens[len(tokens) - tail:])}"
+        )
+
+
+default_token_counter = TokenCounter()
+
+
+def fit_messages(
+    *,
+    system_prompt: str,
+    history: list[HistoryMessage],
+    model: str,
+    budget: ContextBudget,
+    counter: TokenCounter = default_token_counter,
+) -> FittedContext:
+    """
+    Fill the prompt newest-first from `history` (oldest to newest) until the
+    budget is spent. The first message that does not fit is truncated if enough
+    room is left for it to be useful; anything older is dropped.
+    """
+    remaining = budget.prompt_tokens_for(model)
+    remaining -= counter.count(system_prompt, model) + MESSAGE_OVERHEAD_TOKENS
+
+    selected: list[dict[str, str]] = []
+    dropped = 0
+    truncated = 0
+    for index in range(len(history) - 1, -1, -1):
+        message = history[index]
+        tokens = counter.count_message(message, model)
+        if tokens <= remaining:
+            selected.append({"role": message.role, "content": message.content})
+            remaining -= tokens
+            continue
+
+        room = remaining - MESSAGE_OVERHEAD_TOKENS
+        # The newest message is the one being answered, so it is always kept.
+        if room >= MIN_TRUNCATED_MESSAGE_TOKENS or not selected:
+            room = max(room, MIN_TRUNCATED_MESSAGE_TOKENS)
+            content = counter.truncate(message.content, room, model)
+            selected.append({"role": message.role, "content": content})
+            remaining -= counter.count(content, model) + MESSAGE_OVERHEAD_TOKENS
+            truncated += 1
+            dropped += index
+        else:
+            dropped += index + 1
+        break
+
+    messages = [{"role": "system", "content": system_prompt}]
+    messages.extend(reversed(selected))
+    return FittedContext(
+        messages=messages,
+        token_count=budget.prompt_tokens_for(model) - remaining,
+        dropped_messages=dropped,
+        truncated_messages=truncated,
+    )
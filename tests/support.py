@@ -0,0 +1,46 @@
+"""
+Helpers shared by the tests and the benchmarks.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+
+class FakeClock:
+    """
+    Monotonic clock stand-in; tests move time by assigning `now`.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def placeholder(column: Any) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return "x"
+    if python_type is datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+    if python_type in (dict, list):
+        return python_type()
+    return python_type() if python_type in (int, float, bool) else "x"
+
+
+def model_row(model: Any, **values: Any) -> Any:
+    """
+    Build `model` from `values`, filling required columns the caller does not
+    care about with placeholders.
+    """
+    for column in model.__table__.columns:
+        if column.key in values or column.nullable:
+            continue
+        if column.default is not None or column.server_default is not None:
+            continue
+        values[column.key] = placeholder(column)
+    return model(**values)
@@ -0,0 +1,224 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm.anthropic_provider import (  # noqa: E402
+    AnthropicProvider,
+    build_messages_payload,
+)
+from services.llm.provider_interface import LLMProviderError  # noqa: E402
+
+# Recorded from a /v1/messages stream, trimmed to the events the provider reads.
+# Each event's data is written as a dict here and dumped to one line.
+RECORDED_EVENTS = [
+    (
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_01",
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": "claude-sonnet-4-5",
+                "usage": {
+                    "input_tokens": 12,
+                    "cache_creation_input_tokens": 0,
+                    "cache_read_input_tokens": 1830,
+                    "output_tokens": 1,
+                },
+            },
+        },
+    ),
+    (
+        "content_block_start",
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        },
+    ),
+    ("ping", {"type": "ping"}),
+    (
+        "content_block_delta",
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": "Hello"},
+        },
+    ),
+    (
+        "content_block_delta",
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": " there"},
+        },
+    ),
+    ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    (
+        "message_delta",
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": 6},
+        },
+    ),
+    ("message_stop", {"type": "message_stop"}),
+]
+
+OVERLOADED_EVENTS = [
+    (
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {"usage": {"input_tokens": 12, "output_tokens": 1}},
+        },
+    ),
+    (
+        "error",
+        {
+            "type": "error",
+            "error": {"type": "overloaded_error", "message": "Overloaded"},
+        },
+    ),
+]
+
+
+def _sse(events):
+    return "".join(
+        f"event: {name}\ndata: {json.dumps(data)}\n\n" for name, data in events
+    )
+
+
+RECORDED_STREAM = _sse(RECORDED_EVENTS)
+OVERLOADED_STREAM = _sse(OVERLOADED_EVENTS)
+
+
+class FakeAnthropicServer:
+    """
+    Minimal HTTP/1.1 server that records each request and replays a response.
+    """
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        self.requests = []
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def base_url(self):
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def _handle(self, reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")
+        headers = {
+            name.lower(): value.strip()
+            for name, value in (line.split(":", 1) for line in lines[1:] if line)
+        }
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        self.requests.append({"headers": headers, "json": json.loads(body)})
+
+        content_type = "text/event-stream" if self.status < 400 else "application/json"
+        writer.write(
+            f"HTTP/1.1 {self.status} OK\r\n"
+            f"content-type: {content_type}\r\n"
+            "connection: close\r\n\r\n".encode()
+        )
+        for chunk in self.body.split("\n\n"):
+            writer.write(f"{chunk}\n\n".encode())
+            await writer.drain()
+        writer.close()
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are Lucy."},
+    {"role": "user", "content": "first question"},
+    {"role": "assistant", "content": "first answer"},
+    {"role": "user", "content": "second question"},
+]
+
+
+async def _collect(provider, messages=MESSAGES):
+    return [
+        event
+        async for event in provider.stream_chat(
+            messages=messages, model="claude-sonnet-4-5", temperature=0.2
+        )
+    ]
+
+
+def test_stream_maps_deltas_and_usage_and_marks_cacheable_prefix():
+    async def scenario():
+        async with FakeAnthropicServer(200, RECORDED_STREAM) as server:
+            provider = AnthropicProvider(api_key="test-key", base_url=server.base_url)
+            try:
+                return server.requests, await _collect(provider)
+            finally:
+                await provider.aclose()
+
+    requests, events = asyncio.run(scenario())
+
+    assert "".join(event.delta for event in events) == "Hello there"
+    usage = events[-1].usage
+    assert usage["cache_read_input_tokens"] == 1830
+    assert usage["prompt_tokens"] == 1842
+    assert usage["completion_tokens"] == 6
+
+    request = requests[0]
+    assert request["headers"]["x-api-key"] == "test-key"
+    body = request["json"]
+    assert body["stream"] is True
+    assert body["system"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert [turn["role"] for turn in body["messages"]] == [
+        "user",
+        "assistant",
+        "user",
+    ]
+    # The breakpoint closes the shared history; the new question is not cached.
+    assert body["messages"][1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in body["messages"][2]["content"][-1]
+
+
+def test_stream_raises_provider_error_for_http_and_stream_errors():
+    async def run(status, body):
+        async with FakeAnthropicServer(status, body) as server:
+            provider = AnthropicProvider(api_key="test-key", base_url=server.base_url)
+            try:
+                await _collect(provider)
+            finally:
+                await provider.aclose()
+
+    with pytest.raises(LLMProviderError) as http_error:
+        asyncio.run(run(529, '{"type":"error","error":{"type":"overloaded_error"}}'))
+    assert http_error.value.status_code == 529
+
+    with pytest.raises(LLMProviderError) as stream_error:
+        asyncio.run(run(200, OVERLOADED_STREAM))
+    assert stream_error.value.error_type == "overloaded_error"
+
+
+def test_leading_assistant_turns_left_by_trimming_are_dropped():
+    system, turns = build_messages_payload(
+        [
+            {"role": "system", "content": "You are Lucy."},
+            {"role": "assistant", "content": "answer to a trimmed question"},
+            {"role": "user", "content": "next question"},
+        ]
+    )
+
+    assert [turn["role"] for turn in turns] == ["user"]
+    assert turns[0]["content"][0]["text"] == "next question"
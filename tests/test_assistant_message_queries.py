@@ -0,0 +1,263 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from platform_common.models.event_outbox import EventOutbox  # noqa: E402
+from platform_common.models.project_conversation import (  # noqa: E402
+    ProjectConversation,
+)
+from platform_common.models.project_conversation_message import (  # noqa: E402
+    ProjectConversationMessage,
+)
+from platform_common.pubsub.event import PubSubEvent  # noqa: E402
+from platform_common.utils.enums import EventType  # noqa: E402
+
+from app.pubsub import project_workspace_job_subscriber as subscriber  # noqa: E402
+from app.pubsub.project_workspace_job_subscriber import (  # noqa: E402
+    _checkpoint_partial_text,
+    _complete_assistant_message,
+    _create_streaming_message,
+    _take_over_streaming_message,
+)
+from tests.support import model_row  # noqa: E402
+
+TABLES = [
+    ProjectConversation.__table__,
+    ProjectConversationMessage.__table__,
+    EventOutbox.__table__,
+]
+
+
+def test_job_db_work_is_two_statements_to_create_and_three_to_finalize():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        statements = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            conversation = model_row(
+                ProjectConversation, id="c1", project_id="p1", message_count=1
+            )
+            session.add(conversation)
+            await session.commit()
+
+            def create():
+                return _create_streaming_message(
+                    session=session,
+                    conversation=conversation,
+                    project_id="p1",
+                    user_message_id="u1",
+                    provider="openai",
+                    model="gpt-4o",
+                )
+
+            statements.clear()
+            message = await create()
+            create_statements = list(statements)
+
+            statements.clear()
+            duplicate = await create()
+            duplicate_statements = list(statements)
+
+            statements.clear()
+            await _complete_assistant_message(
+                session,
+                request=SimpleNamespace(
+                    context=SimpleNamespace(
+                        project=SimpleNamespace(id="p1", datastore_id=None)
+                    )
+                ),
+                assistant_message=message,
+                full_text="hello",
+                usage_json=None,
+            )
+            finalize_statements = list(statements)
+
+        await engine.dispose()
+        return (
+            message,
+            duplicate,
+            conversation,
+            create_statements,
+            duplicate_statements,
+            finalize_statements,
+        )
+
+    message, duplicate, conversation, create, dup, finalize = asyncio.run(scenario())
+
+    assert message is not None and duplicate is None
+    assert conversation.message_count == 2
+    assert [s.split()[0] for s in create] == ["INSERT", "UPDATE"]
+    assert [s.split()[0] for s in dup] == ["INSERT"]
+    assert sorted(s.split()[0] for s in finalize) == ["INSERT", "UPDATE", "UPDATE"]
+
+
+def test_reclaimed_job_takes_over_only_a_stale_streaming_reply():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            conversation = model_row(
+                ProjectConversation, id="c1", project_id="p1", message_count=1
+            )
+            session.add(conversation)
+            await session.commit()
+            message = await _create_streaming_message(
+                session=session,
+                conversation=conversation,
+                project_id="p1",
+                user_message_id="u1",
+                provider="openai",
+                model="gpt-4o",
+            )
+            message.content_text = "partial"
+            message.updated_at = 100
+            await session.commit()
+
+            def take_over(stale_before):
+                return _take_over_streaming_message(
+                    session=session,
+                    conversation_id="c1",
+                    user_message_id="u1",
+                    provider="anthropic",
+                    model="claude",
+                    stale_before=stale_before,
+                )
+
+            live = await take_over(stale_before=100)
+            stale = await take_over(stale_before=101)
+        await engine.dispose()
+        return message, live, stale
+
+    message, live, stale = asyncio.run(scenario())
+
+    assert live is None
+    assert stale is not None and stale.id == message.id
+    assert stale.content_text == "" and stale.provider == "anthropic"
+
+
+def test_duplicate_job_does_not_reserve_rate_limit_capacity(monkeypatch):
+    acquired = []
+
+    async def acquire(provider, model, tokens=0):
+        acquired.append((provider, model))
+        return 0.0
+
+    monkeypatch.setattr(subscriber.llm_rate_limiter, "acquire", acquire)
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            conversation = model_row(
+                ProjectConversation, id="c1", project_id="p1", message_count=1
+            )
+            session.add(conversation)
+            await session.commit()
+            await _create_streaming_message(
+                session=session,
+                conversation=conversation,
+                project_id="p1",
+                user_message_id="u1",
+                provider="openai",
+                model="gpt-4o",
+            )
+
+            async def get_session():
+                yield session
+
+            async def build_request(self, **kwargs):
+                return SimpleNamespace(
+                    provider="openai",
+                    model="gpt-4o",
+                    cached_response=None,
+                    context=SimpleNamespace(conversation=conversation),
+                )
+
+            monkeypatch.setattr(subscriber, "get_session", get_session)
+            monkeypatch.setattr(subscriber.LLMService, "build_request", build_request)
+            monkeypatch.setattr(
+                subscriber.LLMService, "estimated_tokens", lambda self, request: 0
+            )
+            outcome = await subscriber._generate_assistant_response(
+                PubSubEvent(
+                    event_type=EventType.GENERATE_ASSISTANT_RESPONSE,
+                    payload={
+                        "conversation_id": "c1",
+                        "project_id": "p1",
+                        "user_message_id": "u1",
+                    },
+                )
+            )
+        await engine.dispose()
+        return outcome
+
+    assert asyncio.run(scenario()) == "duplicate"
+    assert acquired == []
+
+
+def test_checkpoints_append_and_resync_when_out_of_step(monkeypatch):
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            conversation = model_row(
+                ProjectConversation, id="c1", project_id="p1", message_count=1
+            )
+            session.add(conversation)
+            await session.commit()
+            message = await _create_streaming_message(
+                session=session,
+                conversation=conversation,
+                project_id="p1",
+                user_message_id="u1",
+                provider="openai",
+                model="gpt-4o",
+            )
+
+            async def get_session():
+                yield session
+
+            monkeypatch.setattr(subscriber, "get_session", get_session)
+
+            async def stored():
+                await session.refresh(message)
+                return message.content_text
+
+            texts = []
+            assert await _checkpoint_partial_text(message.id, "hello", 0)
+            texts.append(await stored())
+            assert await _checkpoint_partial_text(message.id, "hello world", 5)
+            texts.append(await stored())
+            # The caller lost track of a committed append: rewrite, don't repeat.
+            assert await _checkpoint_partial_text(message.id, "hello world!", 5)
+            texts.append(await stored())
+        await engine.dispose()
+        return texts
+
+    assert asyncio.run(scenario()) == ["hello", "hello world", "hello world!"]
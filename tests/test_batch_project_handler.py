@@ -0,0 +1,119 @@
+import asyncio
+import datetime
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from platform_common.models.project import Project  # noqa: E402
+
+from app.api.handler import batch_project_handler  # noqa: E402
+from app.api.handler.batch_project_handler import BatchProjectHandler  # noqa: E402
+from app.db.dal.project_query_dal import ProjectQueryDAL  # noqa: E402
+
+
+class FakeRequest:
+    def __init__(self, payload):
+        self.state = SimpleNamespace(user_id="u1")
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+
+async def _allow_all(*, resource_objs, **kwargs):
+    return {str(project.id): True for project in resource_objs}
+
+
+def _run_batch(payload, monkeypatch):
+    monkeypatch.setattr(batch_project_handler, "can_many", _allow_all)
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[Project.__table__]
+                )
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            session.add_all(
+                [
+                    Project(
+                        id=project_id,
+                        name=name,
+                        owner_id="u1",
+                        owner_type="user",
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    for project_id, name in (("p1", "one"), ("p2", "two"))
+                ]
+            )
+            await session.commit()
+
+            handler = BatchProjectHandler(ProjectQueryDAL(session))
+            response = await handler.do_process(FakeRequest(payload))
+            stored = {
+                project.id: project
+                for project in (await session.execute(select(Project))).scalars()
+            }
+        await engine.dispose()
+        return response.body, stored
+
+    return asyncio.run(scenario())
+
+
+def _results(body, operation):
+    return json.loads(body)["data"][operation]
+
+
+def test_batch_update_rejects_ownership_changes(monkeypatch):
+    body, stored = _run_batch(
+        {
+            "update": [
+                {"id": "p1", "owner_id": "someone-else"},
+                {"id": "p2", "organization_id": "o1", "name": "moved"},
+                {"id": "p2", "name": "renamed"},
+            ]
+        },
+        monkeypatch,
+    )
+
+    results = _results(body, "update")
+    assert [r["success"] for r in results] == [False, False, False]
+    assert results[0]["error"]["code"] == "OWNERSHIP_CHANGE_NOT_ALLOWED"
+    assert results[1]["error"]["code"] == "OWNERSHIP_CHANGE_NOT_ALLOWED"
+    assert results[2]["error"]["code"] == "DUPLICATE_ITEM"
+    assert stored["p1"].owner_id == "u1"
+    assert stored["p2"].organization_id is None and stored["p2"].name == "two"
+
+
+def test_batch_write_failures_are_reported_per_item(monkeypatch):
+    body, stored = _run_batch(
+        {
+            "create": [
+                {"id": "p1", "name": "clashes with an existing project"},
+                {"id": "p3", "name": "three"},
+            ],
+            "update": [{"id": "p2", "name": "renamed"}],
+        },
+        monkeypatch,
+    )
+
+    created = _results(body, "create")
+    assert created[0]["success"] is False
+    assert created[0]["error"]["code"] == "WRITE_FAILED"
+    assert created[1]["success"] is True
+    assert _results(body, "update")[0]["success"] is True
+    assert stored["p1"].name == "one"
+    assert stored["p2"].name == "renamed"
+    assert "p3" in stored
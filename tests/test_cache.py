@@ -0,0 +1,37 @@
+from app.core.cache import TTLCache
+from tests.support import FakeClock
+
+
+def test_ttl_cache_expires_entries_and_counts_hits():
+    clock = FakeClock()
+    cache = TTLCache(name="test", maxsize=10, ttl_seconds=5, clock=clock)
+
+    cache.set(("user", "project", 1), True)
+    assert cache.get(("user", "project", 1)) is True
+
+    clock.now = 6
+    assert cache.get(("user", "project", 1)) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(name="test", maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_delete_where():
+    cache = TTLCache(name="test", maxsize=10, ttl_seconds=60)
+    cache.set(("u1", "p1", 1), True)
+    cache.set(("u2", "p1", 1), True)
+    cache.set(("u1", "p2", 1), True)
+
+    assert cache.delete_where(lambda key: key[1] == "p1") == 2
+    assert len(cache) == 1
@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm import context_builder  # noqa: E402
+from services.llm.context_cache import (  # noqa: E402
+    CachedConversationContext,
+    ConversationContextCache,
+)
+from services.llm.token_budget import HistoryMessage  # noqa: E402
+
+
+def _context(message_count, *ids):
+    return CachedConversationContext(
+        message_count=message_count,
+        history=[HistoryMessage(id=i, role="user", content=i) for i in ids],
+    )
+
+
+def test_append_extends_entry_that_is_in_step():
+    cache = ConversationContextCache(max_messages=2)
+
+    async def scenario():
+        await cache.put("c1", _context(2, "m0", "m1"))
+        await cache.append(
+            "c1",
+            HistoryMessage(id="m2", role="assistant", content="hi"),
+            message_count=3,
+        )
+        return await cache.get("c1")
+
+    context = asyncio.run(scenario())
+    assert [m.id for m in context.history] == ["m1", "m2"]
+    assert context.message_count == 3
+
+
+def test_append_out_of_step_drops_entry():
+    cache = ConversationContextCache()
+
+    async def scenario():
+        await cache.put("c1", _context(2, "m0", "m1"))
+        await cache.append("c1", None, message_count=5)
+        return await cache.get("c1")
+
+    assert asyncio.run(scenario()) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_round_trip_through_json():
+    context = _context(1, "m0")
+    assert CachedConversationContext.from_json(context.to_json()) == context
+
+
+def test_warm_context_picks_up_project_prompt_changes(monkeypatch):
+    project = SimpleNamespace(
+        id="p1", llm_system_prompt="Be brief.", llm_model_override=None
+    )
+    conversation = SimpleNamespace(id="c1", project_id="p1", message_count=1)
+    row = SimpleNamespace(
+        id="m0",
+        conversation_id="c1",
+        role="user",
+        status="complete",
+        content_text="hello",
+        Status=SimpleNamespace(ERROR="error"),
+    )
+
+    class ConversationDAL:
+        def __init__(self, session):
+            pass
+
+        async def get_active(self, conversation_id):
+            return conversation
+
+    class ProjectDAL(ConversationDAL):
+        async def get_by_id(self, project_id):
+            return project
+
+    class MessageDAL(ConversationDAL):
+        async def list_recent_for_conversation(self, conversation_id, limit):
+            return [row]
+
+    monkeypatch.setattr(context_builder, "ProjectConversationDAL", ConversationDAL)
+    monkeypatch.setattr(context_builder, "ProjectDAL", ProjectDAL)
+    monkeypatch.setattr(context_builder, "ProjectConversationMessageDAL", MessageDAL)
+    monkeypatch.setattr(
+        context_builder,
+        "get_settings",
+        lambda: SimpleNamespace(
+            llm_context_window_messages=50, llm_default_model="gpt-4o"
+        ),
+    )
+    cache = ConversationContextCache()
+
+    async def scenario():
+        first = await context_builder.build_context(
+            None, "c1", cache=cache, user_message_id="m0"
+        )
+        project.llm_system_prompt = "Be thorough."
+        second = await context_builder.build_context(
+            None, "c1", cache=cache, user_message_id="m0"
+        )
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.messages[0]["content"] == "Be brief."
+    assert second.messages[0]["content"] == "Be thorough."
+    assert cache.stats()["hits"] == 1
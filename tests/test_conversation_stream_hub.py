@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+from app.pubsub.conversation_stream_hub import ConversationStreamHub
+
+
+def _chunk(seq, delta, message_id="m1"):
+    return {
+        "conversation_id": "c1",
+        "message_id": message_id,
+        "delta": delta,
+        "seq": seq,
+    }
+
+
+def _frames(raw):
+    frames = []
+    for block in raw.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        frames.append((fields["id"], json.loads(fields["data"])))
+    return frames
+
+
+def test_hub_fans_out_to_clients_and_resumes_from_last_event_id():
+    hub = ConversationStreamHub(buffer_size=8)
+
+    async def scenario():
+        live = hub.stream("c1")
+        first = asyncio.ensure_future(live.__anext__())
+        await asyncio.sleep(0)
+        hub.publish("chunk", _chunk(0, "Hel"))
+        hub.publish("chunk", _chunk(1, "lo"))
+        hub.publish("other", {"conversation_id": "c2", "message_id": "x"})
+        received = await first
+
+        resumed = hub.stream("c1", last_event_id="m1:0")
+        replayed = await resumed.__anext__()
+        await live.aclose()
+        await resumed.aclose()
+        return received, replayed
+
+    received, replayed = asyncio.run(scenario())
+
+    assert [frame_id for frame_id, _ in _frames(received)] == ["m1:0", "m1:1"]
+    assert _frames(replayed) == [("m1:1", _chunk(1, "lo"))]
+    assert hub.stats()["clients"] == 0
+    assert hub.stats()["replayed"] == 1
+
+
+def test_slow_client_gets_coalesced_deltas():
+    hub = ConversationStreamHub(client_max_frames=2)
+
+    async def scenario():
+        slow = hub.stream("c1")
+        pending = asyncio.ensure_future(slow.__anext__())
+        await asyncio.sleep(0)
+        for seq, delta in enumerate(["a", "b", "c", "d"]):
+            hub.publish("chunk", _chunk(seq, delta))
+        hub.publish("completed", {**_chunk(4, None), "delta": None})
+        raw = await pending
+        await slow.aclose()
+        return raw
+
+    frames = _frames(asyncio.run(scenario()))
+
+    assert [frame_id for frame_id, _ in frames] == ["m1:0", "m1:3", "m1:4"]
+    assert frames[1][1]["delta"] == "bcd"
+    assert hub.stats()["coalesced"] == 2
@@ -0,0 +1,42 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.db import session as db_session
+from app.db.session import build_engine, engine_options, pool_stats
+
+
+def test_engine_options_tune_asyncpg_and_skip_sizing_for_memory_sqlite(monkeypatch):
+    monkeypatch.setattr(db_session.settings, "DB_STATEMENT_TIMEOUT_MS", 5_000)
+    monkeypatch.setattr(db_session.settings, "DB_POOL_SIZE", 7)
+
+    options = engine_options(make_url("postgresql+asyncpg://u:p@db/app"))
+    unpooled = engine_options(make_url("postgresql+asyncpg://u:p@db/app"), pooled=False)
+    memory = engine_options(make_url("sqlite+aiosqlite://"))
+
+    assert options["pool_size"] == 7
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": 100,
+        "server_settings": {"statement_timeout": "5000"},
+    }
+    assert "pool_size" not in memory and "connect_args" not in memory
+    assert "pool_size" not in unpooled and "connect_args" in unpooled
+
+
+def test_pool_stats_report_checked_out_connections(tmp_path):
+    async def scenario():
+        engine = build_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=2
+        )
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            during = pool_stats(engine, max_overflow=2)
+        after = pool_stats(engine, max_overflow=2)
+        await engine.dispose()
+        return during, after
+
+    during, after = asyncio.run(scenario())
+
+    assert during["checked_out"] == 1 and during["utilization"] == 0.25
+    assert after["checked_out"] == 0 and after["checked_in"] == 1
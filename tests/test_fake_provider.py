@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm.fake_provider import FakeProvider, FakeProviderConfig  # noqa: E402
+from services.llm.provider_interface import LLMProviderError  # noqa: E402
+
+
+def _collect(provider):
+    async def scenario():
+        events = []
+        try:
+            async for event in provider.stream_chat(
+                messages=[{"role": "user", "content": "hi there"}],
+                model="fake-model",
+                temperature=0.0,
+            ):
+                events.append(event)
+        except LLMProviderError as error:
+            return events, error
+        return events, None
+
+    return asyncio.run(scenario())
+
+
+def test_fake_provider_streams_configured_reply():
+    provider = FakeProvider(
+        config=FakeProviderConfig(
+            tokens_per_second=0, reply_tokens=3, first_token_latency_seconds=0
+        )
+    )
+
+    events, error = _collect(provider)
+
+    assert error is None
+    assert "".join(event.delta for event in events) == "token0 token1 token2 "
+    assert events[-1].usage == {
+        "prompt_tokens": 2,
+        "completion_tokens": 3,
+        "total_tokens": 5,
+    }
+
+
+def test_fake_provider_injects_errors_mid_stream():
+    provider = FakeProvider(
+        config=FakeProviderConfig(
+            tokens_per_second=0,
+            reply_tokens=4,
+            first_token_latency_seconds=0,
+            error_rate=1.0,
+            error_after_tokens=2,
+        )
+    )
+
+    events, error = _collect(provider)
+
+    assert [event.delta for event in events] == ["token0 ", "token1 "]
+    assert error.status_code == 503 and error.provider == "fake"
@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from app.services.health_service import (  # noqa: E402
+    ReadinessProbe,
+    check_job_subscriber,
+)
+from tests.support import FakeClock  # noqa: E402
+
+
+def test_probe_caches_results_and_shares_a_stale_run():
+    calls = 0
+
+    async def database(app):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    clock = FakeClock()
+    probe = ReadinessProbe(
+        {"database": database}, ttl_seconds=2.0, timeout_seconds=1.0, clock=clock
+    )
+
+    async def scenario():
+        first = await asyncio.gather(*(probe.check(None) for _ in range(5)))
+        clock.now = 1.0
+        await probe.check(None)
+        clock.now = 3.0
+        await probe.check(None)
+        return first
+
+    results = asyncio.run(scenario())
+
+    assert calls == 2
+    assert results[0] == {"status": "ready", "checks": {"database": {"status": "ok"}}}
+
+
+def test_failed_or_slow_check_makes_service_unready():
+    async def redis(app):
+        raise ConnectionError("refused")
+
+    async def database(app):
+        await asyncio.sleep(1)
+        return "ok"
+
+    async def cache(app):
+        return "skipped"
+
+    probe = ReadinessProbe(
+        {"redis": redis, "database": database, "cache": cache},
+        ttl_seconds=2.0,
+        timeout_seconds=0.01,
+    )
+
+    result = asyncio.run(probe.check(None))
+
+    assert result["status"] == "unready"
+    assert result["checks"] == {
+        "redis": {"status": "error", "error": "refused"},
+        "database": {"status": "error", "error": "timeout"},
+        "cache": {"status": "skipped"},
+    }
+
+
+def test_job_subscriber_check_fails_once_the_task_has_stopped():
+    async def scenario():
+        async def crash():
+            raise RuntimeError("boom")
+
+        task = asyncio.create_task(crash())
+        await asyncio.sleep(0)
+        app = SimpleNamespace(state=SimpleNamespace(project_workspace_job_task=task))
+        with pytest.raises(RuntimeError, match="boom"):
+            await check_job_subscriber(app)
+
+    asyncio.run(scenario())
+
+
+def test_job_subscriber_check_accepts_a_subscription_that_returned():
+    async def scenario():
+        async def subscribe():
+            return None  # handlers registered; the platform listens elsewhere
+
+        task = asyncio.create_task(subscribe())
+        await asyncio.sleep(0)
+        app = SimpleNamespace(state=SimpleNamespace(project_workspace_job_task=task))
+        return await check_job_subscriber(app)
+
+    assert asyncio.run(scenario()) == "ok"
@@ -0,0 +1,32 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.pubsub.in_memory_pubsub import InMemoryPubSub
+
+
+def test_publish_records_events_and_dispatches_to_subscribers():
+    pubsub = InMemoryPubSub(clock=lambda: 1.0)
+    received = []
+
+    async def handler(event):
+        received.append(event.payload["n"])
+
+    async def scenario():
+        subscription = asyncio.ensure_future(
+            pubsub.subscribe({"jobs": {"generate": handler}})
+        )
+        await asyncio.sleep(0)
+        await pubsub.publish(
+            "jobs", SimpleNamespace(event_type="generate", payload={"n": 1})
+        )
+        await pubsub.publish(
+            "jobs", SimpleNamespace(event_type="other", payload={"n": 2})
+        )
+        pubsub.close()
+        await subscription
+
+    asyncio.run(scenario())
+
+    assert received == [1]
+    assert pubsub.counts() == {"generate": 1, "other": 1}
+    assert pubsub.events[0].published_at == 1.0
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from app.pubsub.job_worker_pool import JobWorkerPool  # noqa: E402
+
+
+def test_pool_serializes_jobs_per_key_and_bounds_concurrency():
+    running: dict[str, int] = {}
+    peak = {"total": 0, "per_key": 0}
+    order: list[tuple[str, int]] = []
+
+    async def handler(job):
+        key, index = job
+        running[key] = running.get(key, 0) + 1
+        peak["per_key"] = max(peak["per_key"], running[key])
+        peak["total"] = max(peak["total"], sum(running.values()))
+        await asyncio.sleep(0.01)
+        order.append(job)
+        running[key] -= 1
+
+    async def scenario():
+        pool = JobWorkerPool(
+            handler, concurrency=2, max_pending=4, key_fn=lambda job: job[0]
+        )
+        pool.start()
+        for index in range(3):
+            for key in ("a", "b", "c"):
+                await pool.submit((key, index))
+        assert await pool.drain(timeout=5)
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["completed"] == 9
+    assert stats["queue_depth"] == 0
+    assert peak["per_key"] == 1
+    assert peak["total"] <= 2
+    for key in ("a", "b", "c"):
+        assert [i for k, i in order if k == key] == [0, 1, 2]
+
+
+def test_pool_counts_failures_and_keeps_running():
+    async def handler(job):
+        if job == "boom":
+            raise ValueError(job)
+
+    async def scenario():
+        pool = JobWorkerPool(handler, concurrency=1, max_pending=2, key_fn=str)
+        pool.start()
+        await pool.submit("boom")
+        await pool.submit("ok")
+        await pool.drain(timeout=5)
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["failed"] == 1
+    assert stats["completed"] == 1
@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import HTTP_REQUEST_SECONDS, MetricsMiddleware
+from services.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text_and_noops_when_disabled():
+    registry = MetricsRegistry()
+    jobs = registry.counter("jobs", "Jobs run.", ("outcome",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    jobs.inc("completed")
+    jobs.inc("completed")
+    latency.observe(0.05)
+    latency.observe(0.1)
+    latency.observe(3.0)
+    registry.enabled = False
+    jobs.inc("completed")
+    latency.observe(0.5)
+
+    lines = registry.render().splitlines()
+    assert 'jobs_total{outcome="completed"} 2' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_middleware_labels_requests_by_route_template():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    before = HTTP_REQUEST_SECONDS.count("GET", "/items/{item_id}", "200")
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert HTTP_REQUEST_SECONDS.count("GET", "/items/{item_id}", "200") == before + 2
@@ -0,0 +1,138 @@
+import asyncio
+import datetime
+
+import pytest
+
+pytest.importorskip("platform_common")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from platform_common.models.event_outbox import EventOutbox  # noqa: E402
+
+from app.pubsub import outbox_relay  # noqa: E402
+from app.pubsub.outbox_relay import (  # noqa: E402
+    SENT_AT_COLUMN,
+    OutboxRelay,
+    create_outbox_relay,
+)
+
+
+class FakePublisher:
+    def __init__(self, fail_entity_ids=()):
+        self.published = []
+        self.fail_entity_ids = set(fail_entity_ids)
+
+    async def publish(self, topic, event):
+        if event.payload["entity_id"] in self.fail_entity_ids:
+            raise ConnectionError("broker unavailable")
+        self.published.append((topic, event.payload["entity_id"]))
+
+
+def _outbox_row(entity_id, event_name="project.assistant_message_finalized"):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    row = EventOutbox(
+        entity_type="project_conversation_message",
+        entity_id=entity_id,
+        new_status="COMPLETED",
+        payload={"event_name": event_name},
+        occurred_at=now,
+    )
+    setattr(row, SENT_AT_COLUMN, None)
+    return row
+
+
+def test_relay_publishes_pending_rows_once_and_retries_failures(monkeypatch):
+    publisher = FakePublisher(fail_entity_ids={"m2"})
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[EventOutbox.__table__]
+                )
+            )
+
+        async def get_session():
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+
+        monkeypatch.setattr(outbox_relay, "get_session", get_session)
+        monkeypatch.setattr(outbox_relay, "get_publisher", lambda: publisher)
+
+        async with AsyncSession(engine) as session:
+            session.add_all([_outbox_row(f"m{i}") for i in range(1, 4)])
+            await session.commit()
+
+        relay = OutboxRelay(topic="events", batch_size=10)
+        first = await relay.relay_once()
+        publisher.fail_entity_ids.clear()
+        second = await relay.relay_once()
+        third = await relay.relay_once()
+
+        async with AsyncSession(engine) as session:
+            pending = (
+                await session.scalars(
+                    select(EventOutbox).where(
+                        EventOutbox.__table__.c[SENT_AT_COLUMN].is_(None)
+                    )
+                )
+            ).all()
+        await engine.dispose()
+        return relay, (first, second, third), pending
+
+    relay, claimed, pending = asyncio.run(scenario())
+
+    assert claimed == (3, 1, 0)
+    assert sorted(entity for _, entity in publisher.published) == ["m1", "m2", "m3"]
+    assert pending == []
+    assert relay.stats()["sent"] == 3
+    assert relay.stats()["failed"] == 1
+
+
+def test_relay_skips_rows_with_unknown_event_types(monkeypatch):
+    publisher = FakePublisher()
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[EventOutbox.__table__]
+                )
+            )
+
+        async def get_session():
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+
+        monkeypatch.setattr(outbox_relay, "get_session", get_session)
+        monkeypatch.setattr(outbox_relay, "get_publisher", lambda: publisher)
+
+        async with AsyncSession(engine) as session:
+            session.add_all([_outbox_row("bad", "not.an.event"), _outbox_row("m1")])
+            await session.commit()
+
+        relay = OutboxRelay(topic="events", batch_size=1)
+        claimed = [await relay.relay_once() for _ in range(3)]
+        await engine.dispose()
+        return relay, claimed
+
+    relay, claimed = asyncio.run(scenario())
+
+    assert claimed == [1, 1, 0]
+    assert [entity for _, entity in publisher.published] == ["m1"]
+    assert relay.stats()["poisoned"] == 1
+
+
+def test_relay_is_off_by_default_and_needs_the_sent_column(monkeypatch):
+    assert create_outbox_relay() is None
+
+    monkeypatch.setattr(outbox_relay.settings, "OUTBOX_RELAY_ENABLED", True)
+    assert isinstance(create_outbox_relay(), OutboxRelay)
+
+    monkeypatch.setattr(outbox_relay, "SENT_AT_COLUMN", "no_such_column")
+    assert create_outbox_relay() is None
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from app.services import permission_service  # noqa: E402
+from app.services.permission_service import can_many  # noqa: E402
+
+
+def _project(project_id, organization_id=None, owner_id="someone"):
+    return SimpleNamespace(
+        id=project_id,
+        owner_id=owner_id,
+        owner_type="org" if organization_id else "user",
+        organization_id=organization_id,
+    )
+
+
+def test_org_projects_are_resolved_with_one_membership_lookup_per_org(monkeypatch):
+    calls = []
+
+    async def fake_can(*, resource_obj, **kwargs):
+        calls.append(resource_obj.id)
+        if str(resource_obj.id).startswith("organization:"):
+            return resource_obj.organization_id == "member-org"
+        # Outside the member org, only an explicit project grant allows access.
+        return resource_obj.id == "shared"
+
+    monkeypatch.setattr(permission_service, "can", fake_can)
+    projects = [
+        _project("mine", owner_id="u-bulk"),
+        _project("m1", "member-org"),
+        _project("m2", "member-org"),
+        _project("m3", "member-org"),
+        _project("shared", "other-org"),
+        _project("private", "other-org"),
+    ]
+
+    decisions = asyncio.run(
+        can_many(
+            session=None,
+            user_id="u-bulk",
+            perm_bit=1,
+            resource_type="project",
+            resource_objs=projects,
+        )
+    )
+
+    assert decisions == {
+        "mine": True,
+        "m1": True,
+        "m2": True,
+        "m3": True,
+        "shared": True,
+        "private": False,
+    }
+    assert sorted(calls) == [
+        "organization:member-org",
+        "organization:other-org",
+        "private",
+        "shared",
+    ]
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import profiling
+from app.core.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    RequestProfile,
+    StackSampler,
+    profile_job,
+    record_span,
+    span,
+)
+
+
+def _app(store, *, sample_rate=0.0, random_fn=lambda: 1.0):
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        started = time.perf_counter()
+        time.sleep(0.02)
+        record_span("db", "SELECT 1", started, time.perf_counter())
+        return {"ok": True}
+
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=store,
+        sampler=StackSampler(0.001),
+        sample_rate=sample_rate,
+        random_fn=random_fn,
+    )
+    return TestClient(app)
+
+
+def test_debug_header_profiles_request_and_records_spans(monkeypatch):
+    monkeypatch.setattr(profiling.settings, "PROFILING_DEBUG_TOKEN", "secret")
+    store = ProfileStore(max_entries=10)
+    client = _app(store)
+
+    response = client.get(
+        "/work", headers={"X-Debug-Token": "secret", "X-Request-ID": "req-1"}
+    )
+
+    # Profiles are keyed by a server id, never by the client's request id.
+    assert store.get("req-1") is None
+    profile = store.get(response.headers["x-profile-id"])
+    assert profile.trigger == "header"
+    assert profile.status == 200
+    assert [(span.kind, span.name) for span in profile.spans] == [("db", "SELECT 1")]
+    assert sum(profile.samples.values()) > 0
+    assert "work" in profile.folded()
+
+
+def test_unsampled_and_wrong_token_requests_are_not_profiled(monkeypatch):
+    monkeypatch.setattr(profiling.settings, "PROFILING_DEBUG_TOKEN", "secret")
+    store = ProfileStore(max_entries=10)
+    client = _app(store, sample_rate=0.5, random_fn=lambda: 0.9)
+
+    response = client.get("/work", headers={"X-Debug-Token": "wrong"})
+
+    assert "x-profile-id" not in response.headers
+    assert store.list() == []
+
+
+def test_sampled_request_is_profiled():
+    store = ProfileStore(max_entries=10)
+    client = _app(store, sample_rate=0.5, random_fn=lambda: 0.1)
+
+    response = client.get("/work")
+
+    assert store.get(response.headers["x-profile-id"]).trigger == "sampled"
+
+
+def test_store_evicts_oldest_profile():
+    store = ProfileStore(max_entries=2)
+    for profile_id in ("a", "b", "c"):
+        store.add(RequestProfile("GET", "/", "sampled", profile_id=profile_id))
+
+    assert [profile.profile_id for profile in store.list()] == ["c", "b"]
+    assert store.get("a") is None
+
+
+def test_sampled_jobs_are_profiled_with_their_llm_spans(monkeypatch):
+    store = ProfileStore(max_entries=10)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(profiling.settings, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiling.settings, "PROFILING_SAMPLE_RATE", 0.5)
+
+    async def job():
+        with profile_job("generate", random_fn=lambda: 0.1) as profile:
+            with span("llm", "fake:model"):
+                await asyncio.sleep(0.01)
+        with profile_job("generate", random_fn=lambda: 0.9) as skipped:
+            assert skipped is None
+        return profile
+
+    profile = asyncio.run(job())
+
+    assert store.list() == [profile]
+    assert (profile.method, profile.path) == ("JOB", "generate")
+    assert [(s.kind, s.name) for s in profile.spans] == [("llm", "fake:model")]
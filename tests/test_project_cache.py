@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from app.services import project_cache as project_cache_module  # noqa: E402
+from app.services.project_cache import (  # noqa: E402
+    INVALIDATION_CHANNEL,
+    ProjectCache,
+    project_etag,
+)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def subscribe(self, channel):
+        self.queue = self.redis.channels.setdefault(channel, asyncio.Queue())
+        self.redis.subscribed.set()
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.channels = {}
+        self.subscribed = asyncio.Event()
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def publish(self, channel, data):
+        if channel in self.channels:
+            await self.channels[channel].put({"type": "message", "data": data})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+def test_etag_changes_with_the_body_even_if_updated_at_does_not():
+    project = {"id": "p1", "name": "one", "updated_at": "2026-01-01T00:00:00"}
+
+    assert project_etag(project) == project_etag(dict(reversed(project.items())))
+    assert project_etag(project) != project_etag({**project, "name": "two"})
+
+
+def test_invalidation_on_one_replica_drops_the_local_copy_on_another(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(project_cache_module, "get_redis", lambda: redis)
+    monkeypatch.setattr(
+        project_cache_module.settings, "PROJECT_CACHE_REDIS_ENABLED", True
+    )
+
+    async def scenario():
+        writer, reader = ProjectCache(), ProjectCache()
+        listener = asyncio.create_task(reader.listen_for_invalidations())
+        await redis.subscribed.wait()
+
+        await writer.set("p1", {"id": "p1", "name": "one"})
+        assert await reader.get("p1") == {"id": "p1", "name": "one"}
+
+        await writer.invalidate("p1")
+        await asyncio.sleep(0)
+        cached = await reader.get("p1")
+
+        listener.cancel()
+        return cached, reader.stats(), list(redis.channels)
+
+    cached, stats, channels = asyncio.run(scenario())
+
+    assert cached is None
+    assert stats["remote_invalidations"] == 1
+    assert channels == [INVALIDATION_CHANNEL]
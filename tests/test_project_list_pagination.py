@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from platform_common.models.project import Project  # noqa: E402
+
+from app.core.pagination import keyset_order  # noqa: E402
+from app.db.dal.project_query_dal import ProjectQueryDAL  # noqa: E402
+
+NAMES = {"p1": "beta", "p2": None, "p3": "alpha", "p4": None, "p5": "beta"}
+
+
+def _projects():
+    projects = [
+        Project(id=project_id, name=name, owner_id="u1", owner_type="user")
+        for project_id, name in NAMES.items()
+    ]
+    # Org projects record their creator as owner_id too.
+    projects.append(
+        Project(
+            id="org-1",
+            name="alpha",
+            owner_id="u1",
+            owner_type="org",
+            organization_id="o1",
+        )
+    )
+    return projects
+
+
+def _walk(descending):
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[Project.__table__]
+                )
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all(_projects())
+            await session.commit()
+
+            dal = ProjectQueryDAL(session)
+            seen, after = [], None
+            while True:
+                page = await dal.list_page(
+                    owner_id="u1",
+                    owner_type="user",
+                    sort_key="name",
+                    descending=descending,
+                    after=after,
+                    limit=2,
+                )
+                if not page:
+                    break
+                seen.extend(project.id for project in page)
+                after = (page[-1].name, page[-1].id)
+        await engine.dispose()
+        return seen
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_pages_cover_null_sort_keys_once_in_memory_order(descending):
+    seen = _walk(descending)
+
+    in_memory = [
+        project.id
+        for project in keyset_order(
+            [p for p in _projects() if p.owner_type == "user"], "name", descending
+        )
+    ]
+    assert seen == in_memory
+    assert seen[-2:] == (["p4", "p2"] if descending else ["p2", "p4"])
+    assert "org-1" not in seen
+
+
+def test_org_scope_pages_only_the_organization_projects():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[Project.__table__]
+                )
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all(_projects())
+            await session.commit()
+            page = await ProjectQueryDAL(session).list_page(
+                organization_id="o1", sort_key="name", limit=10
+            )
+        await engine.dispose()
+        return [project.id for project in page]
+
+    assert asyncio.run(scenario()) == ["org-1"]
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm.circuit_breaker import (  # noqa: E402
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+)
+from services.llm.provider_interface import (  # noqa: E402
+    LLMProviderError,
+    LLMStreamEvent,
+)
+from services.llm.provider_router import ProviderRoute, ProviderRouter  # noqa: E402
+
+
+class FakeProvider:
+    def __init__(self, name, *, first_token_delay=0.0, fail=False):
+        self.name = name
+        self.first_token_delay = first_token_delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def stream_chat(self, *, messages, model, temperature):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.first_token_delay)
+            if self.fail:
+                raise LLMProviderError(
+                    "rate limited", provider=self.name, status_code=429
+                )
+            for word in ("hello", " from ", self.name):
+                yield LLMStreamEvent(delta=word)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+class FakeFactory:
+    def __init__(self, *providers):
+        self.providers = {provider.name: provider for provider in providers}
+
+    def create(self, name):
+        return self.providers[name]
+
+
+def _router(factory, **kwargs):
+    return ProviderRouter(
+        fallback_routes=[ProviderRoute("backup", "backup-model")],
+        provider_factory=factory,
+        **kwargs,
+    )
+
+
+async def _collect(router):
+    events = [
+        event
+        async for event in router.stream(
+            ProviderRoute("primary", "primary-model"), messages=[], temperature=0
+        )
+    ]
+    return events[0].provider, "".join(event.delta for event in events)
+
+
+def test_router_fails_over_when_primary_errors_before_first_token():
+    primary = FakeProvider("primary", fail=True)
+    backup = FakeProvider("backup")
+    router = _router(FakeFactory(primary, backup))
+
+    served_by, text = asyncio.run(_collect(router))
+
+    assert (served_by, text) == ("backup", "hello from backup")
+    assert router.stats()["failovers"] == 1
+
+
+def test_router_hedges_slow_primary_and_cancels_the_loser():
+    primary = FakeProvider("primary", first_token_delay=1.0)
+    backup = FakeProvider("backup")
+    router = _router(FakeFactory(primary, backup), first_token_timeout_seconds=0.05)
+
+    served_by, text = asyncio.run(_collect(router))
+
+    assert (served_by, text) == ("backup", "hello from backup")
+    assert router.hedges == 1
+    assert primary.cancelled == 1
+
+
+def test_router_skips_provider_with_open_circuit():
+    primary = FakeProvider("primary", fail=True)
+    backup = FakeProvider("backup")
+    router = _router(
+        FakeFactory(primary, backup),
+        breaker_config=CircuitBreakerConfig(min_requests=2, cooldown_seconds=60),
+    )
+
+    for _ in range(3):
+        asyncio.run(_collect(router))
+
+    assert primary.calls == 2
+    assert router.stats()["breakers"]["primary"]["state"] == OPEN
+
+
+def test_breaker_probes_after_cooldown_and_closes_on_success():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "p",
+        CircuitBreakerConfig(min_requests=2, cooldown_seconds=10),
+        clock=lambda: now[0],
+    )
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] = 11
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_success()
+    assert breaker.state == CLOSED
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm.provider_interface import LLMProviderError  # noqa: E402
+from services.llm.rate_limiter import (  # noqa: E402
+    LLM_RATE_LIMIT_REJECTIONS,
+    LLMRateLimiter,
+    RateLimit,
+    RateLimitExceeded,
+    parse_rate_limits,
+    retry_after_seconds,
+)
+from tests.support import FakeClock  # noqa: E402
+
+
+def test_parse_rate_limits_accepts_provider_and_model_keys():
+    limits = parse_rate_limits("openai=500/200000, anthropic:claude-x=/40000")
+    assert limits["openai"] == RateLimit(500, 200000)
+    assert limits["anthropic:claude-x"] == RateLimit(None, 40000)
+
+
+def test_requests_bucket_queues_then_rejects_past_max_wait():
+    clock = FakeClock()
+    limiter = LLMRateLimiter(
+        {"openai": RateLimit(requests_per_minute=60)},
+        max_wait_seconds=2.0,
+        clock=clock,
+    )
+    rejections = LLM_RATE_LIMIT_REJECTIONS.value("openai")
+
+    async def scenario():
+        waits = [await limiter.reserve("openai", 0, 2.0) for _ in range(62)]
+        assert waits[:60] == [0.0] * 60
+        assert waits[60] == pytest.approx(1.0)
+        assert waits[61] == pytest.approx(2.0)
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire("openai", "gpt-4o")
+        clock.now += 60
+        assert await limiter.try_acquire("openai", "gpt-4o")
+
+    asyncio.run(scenario())
+    assert limiter.stats()["openai"]["rejected"] == 1
+    assert LLM_RATE_LIMIT_REJECTIONS.value("openai") == rejections + 1
+
+
+def test_tokens_bucket_and_model_specific_limit():
+    clock = FakeClock()
+    limiter = LLMRateLimiter(
+        {
+            "openai": RateLimit(requests_per_minute=1000),
+            "openai:gpt-4o": RateLimit(tokens_per_minute=6000),
+        },
+        clock=clock,
+    )
+
+    async def scenario():
+        assert await limiter.try_acquire("openai", "gpt-4o", tokens=5000)
+        assert not await limiter.try_acquire("openai", "gpt-4o", tokens=5000)
+        assert await limiter.try_acquire("openai", "gpt-4o-mini", tokens=5000)
+
+    asyncio.run(scenario())
+
+
+def test_retry_after_blocks_unlimited_provider():
+    clock = FakeClock()
+    limiter = LLMRateLimiter(max_wait_seconds=1.0, clock=clock)
+    error = LLMProviderError("busy", provider="anthropic", retry_after=5)
+
+    async def scenario():
+        await limiter.penalize("anthropic", "m", retry_after_seconds(error))
+        assert not await limiter.try_acquire("anthropic", "m")
+        clock.now += 5
+        assert await limiter.try_acquire("anthropic", "m")
+
+    asyncio.run(scenario())
+    assert limiter.stats()["anthropic"]["penalties"] == 1
@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm.llm_service import LLMRequest, LLMService  # noqa: E402
+from services.llm.provider_interface import LLMStreamEvent  # noqa: E402
+from services.llm.response_cache import (  # noqa: E402
+    CachedResponse,
+    LLMResponseCache,
+    response_cache_key,
+)
+
+
+class FakeRouter:
+    def __init__(self):
+        self.calls = 0
+
+    async def stream(self, primary, *, messages, temperature, estimated_tokens=0):
+        self.calls += 1
+        yield LLMStreamEvent(provider="openai", model="gpt-4o")
+        yield LLMStreamEvent(delta="Welcome ")
+        yield LLMStreamEvent(delta="aboard!")
+        yield LLMStreamEvent(usage={"total_tokens": 12})
+
+
+def _request(content):
+    messages = [{"role": "user", "content": content}]
+    return LLMRequest(
+        provider="openai",
+        model="gpt-4o",
+        temperature=0.2,
+        context=SimpleNamespace(messages=messages, token_count=5),
+        cache_key=response_cache_key("p1", "gpt-4o", 0.2, messages),
+    )
+
+
+def test_cache_key_ignores_whitespace_but_not_project_model_or_temperature():
+    messages = [{"role": "user", "content": "How do I  start?\n"}]
+    same = [{"role": "user", "content": "How do I start? "}]
+    key = response_cache_key("p1", "gpt-4o", 0.2, messages)
+    assert key == response_cache_key("p1", "gpt-4o", 0.2, same)
+    assert key != response_cache_key("p2", "gpt-4o", 0.2, messages)
+    assert key != response_cache_key("p1", "gpt-4o-mini", 0.2, messages)
+    assert key != response_cache_key("p1", "gpt-4o", 0.7, messages)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = LLMResponseCache(max_entries=2)
+    response = CachedResponse(text="hi", provider="openai", model="gpt-4o")
+
+    async def scenario():
+        await cache.put("a", response)
+        await cache.put("b", response)
+        await cache.get("a")
+        await cache.put("c", response)
+        return await cache.get("b"), await cache.get("a")
+
+    evicted, kept = asyncio.run(scenario())
+    assert evicted is None and kept == response
+
+
+def test_second_identical_prompt_replays_cached_reply():
+    router = FakeRouter()
+    cache = LLMResponseCache()
+    service = LLMService(
+        provider_factory=object(),
+        router=router,
+        response_cache=cache,
+        replay_chunk_chars=4,
+    )
+
+    async def collect(request):
+        return [event async for event in service.stream_chat(request)]
+
+    async def scenario():
+        await collect(_request("How do I start?"))
+        request = _request("How do I start?")
+        request.cached_response = await cache.get(request.cache_key)
+        return await collect(request)
+
+    events = asyncio.run(scenario())
+
+    assert router.calls == 1
+    assert (events[0].provider, events[0].model) == ("openai", "gpt-4o")
+    assert "".join(event.delta for event in events) == "Welcome aboard!"
+    assert events[-1].usage["cache_hit"] is True
+    assert cache.stats()["stores"] == 1
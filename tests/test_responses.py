@@ -0,0 +1,34 @@
+import datetime
+import json
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from app.core import responses  # noqa: E402
+from app.core.responses import service_response  # noqa: E402
+
+CREATED_AT = datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_service_response_encodes_envelope_and_data(monkeypatch, use_orjson):
+    if use_orjson and responses.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+
+    response = service_response(
+        message="Project created successfully",
+        status_code=201,
+        data={"id": "p-1", "updated_at": CREATED_AT},
+        headers={"ETag": '"abc"'},
+    )
+
+    body = json.loads(response.body)
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"abc"'
+    assert body["message"] == "Project created successfully"
+    assert body["status_code"] == 201
+    assert body["data"]["id"] == "p-1"
+    assert body["data"]["updated_at"].startswith("2025-01-02T03:04:05")
@@ -0,0 +1,59 @@
+import asyncio
+
+from app.pubsub.stream_checkpointer import StreamCheckpointer
+
+
+def test_checkpointer_writes_full_text_on_byte_threshold():
+    written = []
+
+    async def write(text, persisted):
+        written.append(text)
+        return True
+
+    async def scenario():
+        checkpointer = StreamCheckpointer(write, min_bytes=4, interval_seconds=60)
+        for delta in ["ab", "cd", "ef"]:
+            await checkpointer.add(delta)
+        return checkpointer
+
+    checkpointer = asyncio.run(scenario())
+    assert written == ["abcd"]
+    assert checkpointer.text == "abcdef"
+
+
+def test_checkpointer_writes_after_interval_and_skips_empty_checkpoint():
+    written = []
+    now = [0.0]
+
+    async def write(text, persisted):
+        written.append(text)
+        return True
+
+    async def scenario():
+        checkpointer = StreamCheckpointer(
+            write, min_bytes=1024, interval_seconds=5, clock=lambda: now[0]
+        )
+        await checkpointer.add("hello ")
+        now[0] = 6
+        await checkpointer.add("world")
+        await checkpointer.checkpoint()
+
+    asyncio.run(scenario())
+    assert written == ["hello world"]
+
+
+def test_checkpointer_sends_only_the_unsaved_tail_and_retries_failures():
+    tails = []
+    results = iter([True, False, True])
+
+    async def write(text, persisted):
+        tails.append(text[persisted:])
+        return next(results)
+
+    async def scenario():
+        checkpointer = StreamCheckpointer(write, min_bytes=2, interval_seconds=60)
+        for delta in ["ab", "cd", "ef"]:
+            await checkpointer.add(delta)
+
+    asyncio.run(scenario())
+    assert tails == ["ab", "cd", "cdef"]
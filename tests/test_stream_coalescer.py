@@ -0,0 +1,59 @@
+import asyncio
+
+from app.pubsub.stream_coalescer import StreamDeltaCoalescer
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_coalescer_flushes_on_byte_threshold_with_sequence_numbers():
+    published = []
+
+    async def publish(text, seq):
+        published.append((seq, text))
+
+    async def scenario():
+        coalescer = StreamDeltaCoalescer(publish, max_bytes=4, window_seconds=60)
+        for delta in ["ab", "cd", "ef", "g"]:
+            await coalescer.add(delta)
+        await coalescer.close()
+        return coalescer
+
+    coalescer = _run(scenario())
+    assert published == [(0, "abcd"), (1, "efg")]
+    assert coalescer.next_seq == 2
+
+
+def test_coalescer_flushes_after_time_window():
+    published = []
+
+    async def publish(text, seq):
+        published.append((seq, text))
+
+    async def scenario():
+        coalescer = StreamDeltaCoalescer(publish, max_bytes=1024, window_seconds=0.01)
+        await coalescer.add("hello ")
+        await coalescer.add("world")
+        await asyncio.sleep(0.05)
+        assert published == [(0, "hello world")]
+        await coalescer.close()
+
+    _run(scenario())
+    assert published == [(0, "hello world")]
+
+
+def test_coalescer_without_batching_publishes_every_delta():
+    published = []
+
+    async def publish(text, seq):
+        published.append(text)
+
+    async def scenario():
+        coalescer = StreamDeltaCoalescer(publish, max_bytes=1, window_seconds=0)
+        for delta in ["a", "b", "c"]:
+            await coalescer.add(delta)
+        await coalescer.close()
+
+    _run(scenario())
+    assert published == ["a", "b", "c"]
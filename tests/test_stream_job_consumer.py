@@ -0,0 +1,256 @@
+import asyncio
+import itertools
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from platform_common.pubsub.event import PubSubEvent  # noqa: E402
+
+from app.pubsub.stream_job_consumer import RedisStreamJobConsumer, add_job  # noqa: E402
+
+
+class FakeStreamRedis:
+    """
+    In-memory stand-in for the Redis Stream commands the consumer uses.
+    """
+
+    def __init__(self):
+        self.now_ms = 0
+        self._ids = itertools.count(1)
+        self.entries = []
+        self.groups = {}
+
+    async def xgroup_create(self, stream, group, id="0", mkstream=False):
+        if group in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.groups[group] = {"last": 0, "pending": {}}
+
+    async def xadd(self, stream, fields, **kwargs):
+        entry_id = f"{next(self._ids)}-0"
+        self.entries.append((entry_id, dict(fields)))
+        return entry_id
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        state = self.groups[group]
+        fresh = self.entries[state["last"] :][:count]
+        state["last"] += len(fresh)
+        for entry_id, _ in fresh:
+            state["pending"][entry_id] = (consumer, self.now_ms, 1)
+        stream = next(iter(streams))
+        return [[stream, fresh]] if fresh else []
+
+    async def xack(self, stream, group, *entry_ids):
+        for entry_id in entry_ids:
+            self.groups[group]["pending"].pop(entry_id, None)
+        return len(entry_ids)
+
+    async def xclaim(self, stream, group, consumer, min_idle_time, ids, justid=False):
+        pending = self.groups[group]["pending"]
+        for entry_id in ids:
+            pending[entry_id] = (consumer, self.now_ms, pending[entry_id][2])
+        return ids
+
+    async def xautoclaim(
+        self, stream, group, consumer, min_idle_time, start_id="0-0", count=None
+    ):
+        pending = self.groups[group]["pending"]
+        claimed = []
+        for entry_id, fields in self.entries:
+            owner = pending.get(entry_id)
+            if owner and self.now_ms - owner[1] >= min_idle_time:
+                pending[entry_id] = (consumer, self.now_ms, owner[2] + 1)
+                claimed.append((entry_id, fields))
+        return ["0-0", claimed, []]
+
+    async def xpending_range(self, stream, group, min, max, count):
+        pending = self.groups[group]["pending"]
+        return [
+            {"message_id": entry_id, "times_delivered": pending[entry_id][2]}
+            for entry_id in sorted(pending)
+            if min <= entry_id <= max
+        ][:count]
+
+
+def _consumer(redis, name, handled):
+    async def submit(job):
+        handled.append((name, job.event.payload["conversation_id"]))
+        await job.ack()
+
+    return RedisStreamJobConsumer(
+        redis,
+        stream="jobs",
+        group="workers",
+        consumer=name,
+        submit=submit,
+        claim_idle_ms=1000,
+    )
+
+
+def _event(conversation_id):
+    return PubSubEvent(
+        event_type="GENERATE_ASSISTANT_RESPONSE",
+        payload={"conversation_id": conversation_id},
+    )
+
+
+def test_consumers_in_a_group_share_jobs_without_duplicates():
+    redis = FakeStreamRedis()
+    handled = []
+
+    async def scenario():
+        first = _consumer(redis, "a", handled)
+        second = _consumer(redis, "b", handled)
+        await first.ensure_group()
+        await second.ensure_group()
+        for index in range(6):
+            await add_job(redis, "jobs", _event(f"c{index}"))
+        while await first.read_once() + await second.read_once():
+            pass
+
+    asyncio.run(scenario())
+    assert sorted(c for _, c in handled) == [f"c{i}" for i in range(6)]
+    assert redis.groups["workers"]["pending"] == {}
+
+
+def test_unacked_jobs_from_a_crashed_consumer_are_reclaimed():
+    redis = FakeStreamRedis()
+    handled = []
+
+    async def crashed_submit(job):
+        pass  # never acks, as if the worker died mid-job
+
+    async def scenario():
+        crashed = RedisStreamJobConsumer(
+            redis,
+            stream="jobs",
+            group="workers",
+            consumer="dead",
+            submit=crashed_submit,
+        )
+        survivor = _consumer(redis, "alive", handled)
+        await crashed.ensure_group()
+        await add_job(redis, "jobs", _event("c1"))
+        await crashed.read_once()
+
+        assert await survivor.reclaim_stale() == 0
+        redis.now_ms += 5000
+        assert await survivor.reclaim_stale() == 1
+
+    asyncio.run(scenario())
+    assert handled == [("alive", "c1")]
+    assert redis.groups["workers"]["pending"] == {}
+
+
+def test_released_reclaimed_jobs_can_be_reclaimed_again():
+    redis = FakeStreamRedis()
+    reclaims = []
+
+    async def crashed_submit(job):
+        pass
+
+    async def busy_submit(job):
+        reclaims.append(job.reclaimed)
+        await job.release()
+
+    async def scenario():
+        crashed = RedisStreamJobConsumer(
+            redis,
+            stream="jobs",
+            group="workers",
+            consumer="dead",
+            submit=crashed_submit,
+        )
+        survivor = RedisStreamJobConsumer(
+            redis,
+            stream="jobs",
+            group="workers",
+            consumer="alive",
+            submit=busy_submit,
+            claim_idle_ms=1000,
+        )
+        await crashed.ensure_group()
+        await add_job(redis, "jobs", _event("c1"))
+        await crashed.read_once()
+
+        redis.now_ms += 5000
+        assert await survivor.reclaim_stale() == 1
+        redis.now_ms += 5000
+        assert await survivor.reclaim_stale() == 1
+        return survivor.stats()
+
+    stats = asyncio.run(scenario())
+    assert reclaims == [True, True]
+    assert stats["acked"] == 0 and stats["in_flight"] == 0
+    assert list(redis.groups["workers"]["pending"]) != []
+
+
+def test_jobs_failing_past_max_deliveries_are_dead_lettered():
+    redis = FakeStreamRedis()
+    attempts = []
+
+    async def failing_submit(job):
+        attempts.append(job.entry_id)
+        await job.release()
+
+    async def scenario():
+        consumer = RedisStreamJobConsumer(
+            redis,
+            stream="jobs",
+            group="workers",
+            consumer="a",
+            submit=failing_submit,
+            claim_idle_ms=1000,
+            max_deliveries=3,
+        )
+        await consumer.ensure_group()
+        entry_id = await add_job(redis, "jobs", _event("c1"))
+        await consumer.read_once()
+        for _ in range(3):
+            redis.now_ms += 5000
+            await consumer.reclaim_stale()
+        return entry_id, consumer.stats()
+
+    entry_id, stats = asyncio.run(scenario())
+    assert attempts == [entry_id] * 3
+    assert stats["dead_lettered"] == 1
+    assert redis.groups["workers"]["pending"] == {}
+    assert redis.entries[-1][1]["source_id"] == entry_id
+
+
+def test_heartbeat_keeps_running_while_dispatch_is_blocked():
+    redis = FakeStreamRedis()
+    heartbeats = []
+    original_xclaim = redis.xclaim
+
+    async def xclaim(stream, group, consumer, min_idle_time, ids, justid=False):
+        heartbeats.append(list(ids))
+        return await original_xclaim(stream, group, consumer, min_idle_time, ids)
+
+    redis.xclaim = xclaim
+
+    async def scenario():
+        pool_has_room = asyncio.Event()
+
+        async def full_pool_submit(job):
+            await pool_has_room.wait()
+
+        consumer = RedisStreamJobConsumer(
+            redis,
+            stream="jobs",
+            group="workers",
+            consumer="a",
+            submit=full_pool_submit,
+            claim_idle_ms=30,
+        )
+        await consumer.ensure_group()
+        entry_id = await add_job(redis, "jobs", _event("c1"))
+        runner = asyncio.create_task(consumer.run())
+        await asyncio.sleep(0.1)
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+        return entry_id
+
+    entry_id = asyncio.run(scenario())
+    assert len(heartbeats) >= 2
+    assert all(ids == [entry_id] for ids in heartbeats)
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("platform_common")
+
+from services.llm import token_budget  # noqa: E402
+from services.llm.token_budget import (  # noqa: E402
+    ContextBudget,
+    HistoryMessage,
+    TokenCounter,
+    fit_messages,
+)
+
+
+def _history(*sizes):
+    return [
+        HistoryMessage(id=f"m{i}", role="user", content="x" * size)
+        for i, size in enumerate(sizes)
+    ]
+
+
+def test_fit_messages_fills_newest_first_within_budget():
+    counter = TokenCounter()
+    fitted = fit_messages(
+        system_prompt="system",
+        history=_history(400, 400, 400),
+        model="unknown-model",
+        budget=ContextBudget(max_context_tokens=300, response_reserve_tokens=50),
+        counter=counter,
+    )
+
+    assert [m["role"] for m in fitted.messages] == ["system", "user", "user"]
+    assert fitted.messages[-1]["content"] == "x" * 400
+    assert fitted.token_count <= 250
+    assert fitted.dropped_messages == 1
+    assert fitted.truncated_messages == 0
+
+
+def test_fit_messages_always_keeps_a_truncated_newest_message():
+    fitted = fit_messages(
+        system_prompt="system",
+        history=_history(100, 40_000),
+        model="unknown-model",
+        budget=ContextBudget(max_context_tokens=1_000, response_reserve_tokens=200),
+        counter=TokenCounter(),
+    )
+
+    assert len(fitted.messages) == 2
+    assert "[truncated" in fitted.messages[-1]["content"]
+    assert fitted.dropped_messages == 1
+    assert fitted.token_count <= 800
+
+
+def test_load_resolves_encodings_off_the_event_loop_thread(monkeypatch):
+    threads = []
+
+    def encoding_for_model(model):
+        threads.append(threading.get_ident())
+        return SimpleNamespace(encode=lambda text, **kwargs: text.split())
+
+    monkeypatch.setattr(
+        token_budget,
+        "tiktoken",
+        SimpleNamespace(encoding_for_model=encoding_for_model),
+    )
+    counter = TokenCounter()
+
+    async def scenario():
+        await counter.load("gpt-4o")
+        await counter.load("gpt-4o")
+        return counter.count("three short words", "gpt-4o")
+
+    assert asyncio.run(scenario()) == 3
+    assert len(threads) == 1 and threads[0] != threading.get_ident()